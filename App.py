@@ -1,7 +1,11 @@
 import pygame
 
+from ClueLess.Constants import SAVE_DIRECTORY
 from ClueLess.CSA import Network
-from ClueLess.MVC import Controller, Model, View
+from ClueLess.MVC import Controller, FrameScheduler, Model, View
+from ClueLess.MVC.Assets import ASSETS
+from ClueLess.MVC.Profiler import PROFILER
+from ClueLess.Storage import GameStore
 
 
 class App:
@@ -24,20 +28,20 @@ class App:
             The manager of networking as a client or server
         running (boolean):
             A flag to represent whether or not the App is running
-        clock (pygame.time.Clock):
-            The clock to manage frame rate
+        scheduler (ClueLess.MVC.FrameScheduler):
+            The scheduler to manage frame rate, which sleeps while idle
     """
 
     def __init__(self):
         """Initializes a new Clue-Less app"""
-        self.model = Model()
+        self.model = Model(GameStore(SAVE_DIRECTORY))
         self.view = View(self.model)
         self.network = Network()
         self.controller = Controller(self.model, self.view, self.network)
         self.running = False
 
         pygame.init()
-        self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler()
 
     def start(self):
         """Starts the Clue-Less app"""
@@ -63,6 +67,7 @@ class App:
 
         self.network.stop()
 
+        ASSETS.clear()
         pygame.quit()
 
     def run(self):
@@ -71,16 +76,18 @@ class App:
         while self.running:
             # Main App Loop
             try:
-                self.running = self.controller.handleInput()
+                # Maintain framerate, waiting for events while idle
+                events = self.scheduler.getEvents(self.view.isAnimating())
+
+                PROFILER.beginFrame()
+                self.running = self.controller.handleInput(events)
                 # self.model.updateTimer()
                 self.view.updateView()
+                PROFILER.endFrame()
             except Exception as e:
                 log = e
                 self.running = False
 
-            # Maintain framerate
-            self.clock.tick(60)
-
         self.stop(log)
 
 
@@ -0,0 +1,155 @@
+"""Board for the Clue-Less Application"""
+
+from collections import deque
+from functools import lru_cache
+
+from ClueLess.Cards import Cards
+from ClueLess.Constants import BOARD_SIZE, LOCATION_NAMES
+from ClueLess.Game import Game
+from ClueLess.Player import Player
+
+LOCATION_COUNT = BOARD_SIZE * BOARD_SIZE
+
+# Distance to a location that can't be reached
+UNREACHABLE = LOCATION_COUNT
+
+
+def getBoard():
+    """
+    Gets the board as lookup tables of location indices
+
+    Returns the room card index at each location (or None for hallways and
+    empty spaces) and the (move, destination) pairs leading out of each
+    location, including the secret passages between the corner rooms
+    """
+    roomCards = [None] * LOCATION_COUNT
+    for room, location in Player.ROOM_LOCATIONS.items():
+        roomCards[location] = Cards.INDEX[room]
+
+    neighbors = [[] for _ in range(LOCATION_COUNT)]
+    offsets = {"UP": (-1, 0), "DOWN": (1, 0), "RIGHT": (0, 1), "LEFT": (0, -1)}
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            if LOCATION_NAMES[row][col] is None:
+                continue
+            location = row * BOARD_SIZE + col
+            for move, (rowOffset, colOffset) in offsets.items():
+                (toRow, toCol) = (row + rowOffset, col + colOffset)
+                if (
+                    0 <= toRow < BOARD_SIZE
+                    and 0 <= toCol < BOARD_SIZE
+                    and LOCATION_NAMES[toRow][toCol] is not None
+                ):
+                    neighbors[location].append((move, toRow * BOARD_SIZE + toCol))
+            for move, (fromRoom, toRoom) in Game.SHORTCUTS.items():
+                if LOCATION_NAMES[row][col] == fromRoom:
+                    neighbors[location].append((move, Player.ROOM_LOCATIONS[toRoom]))
+
+    return (roomCards, neighbors)
+
+
+ROOM_CARDS, NEIGHBORS = getBoard()
+
+
+def getBlocked(locations, mover=None):
+    """
+    Gets the hallways that can't be entered
+
+    Parameters:
+        locations (iterable):
+            The location indices of every player on the board
+        mover (integer):
+            The location index of the player who is moving, which doesn't block
+            itself
+
+    Returns a bitmask of the blocked location indices
+    """
+    blocked = 0
+    for location in locations:
+        if ROOM_CARDS[location] is None and location != mover:
+            blocked |= 1 << location
+    return blocked
+
+
+@lru_cache(maxsize=64)
+def getRoutes(blocked=0):
+    """
+    Gets the shortest routes between every pair of locations
+
+    Each move takes a turn, so distances are numbers of turns. Blocked
+    hallways are never entered, but routes can still start from one.
+
+    Parameters:
+        blocked (integer):
+            The bitmask of blocked location indices (see getBlocked)
+
+    Returns tables indexed by [from][to] of the distance (UNREACHABLE if there
+    is no route) and of the first move of a shortest route (None if there is no
+    route or nowhere to go)
+    """
+    distances = []
+    nextMoves = []
+    for start in range(LOCATION_COUNT):
+        distance = [UNREACHABLE] * LOCATION_COUNT
+        nextMove = [None] * LOCATION_COUNT
+        if LOCATION_NAMES[start // BOARD_SIZE][start % BOARD_SIZE] is not None:
+            distance[start] = 0
+            queue = deque([start])
+            while queue:
+                current = queue.popleft()
+                for move, destination in NEIGHBORS[current]:
+                    if blocked & (1 << destination):
+                        continue
+                    if distance[destination] != UNREACHABLE:
+                        continue
+                    distance[destination] = distance[current] + 1
+                    # The first step of the route is kept along the way
+                    nextMove[destination] = nextMove[current] or move
+                    queue.append(destination)
+        distances.append(tuple(distance))
+        nextMoves.append(tuple(nextMove))
+    return (tuple(distances), tuple(nextMoves))
+
+
+# Routes on an empty board
+DISTANCES, NEXT_MOVES = getRoutes()
+
+
+def getDistance(location, targets, blocked=0):
+    """
+    Gets the number of turns from a location to the nearest target
+
+    Parameters:
+        location (integer):
+            The location index to start from
+        targets (iterable):
+            The location indices of the targets
+        blocked (integer):
+            The bitmask of blocked location indices (see getBlocked)
+    """
+    distances = DISTANCES if not blocked else getRoutes(blocked)[0]
+    return min((distances[location][target] for target in targets), default=UNREACHABLE)
+
+
+def getNextMove(location, targets, blocked=0):
+    """
+    Gets the first move of a shortest route to the nearest target
+
+    Parameters:
+        location (integer):
+            The location index to start from
+        targets (iterable):
+            The location indices of the targets
+        blocked (integer):
+            The bitmask of blocked location indices (see getBlocked)
+
+    Returns the move, or None if no target can be reached or the location is
+    a target
+    """
+    (distances, nextMoves) = (
+        (DISTANCES, NEXT_MOVES) if not blocked else getRoutes(blocked)
+    )
+    target = min(targets, key=lambda target: distances[location][target], default=None)
+    if target is None or distances[location][target] == UNREACHABLE:
+        return None
+    return nextMoves[location][target]
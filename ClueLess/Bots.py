@@ -0,0 +1,532 @@
+"""Bots for the Clue-Less Application"""
+
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from ClueLess.Board import NEIGHBORS, getBlocked, getDistance
+from ClueLess.Cards import Cards
+from ClueLess.CSA.Client import Client
+from ClueLess.Deduction import SOLUTION, Contradiction, KnowledgeBase
+from ClueLess.Game import Game, Turn
+from ClueLess.Player import Player
+
+
+class Strategy:
+    """
+    The Strategy of a Clue-Less Bot
+
+    The Strategy class chooses a bot's turn. It moves at random and makes random
+    suggestions, and accuses once the bot's knowledge leaves a single
+    candidate. Subclasses override the choose methods.
+
+    Attributes:
+        rng (random.Random):
+            The strategy's random number generator
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initializes a new strategy
+
+        Parameters:
+            seed (integer):
+                The seed for the strategy's random number generator
+        """
+        self.rng = random.Random(seed)
+
+    def chooseTurn(self, game, knowledge=None, deadline=None):
+        """
+        Chooses the current player's turn
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to choose a turn in
+            knowledge (ClueLess.KnowledgeBase):
+                What the player has deduced, if anything
+            deadline (float):
+                The time.monotonic() time the turn must be chosen by, if any
+
+        Returns the turn without a player ID
+        """
+        player = game.getCurrentPlayer()
+        if player.lost:
+            # Players who lost only pass, staying in to refute suggestions
+            return Turn()
+
+        move = self.chooseMove(game, knowledge, deadline)
+        turn = Turn(move=move)
+
+        accusation = self.chooseAccusation(game, knowledge, deadline)
+        if accusation is not None:
+            turn.accusation = accusation
+            return turn
+
+        # Ending in a room means a suggestion has to be made
+        (row, col) = game.getDestination(player.getLocation(), move)
+        room = Player.ROOM_NAMES[row][col]
+        if room is not None:
+            turn.suggestion = self.chooseSuggestion(game, knowledge, room, deadline)
+
+        return turn
+
+    def close(self):
+        """Frees anything the strategy holds, such as worker processes"""
+        pass
+
+    def chooseMove(self, game, knowledge, deadline):
+        """
+        Chooses the current player's move
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to choose a move in
+            knowledge (ClueLess.KnowledgeBase):
+                What the player has deduced, if anything
+            deadline (float):
+                The time the move must be chosen by, if any
+        """
+        return self.rng.choice(sorted(game.getAvailableMoves()))
+
+    def chooseSuggestion(self, game, knowledge, room, deadline):
+        """
+        Chooses the current player's suggestion
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to choose a suggestion in
+            knowledge (ClueLess.KnowledgeBase):
+                What the player has deduced, if anything
+            room (string):
+                The room the suggestion is made in
+            deadline (float):
+                The time the suggestion must be chosen by, if any
+        """
+        return (
+            self.rng.choice(Cards.CHARACTERS),
+            self.rng.choice(Cards.WEAPONS),
+            room,
+        )
+
+    def chooseAccusation(self, game, knowledge, deadline):
+        """
+        Chooses the current player's accusation
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to choose an accusation in
+            knowledge (ClueLess.KnowledgeBase):
+                What the player has deduced, if anything
+            deadline (float):
+                The time the accusation must be chosen by, if any
+
+        Returns the accusation, or None to not accuse
+        """
+        if knowledge is None:
+            return None
+        return knowledge.getSolution()
+
+
+class RandomStrategy(Strategy):
+    """A Strategy that moves and suggests at random"""
+
+
+class GreedyStrategy(Strategy):
+    """
+    A Strategy that heads for the nearest room
+
+    The GreedyStrategy class moves towards the nearest room, other than the
+    one the player is in, that might still be part of the solution.
+    """
+
+    def chooseMove(self, game, knowledge, deadline):
+        player = game.getCurrentPlayer()
+        room = player.getRoom()
+        targets = {
+            location
+            for name, location in Player.ROOM_LOCATIONS.items()
+            if name != room
+            and (
+                knowledge is None or knowledge.getStatus(SOLUTION, name) is not False
+            )
+        }
+        if not targets:
+            return super().chooseMove(game, knowledge, deadline)
+
+        # Take the first step of a shortest route to a target
+        location = player.locationIndex
+        destinations = dict(NEIGHBORS[location])
+        blocked = getBlocked((other.locationIndex for other in game.players), location)
+        moves = sorted(game.getAvailableMoves())
+        self.rng.shuffle(moves)
+        return min(
+            moves,
+            key=lambda move: getDistance(
+                destinations.get(move, location), targets, blocked
+            ),
+        )
+
+
+class DeductionStrategy(GreedyStrategy):
+    """
+    A Strategy that suggests the most likely solution cards
+
+    The DeductionStrategy class moves like the GreedyStrategy and suggests the
+    suspect and weapon that appear in the most remaining candidates, so a
+    refutation rules out as many candidates as possible.
+    """
+
+    def chooseSuggestion(self, game, knowledge, room, deadline):
+        if knowledge is None:
+            return super().chooseSuggestion(game, knowledge, room, deadline)
+
+        candidates = knowledge.getCandidates()
+        inRoom = [candidate for candidate in candidates if candidate[2] == room]
+        candidates = inRoom or candidates
+        if not candidates:
+            return super().chooseSuggestion(game, knowledge, room, deadline)
+
+        suspects = Counter(candidate[0] for candidate in candidates)
+        weapons = Counter(candidate[1] for candidate in candidates)
+        return (
+            self.pickMostCommon(suspects),
+            self.pickMostCommon(weapons),
+            room,
+        )
+
+    def pickMostCommon(self, counts):
+        """
+        Picks one of the most common cards, breaking ties at random
+
+        Parameters:
+            counts (collections.Counter):
+                The number of candidates each card appears in
+        """
+        most = max(counts.values())
+        return self.rng.choice(sorted(card for card in counts if counts[card] == most))
+
+
+class Bot:
+    """
+    A Clue-Less Bot
+
+    The Bot class plays a seat in a Clue-Less game. It is given every game
+    update and, when it is its player's turn, chooses a turn with its strategy
+    on its own worker thread so whoever delivers the updates is never blocked.
+    If the strategy takes longer than the time budget, a random turn is sent
+    instead. Turns are passed to the send callback, which lets the same bot
+    play over the network (see BotClient) or in the same process.
+
+    Attributes:
+        strategy (ClueLess.Strategy):
+            The strategy that chooses the bot's turns
+        timeBudget (float):
+            The number of seconds the strategy has to choose a turn
+        send (function):
+            Called with each chosen turn
+        playerId (integer):
+            The ID of the bot's player
+        knowledge (ClueLess.KnowledgeBase):
+            What the bot has deduced about the cards
+        fallback (ClueLess.Strategy):
+            The strategy used when the time budget runs out
+        executor (concurrent.futures.ThreadPoolExecutor):
+            The worker thread that updates the knowledge and chooses turns
+        lock (threading.Lock):
+            Guards sending a turn
+        latestTurnNumber (integer):
+            The turn number of the latest game update
+        sentTurnNumber (integer):
+            The turn number a turn was last sent for
+        stopped (boolean):
+            Whether the bot has stopped playing
+    """
+
+    def __init__(self, strategy=None, timeBudget=1.0, send=None, playerId=None):
+        """
+        Initializes a new bot
+
+        Parameters:
+            strategy (ClueLess.Strategy):
+                The strategy that chooses the bot's turns
+            timeBudget (float):
+                The number of seconds the strategy has to choose a turn
+            send (function):
+                Called with each chosen turn
+            playerId (integer):
+                The ID of the bot's player, if already known
+        """
+        self.strategy = strategy if strategy is not None else DeductionStrategy()
+        self.timeBudget = timeBudget
+        self.send = send
+        self.playerId = playerId
+        self.knowledge = None
+        self.fallback = RandomStrategy()
+
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.lock = threading.Lock()
+        self.latestTurnNumber = None
+        self.sentTurnNumber = None
+        self.stopped = False
+
+    def isMyTurn(self, game):
+        """
+        Gets whether it's the bot's turn in a game
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to check
+        """
+        return (
+            game.running
+            and not game.finished
+            and game.getCurrentPlayer().getPlayerId() == self.playerId
+        )
+
+    def observe(self, game):
+        """
+        Adds a game update to the bot's knowledge
+
+        Parameters:
+            game (ClueLess.Game):
+                The updated game
+        """
+        if self.knowledge is not None:
+            try:
+                self.knowledge.update(game)
+                return
+            except Contradiction:
+                # The seats changed or an update was missed, so start again
+                print("Bot knowledge contradicts the game, deducing it again")
+                self.knowledge = None
+
+        if (
+            game.getSolution() is not None
+            and game.findPlayerFromId(self.playerId) is not None
+        ):
+            # The cards have been dealt
+            self.knowledge = KnowledgeBase.fromGame(game, self.playerId)
+
+    def chooseTurn(self, game, deadline=None):
+        """
+        Chooses the bot's turn right away
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to choose a turn in
+            deadline (float):
+                The time.monotonic() time the turn must be chosen by, if any
+        """
+        self.observe(game)
+        turn = self.strategy.chooseTurn(game, self.knowledge, deadline)
+        turn.playerId = self.playerId
+        return turn
+
+    def receiveGame(self, game):
+        """
+        Handles a game update without blocking
+
+        Parameters:
+            game (ClueLess.Game):
+                The updated game
+        """
+        if self.stopped:
+            return
+
+        with self.lock:
+            self.latestTurnNumber = game.turnNumber
+            if not game.running:
+                # Turns sent while the game is stopped are dropped by the server
+                self.sentTurnNumber = None
+
+        if not self.isMyTurn(game):
+            self.schedule(self.observe, game)
+            return
+
+        with self.lock:
+            if self.sentTurnNumber == game.turnNumber:
+                # Already chose a turn for this update
+                return
+
+        deadline = time.monotonic() + self.timeBudget
+        future = self.schedule(self.chooseTurn, game, deadline)
+        if future is None:
+            return
+        future.add_done_callback(lambda future: self.handleDecision(game, future))
+
+        timer = threading.Timer(self.timeBudget, self.submitFallback, args=(game,))
+        timer.daemon = True
+        timer.start()
+
+    def schedule(self, function, *args):
+        """
+        Runs a function on the bot's worker thread
+
+        Parameters:
+            function (function):
+                The function to run
+            *args (list):
+                The arguments to pass to the function
+
+        Returns the future of the function, or None if the bot has stopped
+        """
+        try:
+            return self.executor.submit(function, *args)
+        except RuntimeError:
+            # The worker was shut down
+            return None
+
+    def handleDecision(self, game, future):
+        """
+        Sends the turn chosen by the strategy
+
+        Parameters:
+            game (ClueLess.Game):
+                The game the turn was chosen in
+            future (concurrent.futures.Future):
+                The finished choice
+        """
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            print(f"Bot strategy failed: {future.exception()}")
+            self.submitFallback(game)
+            return
+
+        self.submitTurn(game.turnNumber, future.result())
+
+    def submitFallback(self, game):
+        """
+        Sends a random turn if no turn was sent in time
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to choose a turn in
+        """
+        with self.lock:
+            if self.sentTurnNumber == game.turnNumber:
+                return
+
+        turn = self.fallback.chooseTurn(game)
+        turn.playerId = self.playerId
+        self.submitTurn(game.turnNumber, turn)
+
+    def submitTurn(self, turnNumber, turn):
+        """
+        Sends a turn unless one was already sent for the turn number or the
+        game has moved on
+
+        Parameters:
+            turnNumber (integer):
+                The turn number of the game the turn was chosen in
+            turn (ClueLess.Turn):
+                The chosen turn
+        """
+        with self.lock:
+            if (
+                self.stopped
+                or turnNumber != self.latestTurnNumber
+                or turnNumber == self.sentTurnNumber
+            ):
+                return
+            self.sentTurnNumber = turnNumber
+
+        if self.send is not None:
+            self.send(turn)
+
+    def stop(self):
+        """Stops the bot"""
+        with self.lock:
+            self.stopped = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.strategy.close()
+
+
+class BotClient(Client):
+    """
+    The Bot Client for the Clue-Less application
+
+    The BotClient class connects a bot to a server as an ordinary client. Game
+    updates from the server are passed to the bot instead of being posted as
+    Pygame events.
+
+    Attributes:
+        bot (ClueLess.Bot):
+            The bot playing through this client
+    """
+
+    def __init__(self, host="localhost", port=5555, strategy=None, timeBudget=1.0):
+        """
+        Initializes a new bot client
+
+        Parameters:
+            host (string):
+                The hostname or ip address of the server
+            port (integer):
+                The port of the server
+            strategy (ClueLess.Strategy):
+                The strategy that chooses the bot's turns
+            timeBudget (float):
+                The number of seconds the strategy has to choose a turn
+        """
+        super().__init__(host, port)
+        self.bot = Bot(strategy, timeBudget, self.sendTurn)
+
+    def sendTurn(self, turn):
+        """
+        Sends a turn chosen by the bot to the server
+
+        Parameters:
+            turn (ClueLess.Turn):
+                The chosen turn
+        """
+        if not self.running:
+            # Disconnected while the turn was being chosen
+            return
+
+        # The server fills in the player ID from the client port
+        del turn.playerId
+        self.sendToServer(turn)
+
+    def handleConnect(self):
+        pass
+
+    def handleCouldNotConnect(self):
+        self.bot.stop()
+
+    def handleMessage(self, obj):
+        if not isinstance(obj, Game):
+            return
+
+        # The client port is this bot's player ID
+        self.bot.playerId = getattr(obj, "clientPort", self.bot.playerId)
+        if hasattr(obj, "clientPort"):
+            delattr(obj, "clientPort")
+        self.bot.receiveGame(obj)
+
+    def handleDisconnect(self):
+        self.bot.stop()
+
+    def stop(self):
+        """Stops the bot client"""
+        self.bot.stop()
+        super().stop()
+
+
+if __name__ == "__main__":
+    # Fill a server with bots, e.g. for load testing:
+    # python -m ClueLess.Bots [host] [port] [count]
+    host = sys.argv[1] if len(sys.argv) > 1 else "localhost"
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 5555
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    threads = []
+    for _ in range(count):
+        thread = threading.Thread(target=BotClient(host, port).start)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
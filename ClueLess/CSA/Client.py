@@ -1,13 +1,13 @@
+import io
 import pickle
 import socket
 
-import pygame
-
 from ClueLess.Events import (
     CLIENT_CONNECTED_EVENT,
     CLIENT_COULD_NOT_CONNECT_EVENT,
     CLIENT_DISCONNECTED_EVENT,
     CLIENT_MESSAGE_RECEIVED_EVENT,
+    postEvent,
 )
 
 
@@ -17,7 +17,8 @@ class Client:
 
     The Client class acts as the client in the Client-Server architecture
     implemented for the Clue-Less application. It is in charge of sending
-    messages to the server.
+    messages to the server. Messages from the server are passed to the handle
+    methods, which post Pygame events and can be overridden by subclasses.
 
     Attributes:
         host (string):
@@ -50,12 +51,20 @@ class Client:
         self.receivingFromServer = False
 
     def receiveFromServer(self):
-        """Receives an object from the server"""
+        """Receives objects from the server"""
         try:
             data = self.server.recv(4096)
         except BlockingIOError:
             # No more data from server
             pass
+        except OSError:
+            # Connection was reset or the socket was closed by stop
+            if self.running:
+                print("Server disconnected")
+                self.running = False
+                self.receivingFromServer = False
+
+                self.handleDisconnect()
         else:
             if not data:
                 # Server disconnected
@@ -63,27 +72,50 @@ class Client:
                 self.running = False
                 self.receivingFromServer = False
 
-                # Post Pygame event
-                if pygame.get_init():
-                    pygame.event.post(
-                        pygame.event.Event(
-                            CLIENT_DISCONNECTED_EVENT,
-                        )
-                    )
+                self.handleDisconnect()
             else:
-                # Message received
-                obj = pickle.loads(data)
-                print(f"Received Object: {obj}")
-
-                # Post Pygame event
-                if pygame.get_init():
-                    pygame.event.post(
-                        pygame.event.Event(
-                            CLIENT_MESSAGE_RECEIVED_EVENT,
-                            sender=self.server,
-                            message=obj,
-                        )
-                    )
+                # Messages sent close together can arrive in the same read
+                stream = io.BytesIO(data)
+                while stream.tell() < len(data):
+                    try:
+                        obj = pickle.load(stream)
+                    except (pickle.UnpicklingError, EOFError):
+                        print("Received an incomplete message")
+                        break
+
+                    # Message received
+                    print(f"Received Object: {obj}")
+                    self.handleMessage(obj)
+
+    def handleConnect(self):
+        """Handles connecting to the server"""
+        # Post Pygame event
+        postEvent(CLIENT_CONNECTED_EVENT)
+
+    def handleCouldNotConnect(self):
+        """Handles failing to connect to the server"""
+        # Post Pygame event
+        postEvent(CLIENT_COULD_NOT_CONNECT_EVENT)
+
+    def handleMessage(self, obj):
+        """
+        Handles an object received from the server
+
+        Parameters:
+            obj (Object):
+                The object received from the server
+        """
+        # Post Pygame event
+        postEvent(
+            CLIENT_MESSAGE_RECEIVED_EVENT,
+            sender=self.server,
+            message=obj,
+        )
+
+    def handleDisconnect(self):
+        """Handles the server disconnecting"""
+        # Post Pygame event
+        postEvent(CLIENT_DISCONNECTED_EVENT)
 
     def sendToServer(self, obj):
         """
@@ -109,20 +141,12 @@ class Client:
             self.server.connect((self.host, self.port))
         except OSError:
             print(f"Could not connect to server at {self.host}:{self.port}")
-            # Post Pygame event
-            if pygame.get_init():
-                pygame.event.post(pygame.event.Event(CLIENT_COULD_NOT_CONNECT_EVENT))
+            self.handleCouldNotConnect()
         else:
             print(f"Connected to server at {self.host}:{self.port}")
             self.running = True
 
-            # Post Pygame event
-            if pygame.get_init():
-                pygame.event.post(
-                    pygame.event.Event(
-                        CLIENT_CONNECTED_EVENT,
-                    )
-                )
+            self.handleConnect()
 
             self.receivingFromServer = True
 
@@ -17,12 +17,15 @@ class Network:
             The server controlled by the network manager
         client (ClueLess.CSA.Client):
             The client controlled by the network manager
+        bots (list):
+            The bot clients started by the network manager
     """
 
     def __init__(self):
         """Initializes a new network"""
         self.server = None
         self.client = None
+        self.bots = []
 
     def isServer(self):
         """Returns whether this network is a server"""
@@ -75,6 +78,33 @@ class Network:
         if self.server:
             self.server.stop()
             self.server = None
+        self.stopBots()
+
+    def addBot(self, strategy=None, timeBudget=1.0):
+        """
+        Starts a bot that joins the server as a new client
+
+        Parameters:
+            strategy (ClueLess.Strategy):
+                The strategy that chooses the bot's turns
+            timeBudget (float):
+                The number of seconds the bot has to choose a turn
+        """
+        # Imported here since ClueLess.Bots imports this package's Client
+        from ClueLess.Bots import BotClient
+
+        if not self.server:
+            return
+
+        bot = BotClient(self.server.host, self.server.port, strategy, timeBudget)
+        self.bots.append(bot)
+        Thread(target=bot.start).start()
+
+    def stopBots(self):
+        """Stops the bots"""
+        for bot in self.bots:
+            bot.stop()
+        self.bots = []
 
     def startClient(self, host="localhost", port=5555):
         """
@@ -1,13 +1,12 @@
 import pickle
 import socket
 
-import pygame
-
 from ClueLess.Events import (
     SERVER_CONNECTED_EVENT,
     SERVER_COULD_NOT_START_EVENT,
     SERVER_DISCONNECTED_EVENT,
     SERVER_MESSAGE_RECEIVED_EVENT,
+    postEvent,
 )
 
 
@@ -88,15 +87,10 @@ class Server:
                 self.clients.append(connection)
 
                 # Post Pygame event
-                if pygame.get_init():
-                    pygame.event.post(
-                        pygame.event.Event(
-                            SERVER_CONNECTED_EVENT,
-                            clientPorts=[
-                                client.getpeername()[1] for client in self.clients
-                            ],
-                        )
-                    )
+                postEvent(
+                    SERVER_CONNECTED_EVENT,
+                    clientPorts=[client.getpeername()[1] for client in self.clients],
+                )
 
     def receiveFromClients(self):
         """Receives an object from the clients"""
@@ -115,31 +109,25 @@ class Server:
                     self.clients.remove(client)
 
                     # Post Pygame event
-                    if pygame.get_init():
-                        pygame.event.post(
-                            pygame.event.Event(
-                                SERVER_DISCONNECTED_EVENT,
-                                clientPorts=[
-                                    client.getpeername()[1] for client in self.clients
-                                ],
-                            )
-                        )
+                    postEvent(
+                        SERVER_DISCONNECTED_EVENT,
+                        clientPorts=[
+                            client.getpeername()[1] for client in self.clients
+                        ],
+                    )
                 else:
                     # Message received
                     obj = pickle.loads(data)
                     print(f"Received Object: {obj}")
 
                     # Post Pygame event
-                    if pygame.get_init():
-                        pygame.event.post(
-                            pygame.event.Event(
-                                SERVER_MESSAGE_RECEIVED_EVENT,
-                                clientPorts=[
-                                    client.getpeername()[1] for client in self.clients
-                                ],
-                                message=obj,
-                            )
-                        )
+                    postEvent(
+                        SERVER_MESSAGE_RECEIVED_EVENT,
+                        clientPorts=[
+                            client.getpeername()[1] for client in self.clients
+                        ],
+                        message=obj,
+                    )
 
     def sendToClients(self, obj):
         """
@@ -167,8 +155,7 @@ class Server:
         except OSError:
             print(f"Unable to start server on {self.host}:{self.port}")
             # Post Pygame event
-            if pygame.get_init():
-                pygame.event.post(pygame.event.Event(SERVER_COULD_NOT_START_EVENT))
+            postEvent(SERVER_COULD_NOT_START_EVENT)
         else:
             print(f"Starting server on {self.host}:{self.port}")
             self.running = True
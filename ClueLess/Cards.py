@@ -1,33 +1,14 @@
 """Cards for the Clue-Less Application"""
 
+from ClueLess.Variant import VARIANT
 
-class Cards:
-    CHARACTERS = (
-        "MissScarlett",
-        "ColonelMustard",
-        "MrsWhite",
-        "MrGreen",
-        "MrsPeacock",
-        "ProfessorPlum",
-    )
-
-    WEAPONS = (
-        "Candlestick",
-        "Dagger",
-        "LeadPipe",
-        "Revolver",
-        "Rope",
-        "Wrench",
-    )
 
-    ROOMS = (
-        "Study",
-        "Hall",
-        "Lounge",
-        "Library",
-        "Billiard",
-        "Dining",
-        "Conservatory",
-        "Ballroom",
-        "Kitchen",
-    )
+class Cards:
+    # Cards of the variant being played (see ClueLess.Variant)
+    CHARACTERS = VARIANT.characters
+    WEAPONS = VARIANT.weapons
+    ROOMS = VARIANT.rooms
+
+    # Every card in a fixed order so cards can be stored as small indices
+    ALL = CHARACTERS + WEAPONS + ROOMS
+    INDEX = {card: index for index, card in enumerate(ALL)}
@@ -1,34 +1,25 @@
 """Constants for the Clue-Less Application"""
 
-CHARACTER_COLORS = {
-    "MissScarlett": (255, 0, 0),
-    "ColonelMustard": (255, 255, 0),
-    "MrsWhite": (235, 235, 235),
-    "MrGreen": (0, 255, 0),
-    "MrsPeacock": (0, 0, 255),
-    "ProfessorPlum": (128, 0, 128),
-}
-
-LOCATION_NAMES = [
-    ["Study", "StudyHall", "Hall", "HallLounge", "Lounge"],
-    ["StudyLibrary", None, "HallBilliard", None, "LoungeDining"],
-    ["Library", "LibraryBilliard", "Billiard", "BilliardDining", "Dining"],
-    ["LibraryConservatory", None, "BilliardBallroom", None, "DiningKitchen"],
-    [
-        "Conservatory",
-        "ConservatoryBallroom",
-        "Ballroom",
-        "BallroomKitchen",
-        "Kitchen",
-    ],
-]
-
-"""Origin is Study (0,0) (-y,x)"""
-STARTING_LOCATIONS = {
-    "MissScarlett": (0, 3),
-    "ColonelMustard": (1, 4),
-    "MrsWhite": (4, 3),
-    "MrGreen": (4, 1),
-    "MrsPeacock": (3, 0),
-    "ProfessorPlum": (1, 0),
-}
+import os
+
+from ClueLess.Variant import VARIANT
+
+# Directory that hosted games are saved to so they survive a restart
+SAVE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".clueless", "games")
+
+# Directory that profiler traces are exported to
+TRACE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".clueless", "traces")
+
+# Board and character tables of the variant being played (see ClueLess.Variant)
+CHARACTER_COLORS = VARIANT.characterColors
+
+LOCATION_NAMES = VARIANT.locationNames
+
+# Locations are stored as a single index of row * BOARD_SIZE + column
+BOARD_SIZE = VARIANT.boardSize
+LOCATION_COORDINATES = tuple(
+    (row, column) for row in range(BOARD_SIZE) for column in range(BOARD_SIZE)
+)
+
+"""Origin is the top left room (0,0) (-y,x)"""
+STARTING_LOCATIONS = VARIANT.startingLocations
@@ -0,0 +1,213 @@
+"""Dealing for the Clue-Less Application"""
+
+from ClueLess.Cards import Cards
+from ClueLess.Deduction import SOLUTION, getHandSizes
+
+
+class Dealer:
+    """
+    A Clue-Less Dealer
+
+    The Dealer class picks the solution and deals the rest of the cards to the
+    seated players. Hands are dealt round-robin in seat order starting with the
+    lowest seat, so the hand sizes always match ClueLess.getHandSizes. This
+    dealer shuffles the cards once and slices a hand off for each seat.
+    Subclasses override pickSolution or arrange, and getBatchKeys to deal
+    batches the same way.
+    """
+
+    def pickSolution(self, rng):
+        """
+        Picks the solution
+
+        Parameters:
+            rng (random.Random):
+                The game's random number generator
+
+        Returns the solution in the form (character, weapon, room)
+        """
+        return (
+            rng.choice(Cards.CHARACTERS),
+            rng.choice(Cards.WEAPONS),
+            rng.choice(Cards.ROOMS),
+        )
+
+    def arrange(self, rng, cards):
+        """
+        Puts the cards in the order they are dealt
+
+        Parameters:
+            rng (random.Random):
+                The game's random number generator
+            cards (list):
+                The cards to deal, in the order of Cards.ALL
+
+        Returns the cards in dealing order
+        """
+        rng.shuffle(cards)
+        return cards
+
+    def deal(self, rng, solution, seats):
+        """
+        Deals the cards that aren't in the solution
+
+        Parameters:
+            rng (random.Random):
+                The game's random number generator
+            solution (tuple):
+                The solution in the form (character, weapon, room)
+            seats (list):
+                The indices of the seated players
+
+        Returns a dictionary of hands keyed by seat
+        """
+        seats = sorted(seats)
+        if not seats:
+            return {}
+        cards = self.arrange(rng, [card for card in Cards.ALL if card not in solution])
+        return {seat: cards[order :: len(seats)] for order, seat in enumerate(seats)}
+
+    def getBatchKeys(self, rng, count):
+        """
+        Gets random keys that sort the cards of many games into dealing order
+
+        Parameters:
+            rng (numpy.random.Generator):
+                The random number generator
+            count (integer):
+                The number of games
+
+        Returns an array with a row of keys for each game, one per card in
+        the order of Cards.ALL
+        """
+        return rng.random((count, len(Cards.ALL)))
+
+    def dealBatch(self, rng, seats, count):
+        """
+        Picks the solutions and hands of many games at once, for simulations
+
+        Every game is dealt together with NumPy, sorting a row of random keys
+        per game instead of shuffling game by game. The deals are laid out the
+        same way as in ClueLess.Estimator.
+
+        Parameters:
+            rng (numpy.random.Generator):
+                The random number generator
+            seats (list):
+                The indices of the seated players
+            count (integer):
+                The number of games to deal
+
+        Returns (solutions, owners) where solutions is an array of the card
+        indices of each game's (character, weapon, room) and owners is an
+        array of the seat dealt each card in each game, or SOLUTION
+        """
+        import numpy as np
+
+        if not seats:
+            raise ValueError("There must be a seated player to deal to")
+        seats = np.array(sorted(seats))
+        rows = np.arange(count)[:, np.newaxis]
+
+        solutions = np.column_stack(
+            [
+                rng.choice([Cards.INDEX[card] for card in category], count)
+                for category in (Cards.CHARACTERS, Cards.WEAPONS, Cards.ROOMS)
+            ]
+        )
+
+        # Deal the cards round-robin in key order, with the solution last
+        keys = self.getBatchKeys(rng, count)
+        keys[rows, solutions] = np.inf
+        order = np.argsort(keys, axis=1)[:, : len(Cards.ALL) - solutions.shape[1]]
+
+        owners = np.full((count, len(Cards.ALL)), SOLUTION)
+        owners[rows, order] = seats[np.arange(order.shape[1]) % len(seats)]
+        return (solutions, owners)
+
+
+class BalancedDealer(Dealer):
+    """
+    A Dealer that spreads each category evenly
+
+    The BalancedDealer class shuffles each category separately and deals them
+    one after another, so every hand holds about the same number of
+    characters, weapons and rooms.
+    """
+
+    def arrange(self, rng, cards):
+        arranged = []
+        for category in (Cards.CHARACTERS, Cards.WEAPONS, Cards.ROOMS):
+            categoryCards = [card for card in cards if card in category]
+            rng.shuffle(categoryCards)
+            arranged += categoryCards
+        return arranged
+
+    def getBatchKeys(self, rng, count):
+        # Keep each category together, shuffled within
+        categories = (
+            [0] * len(Cards.CHARACTERS)
+            + [1] * len(Cards.WEAPONS)
+            + [2] * len(Cards.ROOMS)
+        )
+        return rng.random((count, len(Cards.ALL))) + categories
+
+
+class FixedDealer(Dealer):
+    """
+    A Dealer that always deals the same cards, for tests
+
+    Attributes:
+        solution (tuple):
+            The solution in the form (character, weapon, room)
+        hands (dict):
+            The hand of each seat
+    """
+
+    def __init__(self, solution, hands):
+        """
+        Initializes a new fixed dealer
+
+        Parameters:
+            solution (tuple):
+                The solution in the form (character, weapon, room)
+            hands (dict):
+                The hand of each seat, which must hold every other card in
+                the sizes given by ClueLess.getHandSizes
+        """
+        handSizes = getHandSizes(hands)
+        dealt = sorted(card for hand in hands.values() for card in hand)
+        if dealt != sorted(card for card in Cards.ALL if card not in solution):
+            raise ValueError("The hands must hold every card not in the solution")
+        if any(len(hand) != handSizes[seat] for seat, hand in hands.items()):
+            raise ValueError("The hands must be the sizes they would be dealt")
+
+        self.solution = tuple(solution)
+        self.hands = {seat: list(hand) for seat, hand in hands.items()}
+
+    def pickSolution(self, rng):
+        return self.solution
+
+    def deal(self, rng, solution, seats):
+        if sorted(seats) != sorted(self.hands):
+            raise ValueError("The seated players don't match the fixed hands")
+        return {seat: list(hand) for seat, hand in self.hands.items()}
+
+    def dealBatch(self, rng, seats, count):
+        import numpy as np
+
+        if sorted(seats) != sorted(self.hands):
+            raise ValueError("The seated players don't match the fixed hands")
+        owners = np.full(len(Cards.ALL), SOLUTION)
+        for seat, hand in self.hands.items():
+            owners[[Cards.INDEX[card] for card in hand]] = seat
+        solution = [Cards.INDEX[card] for card in self.solution]
+        return (np.tile(solution, (count, 1)), np.tile(owners, (count, 1)))
+
+
+# Dealing policies that games can be started with, keyed by name
+DEALERS = {
+    "shuffle": Dealer,
+    "balanced": BalancedDealer,
+}
+DEFAULT_DEALER = "shuffle"
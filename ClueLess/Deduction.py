@@ -0,0 +1,459 @@
+"""Deduction for the Clue-Less Application"""
+
+from ClueLess.Cards import Cards
+
+# Owner index of the solution (players use their index in Game.players)
+SOLUTION = len(Cards.CHARACTERS)
+OWNER_COUNT = SOLUTION + 1
+
+# Bit of each card in a card set (bit i is the card Cards.ALL[i])
+CARD_BITS = {card: 1 << index for index, card in enumerate(Cards.ALL)}
+ALL_CARDS = (1 << len(Cards.ALL)) - 1
+
+
+def toBits(cards):
+    """
+    Converts cards to a card set
+
+    Parameters:
+        cards (iterable):
+            The cards to convert
+    """
+    bits = 0
+    for card in cards:
+        bits |= CARD_BITS[card]
+    return bits
+
+
+def fromBits(bits):
+    """
+    Converts a card set to a list of cards in the order of Cards.ALL
+
+    Parameters:
+        bits (integer):
+            The card set to convert
+    """
+    cards = []
+    while bits:
+        lowest = bits & -bits
+        cards.append(Cards.ALL[lowest.bit_length() - 1])
+        bits ^= lowest
+    return cards
+
+
+def countBits(bits):
+    """
+    Counts the cards in a card set
+
+    Parameters:
+        bits (integer):
+            The card set to count
+    """
+    return bin(bits).count("1")
+
+
+# Card set of each category
+CHARACTER_BITS = toBits(Cards.CHARACTERS)
+WEAPON_BITS = toBits(Cards.WEAPONS)
+ROOM_BITS = toBits(Cards.ROOMS)
+CATEGORY_BITS = (CHARACTER_BITS, WEAPON_BITS, ROOM_BITS)
+
+# Number of cards dealt to the players
+DEALT_CARD_COUNT = len(Cards.ALL) - len(CATEGORY_BITS)
+
+
+def getHandSizes(seats):
+    """
+    Gets the number of cards each seated player is dealt
+
+    Cards are dealt one at a time to the seated players in order of their
+    index, starting with the lowest (see ClueLess.Game.distributeCards).
+
+    Parameters:
+        seats (list):
+            The indices of the seated players
+
+    Returns a dictionary of hand sizes keyed by player index
+    """
+    seats = sorted(seats)
+    (size, extra) = divmod(DEALT_CARD_COUNT, len(seats))
+    return {
+        seat: size + (1 if position < extra else 0)
+        for position, seat in enumerate(seats)
+    }
+
+
+class Contradiction(Exception):
+    """Raised when the observations can't all be true"""
+
+
+class KnowledgeBase:
+    """
+    The Knowledge Base of a Clue-Less Player
+
+    The KnowledgeBase class tracks what one player can deduce about where every
+    card is. Each owner (a player index, or SOLUTION) has a set of cards it
+    might hold and a set of cards it is known to hold, both stored as integer
+    bitsets over Cards.ALL. Every observation is turned into facts that are
+    propagated until nothing more can be deduced:
+
+        * Each card has exactly one owner
+        * Each player holds exactly their hand size of cards
+        * The solution holds exactly one card of each category
+        * A refuter holds at least one of the suggested cards
+
+    Attributes:
+        playerIndex (integer):
+            The index of the player whose knowledge this is
+        handSizes (list):
+            The number of cards held by each owner
+        possible (list):
+            The set of cards each owner might hold
+        known (list):
+            The set of cards each owner is known to hold
+        clauses (list):
+            (owner, card set) pairs where the owner holds at least one card
+        excluded (set):
+            (character, weapon, room) triples known not to be the solution
+        turnNumber (integer):
+            The turn number of the last game update observed
+        candidates (list):
+            The cached solution candidates, or None
+    """
+
+    __slots__ = [
+        "playerIndex",
+        "handSizes",
+        "possible",
+        "known",
+        "clauses",
+        "excluded",
+        "turnNumber",
+        "candidates",
+    ]
+
+    def __init__(self, playerIndex, cards, seats):
+        """
+        Initializes a new knowledge base
+
+        Parameters:
+            playerIndex (integer):
+                The index of the player whose knowledge this is
+            cards (list):
+                The player's cards
+            seats (list):
+                The indices of the seated players
+        """
+        self.playerIndex = playerIndex
+
+        self.handSizes = [0] * OWNER_COUNT
+        for seat, size in getHandSizes(seats).items():
+            self.handSizes[seat] = size
+        self.handSizes[SOLUTION] = len(CATEGORY_BITS)
+
+        # Players who aren't seated hold nothing
+        self.possible = [0] * OWNER_COUNT
+        for seat in seats:
+            self.possible[seat] = ALL_CARDS
+        self.possible[SOLUTION] = ALL_CARDS
+        self.known = [0] * OWNER_COUNT
+
+        self.clauses = []
+        self.excluded = set()
+        self.turnNumber = None
+        self.candidates = None
+
+        # The player's own hand is known exactly
+        hand = toBits(cards)
+        self.possible[playerIndex] = hand
+        self.known[playerIndex] = hand
+        self.propagate(ALL_CARDS)
+
+    @classmethod
+    def fromGame(cls, game, playerId):
+        """
+        Creates the knowledge base of a player in a started game
+
+        Parameters:
+            game (ClueLess.Game):
+                The game
+            playerId (integer):
+                The ID of the player whose knowledge this is
+        """
+        player = game.findPlayerFromId(playerId)
+        knowledge = cls(
+            game.players.index(player),
+            player.getCards(),
+            [game.players.index(seated) for seated in game.playersById.values()],
+        )
+        knowledge.turnNumber = game.turnNumber
+        return knowledge
+
+    def addHolds(self, owner, cards):
+        """
+        Adds that an owner holds cards
+
+        Parameters:
+            owner (integer):
+                The index of the owner
+            cards (iterable):
+                The cards held
+        """
+        bits = toBits(cards)
+        if bits & ~self.possible[owner]:
+            raise Contradiction(f"Owner {owner} can't hold {fromBits(bits)}")
+        self.known[owner] |= bits
+        self.propagate(bits)
+
+    def addLacks(self, owner, cards):
+        """
+        Adds that an owner doesn't hold cards
+
+        Parameters:
+            owner (integer):
+                The index of the owner
+            cards (iterable):
+                The cards not held
+        """
+        bits = toBits(cards)
+        if bits & self.known[owner]:
+            raise Contradiction(f"Owner {owner} holds {fromBits(bits)}")
+        self.possible[owner] &= ~bits
+        self.propagate(bits)
+
+    def addSuggestion(self, suggesterIndex, suggestion, refuterIndex, shownCard=None):
+        """
+        Adds the result of a suggestion
+
+        The players between the suggester and the refuter (or every other player
+        if nobody refuted) don't hold any of the suggested cards. A refuter
+        shows the room if they can, then the weapon, then the suspect (see
+        ClueLess.Game.makeMove), so a shown card also rules out the cards that
+        would have been shown before it.
+
+        Parameters:
+            suggesterIndex (integer):
+                The index of the player who made the suggestion
+            suggestion (tuple):
+                The suggestion in the form (suspect, weapon, room)
+            refuterIndex (integer):
+                The index of the player who refuted it, or None
+            shownCard (string):
+                The card shown, if this player saw it
+        """
+        (suspect, weapon, room) = suggestion
+        bits = toBits(suggestion)
+
+        # Seated players are asked in order after the suggester
+        seat = suggesterIndex
+        for _ in range(len(Cards.CHARACTERS)):
+            seat = (seat + 1) % len(Cards.CHARACTERS)
+            if seat == suggesterIndex or seat == refuterIndex:
+                break
+            if self.handSizes[seat]:
+                self.possible[seat] &= ~bits
+
+        if refuterIndex is not None:
+            if shownCard is not None:
+                # Cards ahead of the shown card in the refutation order
+                order = (room, weapon, suspect)
+                self.possible[refuterIndex] &= ~toBits(order[: order.index(shownCard)])
+                self.known[refuterIndex] |= CARD_BITS[shownCard]
+            else:
+                self.clauses.append((refuterIndex, bits))
+
+        self.propagate(bits)
+
+    def addAccusation(self, accusation, correct):
+        """
+        Adds the result of an accusation
+
+        Parameters:
+            accusation (tuple):
+                The accusation in the form (suspect, weapon, room)
+            correct (boolean):
+                Whether the accusation was correct
+        """
+        if correct:
+            self.addHolds(SOLUTION, accusation)
+        else:
+            self.excluded.add(tuple(accusation))
+            self.candidates = None
+
+    def update(self, game):
+        """
+        Adds the result of the last turn of a game update
+
+        Updates for a turn that was already observed are ignored.
+
+        Parameters:
+            game (ClueLess.Game):
+                The updated game
+        """
+        if game.turnNumber == self.turnNumber:
+            return
+        self.turnNumber = game.turnNumber
+
+        if game.lastSuggestion is None:
+            return
+
+        (suggesterIndex, suggestion, refuterIndex, shownCard) = game.lastSuggestion
+        if suggesterIndex != self.playerIndex:
+            # Only the suggester is shown the card
+            shownCard = None
+        self.addSuggestion(suggesterIndex, suggestion, refuterIndex, shownCard)
+
+    def propagate(self, changed):
+        """
+        Deduces everything that follows from the current facts
+
+        Parameters:
+            changed (integer):
+                The set of cards whose facts changed
+        """
+        possible = self.possible
+        known = self.known
+        handSizes = self.handSizes
+
+        while changed:
+            self.candidates = None
+            dirty = 0
+
+            # Each card has exactly one owner
+            while changed:
+                bit = changed & -changed
+                changed ^= bit
+                owners = [
+                    owner for owner in range(OWNER_COUNT) if possible[owner] & bit
+                ]
+                if not owners:
+                    raise Contradiction(f"Nobody can hold {fromBits(bit)[0]}")
+                if len(owners) == 1 and not known[owners[0]] & bit:
+                    known[owners[0]] |= bit
+                    dirty |= bit
+                for owner in owners:
+                    if known[owner] & bit:
+                        for other in owners:
+                            if other != owner:
+                                possible[other] &= ~bit
+                                dirty |= bit
+                        break
+
+            # Each owner holds exactly their hand size
+            for owner in range(OWNER_COUNT):
+                if not possible[owner]:
+                    continue
+                knownCount = countBits(known[owner])
+                possibleCount = countBits(possible[owner])
+                if knownCount > handSizes[owner] or possibleCount < handSizes[owner]:
+                    raise Contradiction(f"Owner {owner} can't hold their hand")
+                if knownCount == handSizes[owner] and possibleCount > knownCount:
+                    dirty |= possible[owner] & ~known[owner]
+                    possible[owner] = known[owner]
+                elif possibleCount == handSizes[owner] and knownCount < possibleCount:
+                    dirty |= possible[owner] & ~known[owner]
+                    known[owner] = possible[owner]
+
+            # The solution holds exactly one card of each category
+            for category in CATEGORY_BITS:
+                solutionCards = possible[SOLUTION] & category
+                knownCards = known[SOLUTION] & category
+                if not solutionCards or knownCards & (knownCards - 1):
+                    raise Contradiction("The solution can't hold one of each category")
+                if knownCards and solutionCards != knownCards:
+                    dirty |= solutionCards & ~knownCards
+                    possible[SOLUTION] &= ~category | knownCards
+                elif not knownCards and not solutionCards & (solutionCards - 1):
+                    known[SOLUTION] |= solutionCards
+                    dirty |= solutionCards
+
+            # A refuter holds at least one of the suggested cards
+            remaining = []
+            for owner, bits in self.clauses:
+                if bits & known[owner]:
+                    # Already satisfied
+                    continue
+                bits &= possible[owner]
+                if not bits:
+                    raise Contradiction(f"Owner {owner} can't refute")
+                if not bits & (bits - 1):
+                    known[owner] |= bits
+                    dirty |= bits
+                    continue
+                remaining.append((owner, bits))
+            self.clauses = remaining
+
+            changed = dirty
+
+    def getOwner(self, card):
+        """
+        Gets the known owner of a card
+
+        Parameters:
+            card (string):
+                The card to look for
+
+        Returns the owner's index (SOLUTION for the solution), or None
+        """
+        bit = CARD_BITS[card]
+        for owner in range(OWNER_COUNT):
+            if self.known[owner] & bit:
+                return owner
+        return None
+
+    def getStatus(self, owner, card):
+        """
+        Gets whether an owner holds a card
+
+        Parameters:
+            owner (integer):
+                The index of the owner
+            card (string):
+                The card to look for
+
+        Returns True or False if it is known, otherwise None
+        """
+        bit = CARD_BITS[card]
+        if self.known[owner] & bit:
+            return True
+        if not self.possible[owner] & bit:
+            return False
+        return None
+
+    def getPossibleCards(self, owner):
+        """
+        Gets the cards an owner might hold
+
+        Parameters:
+            owner (integer):
+                The index of the owner
+        """
+        return fromBits(self.possible[owner])
+
+    def getKnownCards(self, owner):
+        """
+        Gets the cards an owner is known to hold
+
+        Parameters:
+            owner (integer):
+                The index of the owner
+        """
+        return fromBits(self.known[owner])
+
+    def getCandidates(self):
+        """Gets the (character, weapon, room) triples that might be the solution"""
+        if self.candidates is None:
+            solution = self.possible[SOLUTION]
+            self.candidates = [
+                (character, weapon, room)
+                for character in fromBits(solution & CHARACTER_BITS)
+                for weapon in fromBits(solution & WEAPON_BITS)
+                for room in fromBits(solution & ROOM_BITS)
+                if (character, weapon, room) not in self.excluded
+            ]
+        return self.candidates
+
+    def getSolution(self):
+        """Gets the solution if only one candidate remains, otherwise None"""
+        candidates = self.getCandidates()
+        return candidates[0] if len(candidates) == 1 else None
@@ -0,0 +1,253 @@
+"""Estimator for the Clue-Less Application"""
+
+import numpy as np
+
+from ClueLess.Cards import Cards
+from ClueLess.Deduction import CARD_BITS, OWNER_COUNT, SOLUTION
+
+# Shape of the solution triples (character, weapon, room)
+TRIPLE_SHAPE = (len(Cards.CHARACTERS), len(Cards.WEAPONS), len(Cards.ROOMS))
+TRIPLE_COUNT = TRIPLE_SHAPE[0] * TRIPLE_SHAPE[1] * TRIPLE_SHAPE[2]
+
+# Card indices of each category in Cards.ALL
+CATEGORY_INDICES = (
+    np.arange(0, TRIPLE_SHAPE[0]),
+    np.arange(TRIPLE_SHAPE[0], TRIPLE_SHAPE[0] + TRIPLE_SHAPE[1]),
+    np.arange(TRIPLE_SHAPE[0] + TRIPLE_SHAPE[1], len(Cards.ALL)),
+)
+
+
+class Estimator:
+    """
+    The Solution Estimator of a Clue-Less Player
+
+    The Estimator class estimates how likely each (character, weapon, room)
+    triple is to be the solution by sampling deals that are consistent with a
+    player's knowledge (see ClueLess.KnowledgeBase). Deals are drawn the same
+    way ClueLess.Game deals them: one solution card of each category is
+    removed and the rest are shuffled into the seated players' hands. Cards
+    whose owner is already known are kept in place and the rest are dealt
+    in large NumPy batches, throwing away the deals that break a refutation
+    clause or an excluded accusation.
+
+    Attributes:
+        knowledge (ClueLess.KnowledgeBase):
+            The knowledge to sample deals from
+        rng (numpy.random.Generator):
+            The random number generator used for sampling
+    """
+
+    def __init__(self, knowledge, seed=None):
+        """
+        Initializes a new estimator
+
+        Parameters:
+            knowledge (ClueLess.KnowledgeBase):
+                The knowledge to sample deals from
+            seed (integer):
+                The seed for the random number generator
+        """
+        self.knowledge = knowledge
+        self.rng = np.random.default_rng(seed)
+
+    def getConstraints(self):
+        """
+        Gets the knowledge as arrays for sampling
+
+        Returns the known owner of each card (or -1), whether each owner might
+        hold each card, the empty seats in the players' hands and the cards of
+        each refutation clause
+        """
+        knowledge = self.knowledge
+
+        knownOwners = np.full(len(Cards.ALL), -1)
+        possible = np.zeros((OWNER_COUNT, len(Cards.ALL)), dtype=bool)
+        for owner in range(OWNER_COUNT):
+            for card, bit in CARD_BITS.items():
+                if knowledge.known[owner] & bit:
+                    knownOwners[Cards.INDEX[card]] = owner
+                if knowledge.possible[owner] & bit:
+                    possible[owner, Cards.INDEX[card]] = True
+
+        # Each empty seat in a player's hand holds that player's index
+        emptySeats = [
+            knowledge.handSizes[owner] - (knownOwners == owner).sum()
+            for owner in range(SOLUTION)
+        ]
+        slots = np.repeat(np.arange(SOLUTION), emptySeats)
+
+        clauses = [
+            (owner, [Cards.INDEX[card] for card in Cards.ALL if bits & CARD_BITS[card]])
+            for owner, bits in knowledge.clauses
+        ]
+
+        return (knownOwners, possible, slots, clauses)
+
+    def sampleBatch(self, size, constraints):
+        """
+        Samples a batch of deals and counts the consistent solutions
+
+        Parameters:
+            size (integer):
+                The number of deals to sample
+            constraints (tuple):
+                The constraints from getConstraints
+
+        Returns the number of consistent deals of each triple, flattened
+        """
+        (knownOwners, possible, slots, clauses) = constraints
+        rng = self.rng
+
+        # Pick the unknown solution cards from the cards it might hold
+        solution = np.empty((size, len(CATEGORY_INDICES)), dtype=np.intp)
+        for category, indices in enumerate(CATEGORY_INDICES):
+            fixed = indices[knownOwners[indices] == SOLUTION]
+            if len(fixed):
+                solution[:, category] = fixed[0]
+            else:
+                choices = indices[
+                    possible[SOLUTION, indices] & (knownOwners[indices] < 0)
+                ]
+                solution[:, category] = rng.choice(choices, size)
+
+        owners = np.broadcast_to(knownOwners, (size, len(Cards.ALL))).copy()
+        rows = np.arange(size)[:, np.newaxis]
+        owners[rows, solution] = SOLUTION
+
+        # Shuffle the cards nobody is known to hold into the empty seats
+        free = np.flatnonzero(knownOwners < 0)
+        if len(slots):
+            isSolution = owners[:, free] == SOLUTION
+            dealt = np.take_along_axis(
+                np.broadcast_to(free, isSolution.shape),
+                np.argsort(isSolution, axis=1, kind="stable")[:, : len(slots)],
+                axis=1,
+            )
+            shuffled = np.take_along_axis(
+                dealt, np.argsort(rng.random(dealt.shape), axis=1), axis=1
+            )
+            owners[rows, shuffled] = slots
+
+        # Keep the deals where every owner might hold each of its cards
+        consistent = possible[owners, np.arange(len(Cards.ALL))].all(axis=1)
+
+        # A refuter holds at least one of the suggested cards
+        for owner, cards in clauses:
+            consistent &= (owners[:, cards] == owner).any(axis=1)
+
+        triples = np.ravel_multi_index(
+            (
+                solution[:, 0] - CATEGORY_INDICES[0][0],
+                solution[:, 1] - CATEGORY_INDICES[1][0],
+                solution[:, 2] - CATEGORY_INDICES[2][0],
+            ),
+            TRIPLE_SHAPE,
+        )
+        return np.bincount(triples[consistent], minlength=TRIPLE_COUNT)
+
+    def estimate(self, samples=100000, batchSize=16384):
+        """
+        Estimates the probability of each solution triple
+
+        Parameters:
+            samples (integer):
+                The number of deals to sample
+            batchSize (integer):
+                The number of deals sampled at once
+
+        Returns an array of probabilities indexed by [character, weapon, room]
+        in the order of the Cards categories
+        """
+        constraints = self.getConstraints()
+        counts = np.zeros(TRIPLE_COUNT, dtype=np.int64)
+        remaining = samples
+        while remaining > 0:
+            size = min(batchSize, remaining)
+            counts += self.sampleBatch(size, constraints)
+            remaining -= size
+
+        # Accusations that were wrong can't be the solution
+        for triple in self.knowledge.excluded:
+            counts[self.getTripleIndex(triple)] = 0
+
+        total = counts.sum()
+        if total == 0:
+            # No sampled deal was consistent, so fall back to the candidates
+            for triple in self.knowledge.getCandidates():
+                counts[self.getTripleIndex(triple)] = 1
+            total = max(counts.sum(), 1)
+
+        return (counts / total).reshape(TRIPLE_SHAPE)
+
+    @staticmethod
+    def getTripleIndex(triple):
+        """
+        Gets the flattened index of a solution triple
+
+        Parameters:
+            triple (tuple):
+                The triple in the form (character, weapon, room)
+        """
+        (character, weapon, room) = triple
+        return np.ravel_multi_index(
+            (
+                Cards.CHARACTERS.index(character),
+                Cards.WEAPONS.index(weapon),
+                Cards.ROOMS.index(room),
+            ),
+            TRIPLE_SHAPE,
+        )
+
+    @staticmethod
+    def getCardProbabilities(probabilities):
+        """
+        Gets the probability of each card being in the solution
+
+        Parameters:
+            probabilities (numpy.ndarray):
+                The triple probabilities from estimate
+
+        Returns a dictionary of probabilities keyed by card
+        """
+        marginals = (
+            probabilities.sum(axis=(1, 2)),
+            probabilities.sum(axis=(0, 2)),
+            probabilities.sum(axis=(0, 1)),
+        )
+        cardProbabilities = {}
+        for cards, marginal in zip(
+            (Cards.CHARACTERS, Cards.WEAPONS, Cards.ROOMS), marginals
+        ):
+            for card, probability in zip(cards, marginal):
+                cardProbabilities[card] = float(probability)
+        return cardProbabilities
+
+    @staticmethod
+    def getMostLikely(probabilities, count=1):
+        """
+        Gets the most likely solution triples
+
+        Parameters:
+            probabilities (numpy.ndarray):
+                The triple probabilities from estimate
+            count (integer):
+                The number of triples to get
+
+        Returns a list of ((character, weapon, room), probability) tuples
+        """
+        flat = probabilities.ravel()
+        best = np.argsort(flat)[::-1][:count]
+        triples = []
+        for index in best:
+            (character, weapon, room) = np.unravel_index(index, TRIPLE_SHAPE)
+            triples.append(
+                (
+                    (
+                        Cards.CHARACTERS[character],
+                        Cards.WEAPONS[weapon],
+                        Cards.ROOMS[room],
+                    ),
+                    float(flat[index]),
+                )
+            )
+        return triples
@@ -1,15 +1,49 @@
 """Events for the Clue-Less Application"""
 
-import pygame
+import sys
+
+# First user event type, the value of pygame.USEREVENT in Pygame 2, so the
+# network can name its events without importing Pygame
+USEREVENT = 32866
 
 # Events for Server
-SERVER_COULD_NOT_START_EVENT = pygame.USEREVENT + 1
-SERVER_CONNECTED_EVENT = pygame.USEREVENT + 2
-SERVER_DISCONNECTED_EVENT = pygame.USEREVENT + 3
-SERVER_MESSAGE_RECEIVED_EVENT = pygame.USEREVENT + 4
+SERVER_COULD_NOT_START_EVENT = USEREVENT + 1
+SERVER_CONNECTED_EVENT = USEREVENT + 2
+SERVER_DISCONNECTED_EVENT = USEREVENT + 3
+SERVER_MESSAGE_RECEIVED_EVENT = USEREVENT + 4
 
 # Events for Client
-CLIENT_COULD_NOT_CONNECT_EVENT = pygame.USEREVENT + 5
-CLIENT_CONNECTED_EVENT = pygame.USEREVENT + 6
-CLIENT_DISCONNECTED_EVENT = pygame.USEREVENT + 7
-CLIENT_MESSAGE_RECEIVED_EVENT = pygame.USEREVENT + 8
+CLIENT_COULD_NOT_CONNECT_EVENT = USEREVENT + 5
+CLIENT_CONNECTED_EVENT = USEREVENT + 6
+CLIENT_DISCONNECTED_EVENT = USEREVENT + 7
+CLIENT_MESSAGE_RECEIVED_EVENT = USEREVENT + 8
+
+# Events posted by the network threads
+NETWORK_EVENTS = (
+    SERVER_COULD_NOT_START_EVENT,
+    SERVER_CONNECTED_EVENT,
+    SERVER_DISCONNECTED_EVENT,
+    SERVER_MESSAGE_RECEIVED_EVENT,
+    CLIENT_COULD_NOT_CONNECT_EVENT,
+    CLIENT_CONNECTED_EVENT,
+    CLIENT_DISCONNECTED_EVENT,
+    CLIENT_MESSAGE_RECEIVED_EVENT,
+)
+
+
+def postEvent(eventType, **attributes):
+    """
+    Posts a Pygame event if the application's Pygame is running
+
+    Headless servers and bots never import Pygame, so there is no one to
+    post to and the event is dropped.
+
+    Parameters:
+        eventType (integer):
+            The type of the event
+        attributes (dict):
+            The attributes of the event
+    """
+    pygame = sys.modules.get("pygame")
+    if pygame is not None and pygame.get_init():
+        pygame.event.post(pygame.event.Event(eventType, **attributes))
@@ -0,0 +1,372 @@
+"""Frozen Game for the Clue-Less Application"""
+
+import random
+from collections import deque, namedtuple
+
+from ClueLess.Board import NEIGHBORS
+from ClueLess.Cards import Cards
+from ClueLess.Game import Game
+from ClueLess.Hashing import (
+    ACTIVE_KEYS,
+    HASH_MASK,
+    LOCATION_KEYS,
+    TURN_KEYS,
+    getSuggestionKey,
+)
+from ClueLess.Player import Player
+
+
+class FrozenPlayer(
+    namedtuple(
+        "FrozenPlayer", ["name", "playerId", "locationIndex", "cardIndices", "lost"]
+    )
+):
+    """
+    An Immutable Player in the Clue-Less Game
+
+    The FrozenPlayer class holds the same state as ClueLess.Player in a tuple,
+    so it can be shared between game states instead of copied.
+
+    Attributes:
+        * The same as ClueLess.Player
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def fromPlayer(cls, player):
+        """
+        Freezes a player
+
+        Parameters:
+            player (ClueLess.Player):
+                The player to freeze
+        """
+        return cls(
+            player.name,
+            player.playerId,
+            player.locationIndex,
+            player.cardIndices,
+            player.lost,
+        )
+
+    def toPlayer(self):
+        """Gets a mutable copy of the player"""
+        player = Player.__new__(Player)
+        player.name = self.name
+        player.playerId = self.playerId
+        player.locationIndex = self.locationIndex
+        player.cardIndices = self.cardIndices
+        player.lost = self.lost
+        return player
+
+    def hasCard(self, card):
+        """
+        Returns whether the player has a card
+
+        Parameters:
+            card (string):
+                The card to look for
+        """
+        return Cards.INDEX[card] in self.cardIndices
+
+
+class FrozenGame(
+    namedtuple(
+        "FrozenGame",
+        [
+            "seed",
+            "dealer",
+            "players",
+            "nextSeats",
+            "previousSeats",
+            "activePlayerCount",
+            "currentTurnIndex",
+            "solution",
+            "feedback",
+            "log",
+            "running",
+            "turnNumber",
+            "lastSuggestion",
+            "boardHash",
+            "historyHash",
+            "winner",
+            "finished",
+        ],
+    )
+):
+    """
+    An Immutable Clue-Less Game State
+
+    The FrozenGame class holds the state of a ClueLess.Game in tuples. Making
+    a turn with apply returns a new state that shares everything the turn
+    didn't change with the old one, so branching a game only copies the
+    players tuple and the players who moved. States convert to and from
+    ClueLess.Game, which stays the game used over the network.
+
+    Attributes:
+        * The same as ClueLess.Game, with players as a tuple of
+          ClueLess.FrozenPlayer and without the random number generator
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def fromGame(cls, game):
+        """
+        Freezes a game
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to freeze
+        """
+        return cls(
+            game.seed,
+            game.dealer,
+            tuple(FrozenPlayer.fromPlayer(player) for player in game.players),
+            tuple(game.nextSeats),
+            tuple(game.previousSeats),
+            game.activePlayerCount,
+            game.currentTurnIndex,
+            game.solution,
+            game.feedback,
+            game.log,
+            game.running,
+            game.turnNumber,
+            game.lastSuggestion,
+            game.boardHash,
+            game.historyHash,
+            game.winner,
+            game.finished,
+        )
+
+    def toGame(self):
+        """Gets a mutable copy of the game"""
+        game = Game.__new__(Game)
+        for name in self._fields:
+            setattr(game, name, getattr(self, name))
+        game.rng = random.Random(self.seed)
+        game.players = [player.toPlayer() for player in self.players]
+        game.playersById = {
+            player.getPlayerId(): player
+            for player in game.players
+            if player.getPlayerId() is not None
+        }
+        game.nextSeats = list(self.nextSeats)
+        game.previousSeats = list(self.previousSeats)
+        return game
+
+    def getCurrentPlayer(self):
+        """Gets the current player"""
+        return self.players[self.currentTurnIndex]
+
+    def getHash(self):
+        """Gets the hash of the public game state (see ClueLess.Game.getHash)"""
+        return self.boardHash ^ self.historyHash
+
+    def apply(self, turn):
+        """
+        Makes a move the same way as ClueLess.Game.makeMove
+
+        Parameters:
+            turn (ClueLess.Turn):
+                The turn to use to make the move
+
+        Returns the new state, or this state if the turn came from the wrong
+        player
+        """
+        current = self.currentTurnIndex
+        player = self.players[current]
+        if not (hasattr(turn, "playerId") and int(turn.playerId) == player.playerId):
+            return self
+
+        players = list(self.players)
+        boardHash = self.boardHash
+        changes = {"turnNumber": self.turnNumber + 1, "lastSuggestion": None}
+
+        if hasattr(turn, "move"):
+            location = dict(NEIGHBORS[player.locationIndex]).get(
+                turn.move, player.locationIndex
+            )
+            boardHash ^= LOCATION_KEYS[current][player.locationIndex]
+            boardHash ^= LOCATION_KEYS[current][location]
+            player = player._replace(locationIndex=location)
+            players[current] = player
+            changes["log"] = player.name + " successfully made a move"
+
+        if hasattr(turn, "accusation"):
+            (suspect, weapon, room) = turn.accusation
+            changes["log"] = f"ACCUSATION: {suspect}, {weapon}, {room}."
+            activePlayerCount = self.activePlayerCount
+
+            if (suspect, weapon, room) == self.solution:
+                changes["winner"] = player.name
+                changes["feedback"] = "Correct! You win!"
+                changes["finished"] = True
+            else:
+                changes["feedback"] = "Incorrect! You lose!"
+                if not player.lost and player.playerId is not None:
+                    activePlayerCount -= 1
+                    changes["activePlayerCount"] = activePlayerCount
+                    boardHash ^= ACTIVE_KEYS[current]
+                players[current] = player._replace(lost=True)
+
+            return self.nextPlayer(players, boardHash, activePlayerCount, changes)
+
+        if hasattr(turn, "suggestion"):
+            (suspect, weapon, room) = turn.suggestion
+            suspectIndex = Game.PLAYER_INDEX[suspect]
+            if room in Player.ROOM_LOCATIONS:
+                suspectPlayer = players[suspectIndex]
+                location = Player.ROOM_LOCATIONS[room]
+                boardHash ^= LOCATION_KEYS[suspectIndex][suspectPlayer.locationIndex]
+                boardHash ^= LOCATION_KEYS[suspectIndex][location]
+                players[suspectIndex] = suspectPlayer._replace(locationIndex=location)
+
+            changes["log"] = f"SUGGESTION: {suspect}, {weapon}, {room}."
+            changes["feedback"] = "No other players have any suggested cards."
+            refuterIndex = None
+            shownCard = None
+
+            # Loop through the seated players in the same order as the game
+            seatedCount = sum(1 for other in players if other.playerId is not None)
+            seat = current
+            for _ in range(seatedCount):
+                seat = self.nextSeats[seat]
+                if seat == current:
+                    break
+
+                refuter = players[seat]
+                for card in (room, weapon, suspect):
+                    if refuter.hasCard(card):
+                        changes["feedback"] = (
+                            f"RESULT: {refuter.name} has the {card} card."
+                        )
+                        refuterIndex = seat
+                        shownCard = card
+                        break
+                if refuterIndex is not None:
+                    break
+
+            changes["lastSuggestion"] = (
+                current,
+                (suspect, weapon, room),
+                refuterIndex,
+                shownCard,
+            )
+            suggestionKey = getSuggestionKey(
+                current, (suspect, weapon, room), refuterIndex
+            )
+            changes["historyHash"] = (self.historyHash + suggestionKey) & HASH_MASK
+        else:
+            changes["feedback"] = ""
+
+        return self.nextPlayer(players, boardHash, self.activePlayerCount, changes)
+
+    def nextPlayer(self, players, boardHash, activePlayerCount, changes):
+        """
+        Gets the state after moving to the next player
+
+        Parameters:
+            players (list):
+                The players after the turn
+            boardHash (integer):
+                The board hash after the turn
+            activePlayerCount (integer):
+                The number of seated players who have not lost after the turn
+            changes (dict):
+                The other fields changed by the turn
+        """
+        if activePlayerCount <= 0:
+            changes["finished"] = True
+
+        current = self.currentTurnIndex
+        following = self.nextSeats[current]
+        boardHash ^= TURN_KEYS[current] ^ TURN_KEYS[following]
+
+        return self._replace(
+            players=tuple(players),
+            currentTurnIndex=following,
+            boardHash=boardHash,
+            **changes,
+        )
+
+
+class TurnHistory:
+    """
+    The Turn History of a Local Practice Game
+
+    The TurnHistory class keeps the states of a practice game so turns can be
+    undone and redone. Each state shares most of its data with the one before
+    it, so keeping them all is cheap.
+
+    Attributes:
+        state (ClueLess.FrozenGame):
+            The current state
+        undoStates (collections.deque):
+            The states before the current one, oldest first
+        redoStates (list):
+            The undone states, most recently undone last
+    """
+
+    __slots__ = ["state", "undoStates", "redoStates"]
+
+    def __init__(self, state, maxUndo=None):
+        """
+        Initializes a new history
+
+        Parameters:
+            state (ClueLess.FrozenGame):
+                The state to start from
+            maxUndo (integer):
+                The most turns that can be undone, or None for every turn
+        """
+        self.state = state
+        self.undoStates = deque(maxlen=maxUndo)
+        self.redoStates = []
+
+    def getState(self):
+        """Gets the current state"""
+        return self.state
+
+    def apply(self, turn):
+        """
+        Makes a turn, clearing any undone turns
+
+        Parameters:
+            turn (ClueLess.Turn):
+                The turn to make
+
+        Returns whether the turn was made
+        """
+        state = self.state.apply(turn)
+        if state is self.state:
+            return False
+        self.undoStates.append(self.state)
+        self.redoStates.clear()
+        self.state = state
+        return True
+
+    def canUndo(self):
+        """Returns whether there is a turn to undo"""
+        return len(self.undoStates) > 0
+
+    def canRedo(self):
+        """Returns whether there is an undone turn to redo"""
+        return len(self.redoStates) > 0
+
+    def undo(self):
+        """Undoes the last turn, returning whether there was one"""
+        if not self.undoStates:
+            return False
+        self.redoStates.append(self.state)
+        self.state = self.undoStates.pop()
+        return True
+
+    def redo(self):
+        """Redoes the last undone turn, returning whether there was one"""
+        if not self.redoStates:
+            return False
+        self.undoStates.append(self.state)
+        self.state = self.redoStates.pop()
+        return True
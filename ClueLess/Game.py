@@ -1,52 +1,123 @@
 import random
 
 from ClueLess.Cards import Cards
+from ClueLess.Constants import LOCATION_COORDINATES, LOCATION_NAMES
+from ClueLess.Dealing import DEALERS, DEFAULT_DEALER
+from ClueLess.Hashing import (
+    ACTIVE_KEYS,
+    HASH_MASK,
+    LOCATION_KEYS,
+    TURN_KEYS,
+    getSuggestionKey,
+)
 from ClueLess.Player import Player
+from ClueLess.Variant import VARIANT
 
 
 class Game:
     """
     The Clue-Less Game
 
-    The Game class acts as the Clue-Less game.
+    The Game class acts as the Clue-Less game. Its state is limited to the
+    attributes found in '__slots__' so that many games can be held in memory
+    at once.
 
     Attributes:
         players (list):
-            List of players in the game
+            List of players in the game, in the order of Cards.CHARACTERS
+        playersById (dict):
+            The seated players keyed by player ID
+        nextSeats (list):
+            The index of the next seated player after each player index
+        previousSeats (list):
+            The index of the previous seated player before each player index
+        activePlayerCount (integer):
+            The number of seated players who have not lost
         currentTurnIndex (integer):
             Index of the current turn's player
-        tilemap (list):
-            A 2D list representing the game board
         solution (tuple):
             The solution to the game in the form (character, weapon, room)
         log (string):
             A log message to output
         running (boolean):
             A flag to represent whether or not the Game is running
+        turnNumber (integer):
+            The number of turns made so far
+        lastSuggestion (tuple):
+            The last turn's suggestion in the form (suggester index,
+            suggestion, refuter index, shown card), or None
+        boardHash (integer):
+            The Zobrist hash of the player locations, the seated players
+            still in the game and the current turn index
+        historyHash (integer):
+            The sum of the keys of every suggestion made and who refuted it
+        seed (integer):
+            The seed of the game's random number generator
+        dealer (string):
+            The name of the dealing policy in ClueLess.DEALERS, or None if the
+            game was dealt by a dealer that isn't one
+        rng (random.Random):
+            The game's random number generator
+        clientPort (integer):
+            The port of the client a game update is sent to
     """
 
-    def __init__(self):
-        """Initializes a new Clue-Less game"""
+    __slots__ = [
+        "seed",
+        "dealer",
+        "rng",
+        "players",
+        "playersById",
+        "nextSeats",
+        "previousSeats",
+        "activePlayerCount",
+        "currentTurnIndex",
+        "solution",
+        "feedback",
+        "log",
+        "running",
+        "turnNumber",
+        "lastSuggestion",
+        "boardHash",
+        "historyHash",
+        "winner",
+        "finished",
+        "clientPort",
+    ]
+
+    # Index of each character's player
+    PLAYER_INDEX = {name: index for index, name in enumerate(Cards.CHARACTERS)}
+
+    # Secret passages in the form {move: (from room, to room)}
+    SHORTCUTS = VARIANT.shortcuts
+
+    def __init__(self, seed=None, dealer=DEFAULT_DEALER):
+        """
+        Initializes a new Clue-Less game
+
+        Parameters:
+            seed (integer):
+                The seed for the game's random number generator, picked at
+                random if not given
+            dealer (string):
+                The name of the dealing policy in ClueLess.DEALERS
+        """
+        # Random number generator (seeded so the game can be replayed)
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.dealer = dealer
+
         # Players
-        self.players = [
-            Player("MissScarlett"),
-            Player("ColonelMustard"),
-            Player("MrsWhite"),
-            Player("MrGreen"),
-            Player("MrsPeacock"),
-            Player("ProfessorPlum"),
-        ]
+        self.players = [Player(name) for name in Cards.CHARACTERS]
         self.currentTurnIndex = 0
 
-        # Tilemap
-        self.tilemap = [
-            [[], [], [], [], []],
-            [[], None, [], None, []],
-            [[], [], [], [], []],
-            [[], None, [], None, []],
-            [[], [], [], [], []],
-        ]
-        self.updateTilemap()
+        # Player lookups
+        self.playersById = {}
+        self.nextSeats = list(range(len(self.players)))
+        self.previousSeats = list(range(len(self.players)))
+        self.activePlayerCount = 0
 
         # The solution or "truth" set of cards
         self.solution = None
@@ -60,12 +131,87 @@ class Game:
         # Running
         self.running = False
 
+        # Turn history
+        self.turnNumber = 0
+        self.lastSuggestion = None
+
+        # Hash of the public game state
+        self.boardHash = 0
+        self.historyHash = 0
+        self.rehash()
+
         ############################
         # ADD GAME ATTRIBUTES HERE #
         ############################
         self.winner = None
         self.finished = False
 
+    def __getstate__(self):
+        """Gets the state to pickle, leaving out the random number generator"""
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != "rng" and hasattr(self, name)
+        }
+
+    def __setstate__(self, state):
+        """
+        Sets the state from an unpickled game
+
+        The random number generator is only used while starting the game, so
+        it is reseeded rather than sent along with every game update.
+
+        Parameters:
+            state (dict):
+                The unpickled state
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.rng = random.Random(self.seed)
+
+        if "boardHash" not in state:
+            # Saved before games were hashed, so the history is unknown
+            self.historyHash = 0
+            self.rehash()
+
+    @classmethod
+    def replay(cls, header, turns):
+        """
+        Replays a game from its header and turns
+
+        Parameters:
+            header (dict):
+                The game header from getHeader
+            turns (list):
+                The turns to make, in order
+        """
+        game = cls(header["seed"], header["dealer"])
+        game.updatePlayers(header["playerIds"])
+        game.start()
+
+        for turn in turns:
+            game.makeMove(turn)
+
+        return game
+
+    def getHeader(self):
+        """Gets the header needed to replay the game"""
+        if self.dealer is None:
+            raise ValueError("A game dealt by an unnamed dealer can't be replayed")
+        return {
+            "seed": self.seed,
+            "dealer": self.dealer,
+            "playerIds": [
+                player.getPlayerId()
+                for player in self.players
+                if player.getPlayerId() is not None
+            ],
+        }
+
+    def getSeed(self):
+        """Gets the seed"""
+        return self.seed
+
     def getPlayers(self):
         """Gets the players"""
         return self.players
@@ -77,83 +223,217 @@ class Game:
         Parameters:
             playerIds (list):
                 The updated list of player IDs
+
+        Returns whether any player's ID changed
         """
+        changed = False
         playerIdIndex = 0
         for player in self.players:
             # If there isn't a full game, set extra players to have no player ID
             if playerIdIndex >= len(playerIds):
                 # All players already assigned to a character
-                player.setPlayerId(None)
+                if player.playerId is not None:
+                    player.setPlayerId(None)
+                    changed = True
 
             elif player.playerId != playerIds[playerIdIndex]:
                 # Assign all players to characters in order
                 player.setPlayerId(playerIds[playerIdIndex])
-                player.lost = False
+                if self.solution is None:
+                    # Players reconnecting to a started game keep their state
+                    player.lost = False
+                changed = True
 
             playerIdIndex += 1
 
+        self.updateSeats()
+
+        return changed
+
+    def updateSeats(self):
+        """Rebuilds the player lookups and the ring of seated players"""
+        self.playersById = {
+            player.getPlayerId(): player
+            for player in self.players
+            if player.getPlayerId() is not None
+        }
+        self.activePlayerCount = sum(
+            1 for player in self.playersById.values() if not player.lost
+        )
+
+        seats = {
+            index
+            for index in range(len(self.players))
+            if self.players[index].getPlayerId() is not None
+        }
+        if not seats:
+            # Nobody is seated so every turn stays where it is
+            self.nextSeats = list(range(len(self.players)))
+            self.previousSeats = list(range(len(self.players)))
+            self.rehash()
+            return
+
+        # Walk backwards so each index points at the next seated index
+        nextSeat = min(seats)
+        for index in reversed(range(len(self.players))):
+            self.nextSeats[index] = nextSeat
+            if index in seats:
+                nextSeat = index
+
+        # Walk forwards so each index points at the previous seated index
+        previousSeat = max(seats)
+        for index in range(len(self.players)):
+            self.previousSeats[index] = previousSeat
+            if index in seats:
+                previousSeat = index
+
+        self.rehash()
+
+    def rehash(self):
+        """Recomputes the board hash from scratch"""
+        boardHash = TURN_KEYS[self.currentTurnIndex]
+        for index, player in enumerate(self.players):
+            boardHash ^= LOCATION_KEYS[index][player.locationIndex]
+            if player.getPlayerId() is not None and not player.lost:
+                boardHash ^= ACTIVE_KEYS[index]
+        self.boardHash = boardHash
+
+    def getHash(self):
+        """
+        Gets the hash of the public game state
+
+        The hash covers the player locations, the seated players still in the
+        game, the current turn index and the suggestions made so far, and it is
+        the same in every process.
+        """
+        return self.boardHash ^ self.historyHash
+
+    def moveToken(self, index, location):
+        """
+        Moves a player's token, keeping the board hash up to date
+
+        Parameters:
+            index (integer):
+                The index of the player
+            location (tuple):
+                The (row, column) to move to
+        """
+        player = self.players[index]
+        self.boardHash ^= LOCATION_KEYS[index][player.locationIndex]
+        player.setLocation(location)
+        self.boardHash ^= LOCATION_KEYS[index][player.locationIndex]
+
     def getTilemap(self):
-        """Gets the tilemap"""
-        return self.tilemap
-
-    def updateTilemap(self):
-        """Updates the tilemap based on the players"""
-        self.tilemap = [
-            [[], [], [], [], []],
-            [[], None, [], None, []],
-            [[], [], [], [], []],
-            [[], None, [], None, []],
-            [[], [], [], [], []],
+        """Gets a 2D list of the players at each location on the game board"""
+        tilemap = [
+            [None if name is None else [] for name in names]
+            for names in LOCATION_NAMES
         ]
 
         # Add each player to the tilemap
         for player in self.players:
-            row = player.location[0]
-            column = player.location[1]
-            self.tilemap[row][column].append(player)
+            row, column = player.getLocation()
+            tilemap[row][column].append(player)
 
-    def getSolution(self):
-        """Gets the solution"""
-        return self.solution
+        return tilemap
 
-    def pickSolution(self):
-        """Picks the solution of the game"""
-        self.solution = (
-            random.choice(Cards.CHARACTERS),
-            random.choice(Cards.WEAPONS),
-            random.choice(Cards.ROOMS),
-        )
+    def getDestination(self, location, move):
+        """
+        Gets where a move leads
 
-        # Demo Purposes
-        print(self.solution)
+        Parameters:
+            location (tuple):
+                The location the move is made from
+            move (string):
+                The direction of the move
+        """
+        (row, col) = location
+        if move == "UP":
+            return (row - 1, col)
+        elif move == "DOWN":
+            return (row + 1, col)
+        elif move == "RIGHT":
+            return (row, col + 1)
+        elif move == "LEFT":
+            return (row, col - 1)
+        elif move in self.SHORTCUTS:
+            (_, room) = self.SHORTCUTS[move]
+            return LOCATION_COORDINATES[Player.ROOM_LOCATIONS[room]]
+        return (row, col)
+
+    def getAvailableMoves(self, player=None):
+        """
+        Gets the moves a player can make on their turn
 
-    def distributeCards(self):
-        """Removes truth set, then distributes remaining cards to players"""
-        # Combines all of the cards
-        allCards = list(Cards.CHARACTERS + Cards.WEAPONS + Cards.ROOMS)
+        Parameters:
+            player (ClueLess.Player):
+                The player to move, or None for the current player
+        """
+        if player is None:
+            player = self.getCurrentPlayer()
+
+        tilemap = self.getTilemap()
+        (row, col) = player.getLocation()
+        inRoom = player.isInRoom()
+        available = set()
+
+        # Players can stay in a room but not in a hallway
+        if inRoom:
+            available.add("STAY")
+
+        for move in ("UP", "DOWN", "RIGHT", "LEFT"):
+            (toRow, toCol) = self.getDestination((row, col), move)
+            if not (0 <= toRow < len(tilemap) and 0 <= toCol < len(tilemap[0])):
+                # Off the board
+                continue
+            if tilemap[toRow][toCol] is None:
+                # Empty space
+                continue
+            if inRoom and len(tilemap[toRow][toCol]) != 0:
+                # Hallway is blocked
+                continue
+            available.add(move)
+
+        # Secret passages between the corner rooms
+        room = player.getRoom()
+        for move, (fromRoom, _) in self.SHORTCUTS.items():
+            if room == fromRoom:
+                available.add(move)
+
+        return available
 
-        # Remove the cards that are part of the solution
-        allCards = [card for card in allCards if card not in self.solution]
+    def getSolution(self):
+        """Gets the solution"""
+        return self.solution
 
-        playerIndex = 0
-        while len(allCards) > 0:
-            player = self.players[playerIndex]
+    def pickSolution(self, dealer):
+        """
+        Picks the solution of the game
 
-            # Only distribute to real players
-            if player.getPlayerId() is not None:
-                # Get a random card
-                card = random.choice(allCards)
+        Parameters:
+            dealer (ClueLess.Dealer):
+                The dealer to pick the solution with
+        """
+        self.solution = dealer.pickSolution(self.rng)
 
-                # Add the card to the player
-                playerCards = player.getCards()
-                playerCards.append(card)
-                player.setCards(playerCards)
+        # Demo Purposes
+        print(self.solution)
 
-                # Remove card from master list
-                allCards.remove(card)
+    def distributeCards(self, dealer):
+        """
+        Deals the cards that aren't in the solution to the seated players
 
-            # Increment player index
-            playerIndex = (playerIndex + 1) % len(self.players)
+        Parameters:
+            dealer (ClueLess.Dealer):
+                The dealer to deal the cards with
+        """
+        seats = [
+            index
+            for index, player in enumerate(self.players)
+            if player.getPlayerId() is not None
+        ]
+        for seat, hand in dealer.deal(self.rng, self.solution, seats).items():
+            self.players[seat].setCards(hand)
 
     def getLog(self):
         """Gets the log"""
@@ -191,9 +471,18 @@ class Game:
             playerId (integer)
                 The player ID to find
         """
-        for player in self.players:
-            if player.getPlayerId() == playerId:
-                return player
+        return self.playersById.get(playerId)
+
+    def findPlayerFromName(self, name):
+        """
+        Finds the player with the given character name
+
+        Parameters:
+            name (string)
+                The character name to find
+        """
+        index = self.PLAYER_INDEX.get(name)
+        return None if index is None else self.players[index]
 
     def getCurrentPlayer(self):
         """Returns the current player ID"""
@@ -201,45 +490,59 @@ class Game:
 
     def getPreviousPlayer(self):
         """Returns the previous player ID"""
-        turnIndex = self.currentTurnIndex
-        while True:
-            # Decrement turn index
-            turnIndex = (turnIndex - 1 + len(self.players)) % len(self.players)
+        return self.players[self.previousSeats[self.currentTurnIndex]]
 
-            if self.players[turnIndex].getPlayerId() is not None:
-                # Valid player was found
-                break
+    def losePlayer(self, player):
+        """
+        Marks a player as having lost the game
 
-        return self.players[turnIndex]
+        Parameters:
+            player (ClueLess.Player):
+                The player who lost
+        """
+        if not player.lost and player.getPlayerId() is not None:
+            self.activePlayerCount -= 1
+            self.boardHash ^= ACTIVE_KEYS[self.PLAYER_INDEX[player.getName()]]
+        player.lose()
 
     def nextPlayer(self):
         """Sets the current player ID to the next valid player"""
-        if all([player.lost for player in self.players]):
+        if self.activePlayerCount <= 0:
             self.finished = True
             self.gameOver(everyone_lost=True)
 
-        while True:
-            # Increment current player index
-            self.currentTurnIndex = (self.currentTurnIndex + 1) % len(self.players)
-
-            if self.getCurrentPlayer().getPlayerId() is not None:
-                # Valid player was found
-                return
+        self.boardHash ^= TURN_KEYS[self.currentTurnIndex]
+        self.currentTurnIndex = self.nextSeats[self.currentTurnIndex]
+        self.boardHash ^= TURN_KEYS[self.currentTurnIndex]
 
     def clearFeedback(self):
         """Clears the suggestion feedback"""
         self.feedback = ""
 
-    def start(self):
-        """Starts the game"""
+    def start(self, dealer=None):
+        """
+        Starts the game
+
+        Parameters:
+            dealer (ClueLess.Dealer):
+                The dealer to deal with instead of the game's dealing policy,
+                such as a ClueLess.FixedDealer in tests
+        """
         self.running = True
 
         if self.solution is None:
+            if dealer is None:
+                dealer = DEALERS[self.dealer]()
+            else:
+                # Only a named dealing policy can be replayed from the header
+                names = {policy: name for name, policy in DEALERS.items()}
+                self.dealer = names.get(type(dealer))
+
             # Randomly choose solution or "truth" cards
-            self.pickSolution()
+            self.pickSolution(dealer)
 
             # Distribute cards to players (without truth set)
-            self.distributeCards()
+            self.distributeCards(dealer)
 
     def stop(self):
         """Stops the game"""
@@ -255,12 +558,16 @@ class Game:
         Parameters:
             turn (ClueLess.Turn):
                 The turn to use to make the move
+
+        Returns whether the move was made
         """
         if (
             hasattr(turn, "playerId")
             and int(turn.playerId) == self.getCurrentPlayer().getPlayerId()
         ):
             # The turn came from the correct player
+            self.turnNumber += 1
+            self.lastSuggestion = None
 
             #######################
             # ADD TURN LOGIC HERE #
@@ -268,28 +575,16 @@ class Game:
             if hasattr(turn, "move"):
                 # Update player's current position
                 # NOTE: Only valid movements should be possible here, so we don't check
-                (row, col) = self.getCurrentPlayer().getLocation()
-                if getattr(turn, "move") == "UP":
-                    self.getCurrentPlayer().setLocation((row - 1, col))
-                elif getattr(turn, "move") == "DOWN":
-                    self.getCurrentPlayer().setLocation((row + 1, col))
-                elif getattr(turn, "move") == "RIGHT":
-                    self.getCurrentPlayer().setLocation((row, col + 1))
-                elif getattr(turn, "move") == "LEFT":
-                    self.getCurrentPlayer().setLocation((row, col - 1))
-                elif getattr(turn, "move") == "NW":
-                    self.getCurrentPlayer().setRoom("Study")
-                elif getattr(turn, "move") == "NE":
-                    self.getCurrentPlayer().setRoom("Lounge")
-                elif getattr(turn, "move") == "SE":
-                    self.getCurrentPlayer().setRoom("Kitchen")
-                elif getattr(turn, "move") == "SW":
-                    self.getCurrentPlayer().setRoom("Conservatory")
+                self.moveToken(
+                    self.currentTurnIndex,
+                    self.getDestination(
+                        self.getCurrentPlayer().getLocation(), getattr(turn, "move")
+                    ),
+                )
 
                 # Log that the player made the move
                 self.log = (
-                    self.findPlayerFromId(turn.playerId).getName()
-                    + " successfully made a move"
+                    self.getCurrentPlayer().getName() + " successfully made a move"
                 )
 
             if hasattr(turn, "accusation"):
@@ -302,70 +597,94 @@ class Game:
 
                     self.feedback = "Correct! You win!"
                     self.finished = True
-                    self.updateTilemap()
                     # Move to the next player
                     self.nextPlayer()
-                    return
+                    return True
 
                 else:
                     self.feedback = "Incorrect! You lose!"
-                    self.getCurrentPlayer().lose()
-                    self.updateTilemap()
+                    self.losePlayer(self.getCurrentPlayer())
                     # Move to the next player
                     self.nextPlayer()
-                    return
+                    return True
 
             if hasattr(turn, "suggestion"):
                 (suspect, weapon, room) = getattr(turn, "suggestion")
-                for player in self.players:
-                    if player.getName() == suspect:
-                        player.setRoom(room)
+                if room in Player.ROOM_LOCATIONS:
+                    self.moveToken(
+                        self.PLAYER_INDEX[suspect],
+                        LOCATION_COORDINATES[Player.ROOM_LOCATIONS[room]],
+                    )
 
                 self.log = f"SUGGESTION: {suspect}, {weapon}, {room}."
 
                 # Suggestion results    ``
                 self.feedback = "No other players have any suggested cards."
+                refuterIndex = None
+                shownCard = None
+
+                # Loop through the seated players starting at the next player
+                # and excluding the current player to search for suggestion cards
+                seat = self.currentTurnIndex
+                for _ in range(len(self.playersById)):
+                    seat = self.nextSeats[seat]
+                    if seat == self.currentTurnIndex:
+                        # Back around to the current player
+                        break
 
-                # Loop through all players starting at the next player and
-                # excluding the current player to search for suggestion cards
-                for player in (
-                    self.players[self.currentTurnIndex + 1 :]
-                    + self.players[0 : self.currentTurnIndex]
-                ):
-                    playerCards = player.getCards()
+                    player = self.players[seat]
 
                     # Look for room first so the player knows to move rooms
-                    if room in playerCards:
+                    if player.hasCard(room):
                         # Player has the room card
                         self.feedback = (
                             f"RESULT: {player.getName()} has the {room} card."
                         )
+                        refuterIndex = seat
+                        shownCard = room
                         break
 
-                    elif weapon in playerCards:
+                    elif player.hasCard(weapon):
                         # Player has the weapon card
                         self.feedback = (
                             f"RESULT: {player.getName()} has the {weapon} card."
                         )
+                        refuterIndex = seat
+                        shownCard = weapon
                         break
 
-                    elif suspect in playerCards:
+                    elif player.hasCard(suspect):
                         # Player has the suspect card
                         self.feedback = (
                             f"RESULT: {player.getName()} has the {suspect} card."
                         )
+                        refuterIndex = seat
+                        shownCard = suspect
                         break
+
+                self.lastSuggestion = (
+                    self.currentTurnIndex,
+                    (suspect, weapon, room),
+                    refuterIndex,
+                    shownCard,
+                )
+
+                # Suggestions are added so the order they were made in is ignored
+                suggestionKey = getSuggestionKey(
+                    self.currentTurnIndex, (suspect, weapon, room), refuterIndex
+                )
+                self.historyHash = (self.historyHash + suggestionKey) & HASH_MASK
             else:
                 # Suggestion is not made
                 self.feedback = ""
 
-            self.updateTilemap()
             # Move to the next player
             self.nextPlayer()
+            return True
 
         else:
             # The turn came from the wrong player
-            pass
+            return False
 
 
 class Turn:
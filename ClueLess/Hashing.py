@@ -0,0 +1,152 @@
+"""Hashing for the Clue-Less Application"""
+
+import random
+from collections import OrderedDict
+
+from ClueLess.Cards import Cards
+from ClueLess.Constants import BOARD_SIZE
+
+# Fixed seed so hashes are the same in every process and on every run
+ZOBRIST_SEED = 0x436C7565
+HASH_MASK = (1 << 64) - 1
+
+
+def mixKey(value):
+    """
+    Mixes an integer into a random-looking 64-bit key (SplitMix64)
+
+    Parameters:
+        value (integer):
+            The integer to mix
+    """
+    value = (value + 0x9E3779B97F4A7C15) & HASH_MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & HASH_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & HASH_MASK
+    return value ^ (value >> 31)
+
+
+def getKeys():
+    """
+    Gets the random keys of the public game state features
+
+    Returns the keys of each player at each location (indexed by [player]
+    [location]), of each seated player still in the game and of each current
+    turn index
+    """
+    rng = random.Random(ZOBRIST_SEED)
+    playerCount = len(Cards.CHARACTERS)
+    locationKeys = tuple(
+        tuple(rng.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE))
+        for _ in range(playerCount)
+    )
+    activeKeys = tuple(rng.getrandbits(64) for _ in range(playerCount))
+    turnKeys = tuple(rng.getrandbits(64) for _ in range(playerCount))
+
+    return (locationKeys, activeKeys, turnKeys)
+
+
+LOCATION_KEYS, ACTIVE_KEYS, TURN_KEYS = getKeys()
+
+
+def getSuggestionKey(suggesterIndex, suggestion, refuterIndex):
+    """
+    Gets the key of a suggestion and who refuted it
+
+    There are too many combinations to keep a table of keys for large
+    variants, so the key is mixed from the combination's index instead.
+
+    Parameters:
+        suggesterIndex (integer):
+            The index of the player who made the suggestion
+        suggestion (tuple):
+            The suggestion in the form (suspect, weapon, room)
+        refuterIndex (integer):
+            The index of the player who refuted it, or None
+    """
+    if refuterIndex is None:
+        refuterIndex = len(Cards.CHARACTERS)
+    index = suggesterIndex
+    for card in suggestion:
+        index = index * len(Cards.ALL) + Cards.INDEX[card]
+    index = index * (len(Cards.CHARACTERS) + 1) + refuterIndex
+    return mixKey(index ^ (ZOBRIST_SEED << 32))
+
+
+class TranspositionCache:
+    """
+    A Transposition Cache
+
+    The TranspositionCache class holds search results keyed by state hash,
+    so a search can pick up results for a state it reached before. Once
+    full, the least recently used entry is dropped.
+
+    Attributes:
+        maxSize (integer):
+            The most entries held at once
+        entries (collections.OrderedDict):
+            The cached values, least recently used first
+        hits (integer):
+            The number of lookups that found a value
+        misses (integer):
+            The number of lookups that didn't
+    """
+
+    __slots__ = ["maxSize", "entries", "hits", "misses"]
+
+    def __init__(self, maxSize=4096):
+        """
+        Initializes a new cache
+
+        Parameters:
+            maxSize (integer):
+                The most entries held at once
+        """
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, default=None):
+        """
+        Gets a cached value and marks it as recently used
+
+        Parameters:
+            key (hashable):
+                The key of the value
+            default (object):
+                The value to return if the key isn't cached
+        """
+        value = self.entries.get(key, self)
+        if value is self:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Caches a value, dropping the least recently used value if full
+
+        Parameters:
+            key (hashable):
+                The key of the value
+            value (object):
+                The value to cache
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Removes every cached value"""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
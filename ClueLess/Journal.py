@@ -0,0 +1,284 @@
+"""Journal for the Clue-Less Application"""
+
+import pickle
+import struct
+
+from ClueLess.Cards import Cards
+from ClueLess.Game import Game, Turn
+
+# Movement directions in the order they are encoded (0 means no move)
+MOVES = (None, "UP", "DOWN", "RIGHT", "LEFT", "STAY", "NW", "NE", "SE", "SW")
+MOVE_INDEX = {move: index for index, move in enumerate(MOVES)}
+
+# Marker for a missing card or player index
+NONE = 0xFF
+
+# Outcome flags
+LOST = 0x01
+FINISHED = 0x02
+
+# Turn number, player ID, move, suggestion, accusation, refuter, shown card,
+# outcome flags
+RECORD = struct.Struct("<Iq B 3B 3B B B B")
+
+
+def encodeCards(cards):
+    """
+    Encodes a (character, weapon, room) tuple as three card indices
+
+    Parameters:
+        cards (tuple):
+            The cards to encode, or None
+    """
+    if cards is None:
+        return (NONE, NONE, NONE)
+    return tuple(Cards.INDEX[card] for card in cards)
+
+
+def decodeCards(indices):
+    """
+    Decodes three card indices into a (character, weapon, room) tuple
+
+    Parameters:
+        indices (tuple):
+            The card indices to decode
+    """
+    if indices[0] == NONE:
+        return None
+    return tuple(Cards.ALL[index] for index in indices)
+
+
+def encodeRecord(turn, game):
+    """
+    Encodes a turn and its outcome as a binary record
+
+    Parameters:
+        turn (ClueLess.Turn):
+            The turn that was made
+        game (ClueLess.Game):
+            The game after the turn was made
+    """
+    suggestion = getattr(turn, "suggestion", None)
+    refuterIndex = NONE
+    shownCard = NONE
+    if suggestion is not None and game.lastSuggestion is not None:
+        if game.lastSuggestion[2] is not None:
+            refuterIndex = game.lastSuggestion[2]
+            shownCard = Cards.INDEX[game.lastSuggestion[3]]
+
+    flags = 0
+    if game.findPlayerFromId(int(turn.playerId)).lost:
+        flags |= LOST
+    if game.finished:
+        flags |= FINISHED
+
+    return RECORD.pack(
+        game.turnNumber,
+        int(turn.playerId),
+        MOVE_INDEX[getattr(turn, "move", None)],
+        *encodeCards(suggestion),
+        *encodeCards(getattr(turn, "accusation", None)),
+        refuterIndex,
+        shownCard,
+        flags,
+    )
+
+
+class JournalRecord:
+    """
+    A Record in a Clue-Less Journal
+
+    The JournalRecord class acts as a single decoded turn and its outcome.
+
+    Attributes:
+        turnNumber (integer):
+            The game's turn number after the turn was made
+        turn (ClueLess.Turn):
+            The turn that was made
+        refuterIndex (integer):
+            The index of the player who refuted the suggestion, or None
+        shownCard (string):
+            The card shown to refute the suggestion, or None
+        lost (boolean):
+            Whether the player lost on this turn
+        finished (boolean):
+            Whether the game finished on this turn
+    """
+
+    __slots__ = ["turnNumber", "turn", "refuterIndex", "shownCard", "lost", "finished"]
+
+    def __init__(self, data):
+        """
+        Initializes a record by decoding it
+
+        Parameters:
+            data (bytes):
+                The binary record
+        """
+        fields = RECORD.unpack(data)
+        self.turnNumber = fields[0]
+
+        self.turn = Turn(playerId=fields[1])
+        if fields[2]:
+            self.turn.move = MOVES[fields[2]]
+        suggestion = decodeCards(fields[3:6])
+        if suggestion is not None:
+            self.turn.suggestion = suggestion
+        accusation = decodeCards(fields[6:9])
+        if accusation is not None:
+            self.turn.accusation = accusation
+
+        self.refuterIndex = None if fields[9] == NONE else fields[9]
+        self.shownCard = None if fields[10] == NONE else Cards.ALL[fields[10]]
+        self.lost = bool(fields[11] & LOST)
+        self.finished = bool(fields[11] & FINISHED)
+
+
+class Journal:
+    """
+    The Journal of a Clue-Less Game
+
+    The Journal class keeps an append-only history of the turns made in a
+    game, stored as fixed-size binary records, along with pickled snapshots of
+    the full game taken every few turns. A game can be rebuilt at any turn by
+    loading the nearest snapshot and replaying the turns after it.
+
+    Attributes:
+        header (dict):
+            The header of the game (see ClueLess.Game.getHeader)
+        records (bytearray):
+            The binary turn records, one after another
+        snapshots (dict):
+            The pickled games keyed by their turn number
+        snapshotInterval (integer):
+            The number of turns between automatic snapshots
+        gameId (string):
+            The ID of the game in its store, if it is stored
+        store (ClueLess.GameStore):
+            The store that records and snapshots are saved to, if any
+    """
+
+    def __init__(self, header, snapshotInterval=10):
+        """
+        Initializes a new journal
+
+        Parameters:
+            header (dict):
+                The header of the game
+            snapshotInterval (integer):
+                The number of turns between automatic snapshots
+        """
+        self.header = header
+        self.records = bytearray()
+        self.snapshots = {}
+        self.snapshotInterval = snapshotInterval
+        self.gameId = None
+        self.store = None
+
+    def __len__(self):
+        """Gets the number of records"""
+        return len(self.records) // RECORD.size
+
+    def record(self, turn, game):
+        """
+        Records a turn that was made in the game
+
+        A snapshot is also taken every snapshotInterval turns.
+
+        Parameters:
+            turn (ClueLess.Turn):
+                The turn that was made
+            game (ClueLess.Game):
+                The game after the turn was made
+
+        Returns the binary record
+        """
+        data = encodeRecord(turn, game)
+        self.records += data
+        if self.store is not None:
+            self.store.append(self.gameId, data)
+
+        if game.turnNumber % self.snapshotInterval == 0:
+            self.snapshot(game)
+
+        return data
+
+    def snapshot(self, game):
+        """
+        Takes a snapshot of the game
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to take a snapshot of
+
+        Returns the pickled game
+        """
+        data = pickle.dumps(game)
+        self.snapshots[game.turnNumber] = data
+        if self.store is not None:
+            self.store.saveSnapshot(self.gameId, game.turnNumber, data)
+        return data
+
+    def getRecords(self, afterTurnNumber=0, uptoTurnNumber=None):
+        """
+        Gets the decoded records within a range of turn numbers
+
+        Parameters:
+            afterTurnNumber (integer):
+                Only records after this turn number are returned
+            uptoTurnNumber (integer):
+                Only records up to and including this turn number are returned
+        """
+        records = []
+        for offset in range(0, len(self.records), RECORD.size):
+            record = JournalRecord(self.records[offset : offset + RECORD.size])
+            if record.turnNumber <= afterTurnNumber:
+                continue
+            if uptoTurnNumber is not None and record.turnNumber > uptoTurnNumber:
+                break
+            records.append(record)
+        return records
+
+    def getSnapshot(self, turnNumber=None):
+        """
+        Gets the nearest snapshot at or before a turn number
+
+        Parameters:
+            turnNumber (integer):
+                The turn number to look for, or None for the latest
+
+        Returns a (turn number, pickled game) tuple, or None
+        """
+        turnNumbers = [
+            snapshotTurnNumber
+            for snapshotTurnNumber in self.snapshots
+            if turnNumber is None or snapshotTurnNumber <= turnNumber
+        ]
+        if not turnNumbers:
+            return None
+
+        nearest = max(turnNumbers)
+        return (nearest, self.snapshots[nearest])
+
+    def rebuild(self, turnNumber=None):
+        """
+        Rebuilds the game as it was after a turn
+
+        Parameters:
+            turnNumber (integer):
+                The turn number to rebuild, or None for the latest
+        """
+        snapshot = self.getSnapshot(turnNumber)
+        if snapshot is None:
+            # Replay the whole game from its header
+            return Game.replay(
+                self.header,
+                [record.turn for record in self.getRecords(0, turnNumber)],
+            )
+
+        (snapshotTurnNumber, data) = snapshot
+        game = pickle.loads(data)
+        for record in self.getRecords(snapshotTurnNumber, turnNumber):
+            game.makeMove(record.turn)
+
+        return game
@@ -0,0 +1,800 @@
+"""Monte Carlo Tree Search for the Clue-Less Application"""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ClueLess.Board import NEIGHBORS, ROOM_CARDS
+from ClueLess.Bots import Strategy
+from ClueLess.Cards import Cards
+from ClueLess.Deduction import (
+    ALL_CARDS,
+    CARD_BITS,
+    CATEGORY_BITS,
+    SOLUTION,
+    countBits,
+)
+from ClueLess.Game import Turn
+from ClueLess.Hashing import TranspositionCache
+
+# Card index ranges of each category in Cards.ALL
+CHARACTER_INDICES = range(0, len(Cards.CHARACTERS))
+WEAPON_INDICES = range(
+    len(Cards.CHARACTERS), len(Cards.CHARACTERS) + len(Cards.WEAPONS)
+)
+
+
+class CompactState:
+    """
+    A Compact Clue-Less Game State
+
+    The CompactState class holds one determinization of a game (every hand and
+    the solution filled in) as small integers and bitmasks, so it can be copied
+    and played out quickly during a search. Each player's knowledge is reduced
+    to the cards they have seen and the solution cards they have worked out.
+
+    Attributes:
+        locations (list):
+            The location index of each player
+        hands (list):
+            The card bitmask of each player's hand
+        seen (list):
+            The bitmask of cards each player knows aren't the solution
+        solved (list):
+            The bitmask of cards each player knows are the solution
+        solution (integer):
+            The bitmask of the solution cards
+        nextSeats (list):
+            The index of the next seated player after each player index
+        current (integer):
+            The index of the current player
+        lost (integer):
+            The bitmask of players who have lost
+        seated (integer):
+            The bitmask of seated players
+        winner (integer):
+            The index of the winning player, or None
+        finished (boolean):
+            Whether the game is over
+        turns (integer):
+            The number of turns played
+    """
+
+    __slots__ = [
+        "locations",
+        "hands",
+        "seen",
+        "solved",
+        "solution",
+        "nextSeats",
+        "current",
+        "lost",
+        "seated",
+        "winner",
+        "finished",
+        "turns",
+    ]
+
+    def copy(self):
+        """Gets a copy of the state"""
+        state = CompactState.__new__(CompactState)
+        state.locations = self.locations[:]
+        state.hands = self.hands
+        state.seen = self.seen[:]
+        state.solved = self.solved[:]
+        state.solution = self.solution
+        state.nextSeats = self.nextSeats
+        state.current = self.current
+        state.lost = self.lost
+        state.seated = self.seated
+        state.winner = self.winner
+        state.finished = self.finished
+        state.turns = self.turns
+        return state
+
+    def getMoves(self, player):
+        """
+        Gets the (move, destination) pairs a player can make
+
+        Parameters:
+            player (integer):
+                The index of the player
+        """
+        location = self.locations[player]
+        inRoom = ROOM_CARDS[location] is not None
+        moves = [("STAY", location)] if inRoom else []
+        for move, destination in NEIGHBORS[location]:
+            if (
+                inRoom
+                and ROOM_CARDS[destination] is None
+                and destination in self.locations
+            ):
+                # Hallway is blocked
+                continue
+            moves.append((move, destination))
+        return moves
+
+    def getAccusation(self, player):
+        """
+        Gets the solution if a player has worked it out, otherwise None
+
+        Parameters:
+            player (integer):
+                The index of the player
+        """
+        accusation = 0
+        for category in CATEGORY_BITS:
+            cards = self.solved[player] & category or ~self.seen[player] & category
+            if not cards or cards & (cards - 1):
+                return None
+            accusation |= cards
+        return accusation
+
+    def apply(self, player, move, destination, suggestion=None, accusation=None):
+        """
+        Makes a player's turn
+
+        Parameters:
+            player (integer):
+                The index of the player
+            move (string):
+                The move made, or None to not move
+            destination (integer):
+                The location the move leads to
+            suggestion (tuple):
+                The (suspect, weapon) card indices suggested in the room
+            accusation (integer):
+                The bitmask of accused cards
+        """
+        self.turns += 1
+        if move is not None:
+            self.locations[player] = destination
+
+        if accusation is not None:
+            if accusation == self.solution:
+                self.winner = player
+                self.finished = True
+            else:
+                self.lost |= 1 << player
+                if self.lost & self.seated == self.seated:
+                    self.finished = True
+            self.current = self.nextSeats[self.current]
+            return
+
+        if suggestion is not None:
+            (suspect, weapon) = suggestion
+            room = ROOM_CARDS[self.locations[player]]
+            # Characters are in the same order as the players
+            self.locations[suspect] = self.locations[player]
+
+            # Refuters show the room first, then the weapon, then the suspect
+            seat = self.nextSeats[player]
+            shown = None
+            while seat != player:
+                hand = self.hands[seat]
+                for card in (room, weapon, suspect):
+                    if hand & (1 << card):
+                        shown = card
+                        break
+                if shown is not None:
+                    break
+                seat = self.nextSeats[seat]
+
+            if shown is not None:
+                self.seen[player] |= 1 << shown
+            else:
+                # Nobody else holds them, so the ones not in hand are the solution
+                cards = (1 << suspect) | (1 << weapon) | (1 << room)
+                self.solved[player] |= cards & ~self.hands[player]
+
+        self.current = self.nextSeats[self.current]
+
+    def playTurn(self, rng):
+        """
+        Makes the current player's turn with a fast playout policy
+
+        Players accuse as soon as they have worked out the solution, prefer
+        moves into rooms they haven't seen and suggest cards they haven't seen.
+
+        Parameters:
+            rng (random.Random):
+                The random number generator of the playout
+        """
+        player = self.current
+        if self.lost & (1 << player):
+            # Players who lost still take turns but only pass them on
+            self.apply(player, None, None)
+            return
+
+        accusation = self.getAccusation(player)
+        if accusation is not None:
+            self.apply(player, None, None, accusation=accusation)
+            return
+
+        moves = self.getMoves(player)
+        if not moves:
+            self.apply(player, None, None)
+            return
+        unseen = ~self.seen[player]
+        intoRooms = [
+            (move, destination)
+            for move, destination in moves
+            if ROOM_CARDS[destination] is not None
+            and unseen & (1 << ROOM_CARDS[destination])
+        ]
+        (move, destination) = rng.choice(intoRooms or moves)
+        if ROOM_CARDS[destination] is None:
+            self.apply(player, move, destination)
+            return
+
+        suspects = [card for card in CHARACTER_INDICES if unseen & (1 << card)]
+        weapons = [card for card in WEAPON_INDICES if unseen & (1 << card)]
+        suggestion = (
+            rng.choice(suspects or CHARACTER_INDICES),
+            rng.choice(weapons or WEAPON_INDICES),
+        )
+        self.apply(player, move, destination, suggestion)
+
+    def getReward(self, player):
+        """
+        Gets a player's reward for the state
+
+        A finished game is worth 1 to the winner. Otherwise the reward is split
+        between the players still in the game who know the most cards.
+
+        Parameters:
+            player (integer):
+                The index of the player
+        """
+        if self.finished:
+            return 1.0 if self.winner == player else 0.0
+        if self.lost & (1 << player):
+            return 0.0
+
+        progress = {}
+        for index in range(len(self.hands)):
+            if self.seated & ~self.lost & (1 << index):
+                progress[index] = countBits(
+                    (self.seen[index] | self.solved[index]) & ALL_CARDS
+                )
+        best = max(progress.values())
+        if progress[player] < best:
+            return 0.0
+        return 1.0 / sum(1 for known in progress.values() if known == best)
+
+
+def sampleDeal(knowledge, rng, attempts=100):
+    """
+    Samples hands and a solution consistent with a player's knowledge
+
+    Cards whose owner is known stay with their owner and the rest are shuffled
+    into the remaining seats of each hand, retrying until the deal keeps every
+    refutation clause.
+
+    Parameters:
+        knowledge (ClueLess.KnowledgeBase):
+            The knowledge to sample from
+        rng (random.Random):
+            The random number generator
+        attempts (integer):
+            The number of deals to try before accepting an inconsistent one
+
+    Returns the hand bitmasks and the solution bitmask
+    """
+    owners = [knowledge.getOwner(card) for card in Cards.ALL]
+    free = [index for index, owner in enumerate(owners) if owner is None]
+    slots = []
+    for owner in range(SOLUTION):
+        emptySeats = knowledge.handSizes[owner] - countBits(knowledge.known[owner])
+        slots += [owner] * emptySeats
+
+    for _ in range(attempts):
+        hands = [knowledge.known[owner] for owner in range(SOLUTION)]
+        solution = knowledge.known[SOLUTION]
+        remaining = free[:]
+        for category in CATEGORY_BITS:
+            if solution & category:
+                continue
+            choices = [
+                index
+                for index in remaining
+                if (1 << index) & category & knowledge.possible[SOLUTION]
+            ]
+            if not choices:
+                break
+            card = rng.choice(choices)
+            solution |= 1 << card
+            remaining.remove(card)
+
+        rng.shuffle(remaining)
+        consistent = len(remaining) == len(slots)
+        for card, owner in zip(remaining, slots):
+            hands[owner] |= 1 << card
+            if not knowledge.possible[owner] & (1 << card):
+                consistent = False
+
+        if consistent:
+            consistent = all(hands[owner] & bits for owner, bits in knowledge.clauses)
+        if consistent:
+            break
+
+    return (hands, solution)
+
+
+class SearchNode:
+    """
+    A Node in a Monte Carlo search tree
+
+    Each node is a decision of the searching player, reached by taking an
+    action from its parent. Other players' turns between decisions are
+    played out rather than stored, so a node stands for every game state the
+    player can't tell apart.
+
+    Attributes:
+        children (dict):
+            The child nodes keyed by action
+        visits (integer):
+            The number of playouts through the node
+        wins (float):
+            The total reward of the playouts through the node
+        available (integer):
+            The number of times the node's action could have been chosen
+    """
+
+    __slots__ = ["children", "visits", "wins", "available"]
+
+    def __init__(self):
+        """Initializes a new node"""
+        self.children = {}
+        self.visits = 0
+        self.wins = 0.0
+        self.available = 0
+
+    def select(self, actions, rng, exploration):
+        """
+        Selects the action to take from this node
+
+        Untried actions are expanded first, otherwise the child with the best
+        upper confidence bound among the available actions is picked.
+
+        Parameters:
+            actions (list):
+                The actions available in the current determinization
+            rng (random.Random):
+                The random number generator
+            exploration (float):
+                The exploration constant
+
+        Returns the action, its child node and whether the child is new
+        """
+        untried = [action for action in actions if action not in self.children]
+        if untried:
+            action = rng.choice(untried)
+            child = SearchNode()
+            self.children[action] = child
+            for other in actions:
+                if other in self.children:
+                    self.children[other].available += 1
+            return (action, child, True)
+
+        best = None
+        bestScore = -1.0
+        for action in actions:
+            child = self.children[action]
+            child.available += 1
+            score = child.wins / child.visits + exploration * math.sqrt(
+                math.log(child.available) / child.visits
+            )
+            if score > bestScore:
+                (best, bestScore) = (action, score)
+        return (best, self.children[best], False)
+
+    def getStatistics(self):
+        """Gets the (visits, wins) of each child keyed by action"""
+        return {
+            action: (child.visits, child.wins)
+            for action, child in self.children.items()
+        }
+
+
+class Search:
+    """
+    An Information Set Monte Carlo Tree Search
+
+    The Search class chooses a player's turn by repeatedly sampling a deal
+    consistent with the player's knowledge, walking down the tree of the
+    player's decisions, and playing the rest of the game out with the
+    CompactState playout policy.
+
+    Attributes:
+        playerIndex (integer):
+            The index of the searching player
+        start (ClueLess.CompactState):
+            The public state of the game, without hands or a solution
+        knowledge (ClueLess.KnowledgeBase):
+            What the searching player has deduced
+        root (ClueLess.SearchNode):
+            The root of the search tree
+        rng (random.Random):
+            The random number generator
+        exploration (float):
+            The exploration constant
+        horizon (integer):
+            The number of turns a playout lasts before it is scored
+        iterations (integer):
+            The number of playouts run so far
+    """
+
+    def __init__(
+        self, game, knowledge, root=None, seed=None, exploration=0.7, horizon=60
+    ):
+        """
+        Initializes a new search
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to search, on the searching player's turn
+            knowledge (ClueLess.KnowledgeBase):
+                What the searching player has deduced
+            root (ClueLess.SearchNode):
+                A tree to reuse from an earlier search
+            seed (integer):
+                The seed for the random number generator
+            exploration (float):
+                The exploration constant
+            horizon (integer):
+                The number of turns a playout lasts before it is scored
+        """
+        self.playerIndex = knowledge.playerIndex
+        self.knowledge = knowledge
+        self.root = root if root is not None else SearchNode()
+        self.rng = random.Random(seed)
+        self.exploration = exploration
+        self.horizon = horizon
+        self.iterations = 0
+
+        state = CompactState.__new__(CompactState)
+        state.locations = [player.locationIndex for player in game.players]
+        state.hands = None
+        state.seen = [0] * len(game.players)
+        state.solved = [0] * len(game.players)
+        state.seen[self.playerIndex] = ~knowledge.possible[SOLUTION]
+        state.solved[self.playerIndex] = knowledge.known[SOLUTION]
+        state.solution = 0
+        state.nextSeats = game.nextSeats[:]
+        state.current = game.currentTurnIndex
+        state.lost = 0
+        state.seated = 0
+        for index, player in enumerate(game.players):
+            if player.getPlayerId() is not None:
+                state.seated |= 1 << index
+                if player.lost:
+                    state.lost |= 1 << index
+        state.winner = None
+        state.finished = False
+        state.turns = 0
+        self.start = state
+
+        # Accusing a guess is only worth searching once few candidates remain
+        candidates = knowledge.getCandidates()
+        self.guesses = []
+        if len(candidates) <= 3:
+            for candidate in candidates:
+                bits = 0
+                for card in candidate:
+                    bits |= CARD_BITS[card]
+                self.guesses.append(bits)
+
+    def getActions(self, state, isRoot):
+        """
+        Gets the searching player's actions in a state
+
+        Actions are (move, suspect, weapon) tuples, with suspect and weapon set
+        to None for moves into hallways, or ("ACCUSE", cards) tuples.
+
+        Parameters:
+            state (ClueLess.CompactState):
+                The state to act in
+            isRoot (boolean):
+                Whether the state is the real game state
+        """
+        player = self.playerIndex
+        accusation = state.getAccusation(player)
+        if accusation is not None:
+            return [("ACCUSE", accusation)]
+
+        actions = []
+        if isRoot:
+            actions += [("ACCUSE", guess) for guess in self.guesses]
+
+        unseen = ~state.seen[player]
+        suspects = [card for card in CHARACTER_INDICES if unseen & (1 << card)]
+        weapons = [card for card in WEAPON_INDICES if unseen & (1 << card)]
+        for move, destination in state.getMoves(player):
+            if ROOM_CARDS[destination] is None:
+                actions.append((move, None, None))
+                continue
+            for suspect in suspects or CHARACTER_INDICES:
+                for weapon in weapons or WEAPON_INDICES:
+                    actions.append((move, suspect, weapon))
+        return actions
+
+    def applyAction(self, state, action):
+        """
+        Makes the searching player's turn
+
+        Parameters:
+            state (ClueLess.CompactState):
+                The state to act in
+            action (tuple):
+                The action to take
+        """
+        player = self.playerIndex
+        if action[0] == "ACCUSE":
+            state.apply(player, None, None, accusation=action[1])
+            return
+
+        (move, suspect, weapon) = action
+        destination = dict(state.getMoves(player))[move]
+        suggestion = None if suspect is None else (suspect, weapon)
+        state.apply(player, move, destination, suggestion)
+
+    def iterate(self):
+        """Runs one playout"""
+        rng = self.rng
+        state = self.start.copy()
+        (state.hands, state.solution) = sampleDeal(self.knowledge, rng)
+
+        # Other players only know their own hand in the sample
+        for index in range(len(state.hands)):
+            if index != self.playerIndex:
+                state.seen[index] = state.hands[index]
+
+        path = [self.root]
+        node = self.root
+        isRoot = True
+        expanded = False
+        while not state.finished and state.turns < self.horizon:
+            if (
+                state.current != self.playerIndex
+                or state.lost & (1 << self.playerIndex)
+                or expanded
+            ):
+                state.playTurn(rng)
+                continue
+
+            actions = self.getActions(state, isRoot)
+            (action, node, expanded) = node.select(actions, rng, self.exploration)
+            path.append(node)
+            self.applyAction(state, action)
+            isRoot = False
+
+        reward = state.getReward(self.playerIndex)
+        for visited in path:
+            visited.visits += 1
+            visited.wins += reward
+        self.iterations += 1
+
+    def run(self, deadline=None, iterations=None):
+        """
+        Runs playouts until the deadline or the number of iterations
+
+        At least one playout is always run.
+
+        Parameters:
+            deadline (float):
+                The time.monotonic() time to stop at, if any
+            iterations (integer):
+                The number of playouts to run, if any
+        """
+        while True:
+            self.iterate()
+            if iterations is not None and self.iterations >= iterations:
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            if deadline is None and iterations is None:
+                return
+
+    def getBestAction(self, statistics=None):
+        """
+        Gets the most visited action at the root
+
+        Parameters:
+            statistics (dict):
+                The (visits, wins) of each root action, if merged from
+                several searches
+        """
+        if statistics is None:
+            statistics = self.root.getStatistics()
+        # A reused tree can hold actions that aren't available any more
+        actions = [
+            action
+            for action in self.getActions(self.start, True)
+            if action in statistics
+        ]
+        return max(actions, key=lambda action: statistics[action])
+
+    def getTurn(self, action):
+        """
+        Converts a root action to a turn
+
+        Parameters:
+            action (tuple):
+                The action to convert
+        """
+        if action[0] == "ACCUSE":
+            return Turn(
+                accusation=tuple(
+                    Cards.ALL[index]
+                    for index in range(len(Cards.ALL))
+                    if action[1] & (1 << index)
+                )
+            )
+
+        (move, suspect, weapon) = action
+        turn = Turn(move=move)
+        if suspect is not None:
+            destination = dict(self.start.getMoves(self.playerIndex))[move]
+            turn.suggestion = (
+                Cards.ALL[suspect],
+                Cards.ALL[weapon],
+                Cards.ALL[ROOM_CARDS[destination]],
+            )
+        return turn
+
+
+def runSearch(game, knowledge, seed, budget, iterations):
+    """
+    Runs an independent search, for root-parallel search in another process
+
+    Parameters:
+        game (ClueLess.Game):
+            The game to search
+        knowledge (ClueLess.KnowledgeBase):
+            What the searching player has deduced
+        seed (integer):
+            The seed of the search
+        budget (float):
+            The number of seconds to search for
+        iterations (integer):
+            The number of playouts to run, if any
+
+    Returns the (visits, wins) of each root action
+    """
+    search = Search(game, knowledge, seed=seed)
+    search.run(time.monotonic() + budget if budget else None, iterations)
+    return search.root.getStatistics()
+
+
+class MCTSStrategy(Strategy):
+    """
+    A Strategy that searches with information set Monte Carlo tree search
+
+    The MCTSStrategy class searches until its time budget (or the bot's
+    deadline) runs out and takes the most visited action. The tree below the
+    chosen action is kept and reused on the player's next turn, and searched
+    trees are cached by the game's public hash and the player's knowledge, so
+    a state that comes up again carries on from its earlier search. With more
+    than one worker, independent searches run in a process pool and their root
+    statistics are added together instead.
+
+    Attributes:
+        budget (float):
+            The number of seconds to search for when there is no deadline
+        iterations (integer):
+            The number of playouts to run instead of a time budget, if any
+        workers (integer):
+            The number of processes to search in
+        executor (concurrent.futures.ProcessPoolExecutor):
+            The process pool for root-parallel search, if used, until closed
+        tree (ClueLess.SearchNode):
+            The subtree kept for the next turn
+        turnNumber (integer):
+            The turn number the subtree was kept on
+        cache (ClueLess.TranspositionCache):
+            The searched trees (or merged root statistics when searching in
+            parallel) keyed by game hash and knowledge
+    """
+
+    def __init__(self, seed=None, budget=0.5, iterations=None, workers=1):
+        """
+        Initializes a new strategy
+
+        Parameters:
+            seed (integer):
+                The seed for the strategy's random number generator
+            budget (float):
+                The number of seconds to search for when there is no deadline
+            iterations (integer):
+                The number of playouts to run instead of a time budget, if any
+            workers (integer):
+                The number of processes to search in
+        """
+        super().__init__(seed)
+        self.budget = budget
+        self.iterations = iterations
+        self.workers = workers
+        self.executor = None
+        self.tree = None
+        self.turnNumber = None
+        self.cache = TranspositionCache(64)
+
+    def chooseTurn(self, game, knowledge=None, deadline=None):
+        if (
+            knowledge is None
+            or knowledge.getSolution() is not None
+            or game.getCurrentPlayer().lost
+        ):
+            # Nothing is left to search for
+            return super().chooseTurn(game, knowledge, deadline)
+
+        if deadline is None:
+            deadline = time.monotonic() + self.budget
+        # Leave time to send the turn
+        deadline -= max(0.0, min(0.05, (deadline - time.monotonic()) / 10))
+
+        key = (game.getHash(), tuple(knowledge.possible))
+        if self.workers > 1:
+            return self.searchInParallel(game, knowledge, deadline, key)
+
+        if self.turnNumber is None or game.turnNumber <= self.turnNumber:
+            # The tree is from another game
+            self.tree = None
+
+        root = self.cache.get(key, self.tree)
+        search = Search(game, knowledge, root, self.rng.getrandbits(32))
+        search.run(None if self.iterations else deadline, self.iterations)
+        action = search.getBestAction()
+        self.cache.put(key, search.root)
+
+        # Keep the tree of decisions after this one
+        self.tree = search.root.children[action]
+        self.turnNumber = game.turnNumber
+        return search.getTurn(action)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def searchInParallel(self, game, knowledge, deadline, key):
+        """
+        Runs independent searches across processes and merges their roots
+
+        Parameters:
+            game (ClueLess.Game):
+                The game to search
+            knowledge (ClueLess.KnowledgeBase):
+                What the searching player has deduced
+            deadline (float):
+                The time.monotonic() time to stop at
+            key (tuple):
+                The cache key of the game and knowledge
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.workers)
+
+        budget = max(0.0, deadline - time.monotonic())
+        futures = [
+            self.executor.submit(
+                runSearch,
+                game,
+                knowledge,
+                self.rng.getrandbits(32),
+                budget,
+                self.iterations,
+            )
+            for _ in range(self.workers)
+        ]
+
+        statistics = dict(self.cache.get(key, {}))
+        for future in futures:
+            for action, (visits, wins) in future.result().items():
+                (totalVisits, totalWins) = statistics.get(action, (0, 0.0))
+                statistics[action] = (totalVisits + visits, totalWins + wins)
+        self.cache.put(key, statistics)
+
+        search = Search(game, knowledge)
+        return search.getTurn(search.getBestAction(statistics))
@@ -0,0 +1,109 @@
+"""Assets for the Clue-Less Application"""
+
+import pygame
+
+
+class Assets:
+    """
+    The Asset Manager for the Clue-Less application
+
+    The Assets class loads fonts and images the first time they are asked for
+    and keeps them for later, so importing the GUI doesn't start the font
+    system or read any files.
+
+    Attributes:
+        fonts (dict):
+            The loaded fonts keyed by (path, size)
+        images (dict):
+            The loaded images keyed by path
+    """
+
+    def __init__(self):
+        """Initializes a new asset manager"""
+        self.fonts = {}
+        self.images = {}
+
+    def getFont(self, path, size):
+        """
+        Gets a font, loading it if it isn't loaded yet
+
+        Parameters:
+            path (string):
+                The path of the font file, or None for Pygame's default font
+            size (integer):
+                The height of the font in pixels
+
+        Returns the pygame.font.Font
+        """
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+        return font
+
+    def getImage(self, path):
+        """
+        Gets an image, loading it if it isn't loaded yet
+
+        Images are converted to the display's pixel format once there is a
+        display, so they blit without converting every frame.
+
+        Parameters:
+            path (string):
+                The path of the image file
+
+        Returns the pygame.Surface
+        """
+        image = self.images.get(path)
+        if image is None:
+            image = pygame.image.load(path)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            self.images[path] = image
+        return image
+
+    def clear(self):
+        """Drops every loaded asset, such as after Pygame quits"""
+        self.fonts.clear()
+        self.images.clear()
+
+
+# Assets shared by the whole GUI
+ASSETS = Assets()
+
+
+class LazyFont:
+    """
+    A Font that is loaded on first use
+
+    The LazyFont class stands in for a pygame.font.Font, passing everything
+    on to the font loaded by the shared asset manager. It can be made when a
+    module is imported, before Pygame is initialized.
+
+    Attributes:
+        path (string):
+            The path of the font file, or None for Pygame's default font
+        size (integer):
+            The height of the font in pixels
+    """
+
+    __slots__ = ["path", "size"]
+
+    def __init__(self, path, size):
+        """
+        Initializes a new lazy font
+
+        Parameters:
+            path (string):
+                The path of the font file, or None for Pygame's default font
+            size (integer):
+                The height of the font in pixels
+        """
+        self.path = path
+        self.size = size
+
+    def __getattr__(self, name):
+        return getattr(ASSETS.getFont(self.path, self.size), name)
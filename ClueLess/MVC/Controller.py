@@ -1,17 +1,23 @@
+import os
+import time
+
 import pygame
 
-from ClueLess.Constants import LOCATION_NAMES
+from ClueLess.Bots import DeductionStrategy
+from ClueLess.Constants import LOCATION_NAMES, TRACE_DIRECTORY
 from ClueLess.Events import (
     CLIENT_CONNECTED_EVENT,
     CLIENT_COULD_NOT_CONNECT_EVENT,
     CLIENT_DISCONNECTED_EVENT,
     CLIENT_MESSAGE_RECEIVED_EVENT,
+    NETWORK_EVENTS,
     SERVER_CONNECTED_EVENT,
     SERVER_COULD_NOT_START_EVENT,
     SERVER_DISCONNECTED_EVENT,
     SERVER_MESSAGE_RECEIVED_EVENT,
 )
 from ClueLess.Game import Turn
+from ClueLess.MVC.Profiler import PROFILER
 from ClueLess.States import AppState, GameState, MenuState
 
 
@@ -167,7 +173,10 @@ class Controller:
                                     break
                             self.network.startClient(ipAddress, int(port))
 
-                            self.model.newGame()
+                            # Pick up a game left running when the server last
+                            # stopped, otherwise start a new one
+                            if not self.model.resumeGame():
+                                self.model.newGame()
                             self.model.updateState(
                                 appState=AppState.GAME, gameState=GameState.GAME_MENU
                             )
@@ -292,6 +301,30 @@ class Controller:
             self.view.deactivateComponent("SuggestionButton")
             self.view.activateComponent("SubmitButton")
 
+    def _finish_accusation(self, accusation):
+        """Add the accusation from the accusation menu to the pending turn."""
+        if accusation is None or self.pending_turn is None:
+            # Cancelled, or the turn was reset while the menu was open
+            return
+        setattr(self.pending_turn, "accusation", accusation)
+
+        # After accusation, allow submit, but disable everything else
+        self.view.deactivateComponent("AccusationButton")
+        self.view.deactivateComponent("SuggestionButton")
+        self.view.deactivateMovementButtons()
+        self.view.activateComponent("SubmitButton")
+
+    def _finish_suggestion(self, suggestion):
+        """Add the suggestion from the suggestion menu to the pending turn."""
+        if suggestion is None or self.pending_turn is None:
+            # Cancelled, or the turn was reset while the menu was open
+            return
+        setattr(self.pending_turn, "suggestion", suggestion)
+
+        # After suggestion, allow submit
+        self.view.deactivateComponent("SuggestionButton")
+        self.view.activateComponent("SubmitButton")
+
     def handleGameInput(self, event):
         """
         Handles the game input
@@ -355,6 +388,10 @@ class Controller:
                             self.network.sendToClients(self.model.getGame())
 
                             self.view.prepareView()
+                        elif component.id == "AddBotButton":
+                            # Add bot button
+                            # The bot joins like any other client
+                            self.network.addBot(DeductionStrategy())
                         elif component.id == "BackButton":
                             # Back button
                             if self.network.isServer():
@@ -460,7 +497,8 @@ class Controller:
                     )
 
                 # Extract client port to save for player ID
-                self.model.updatePlayerId(game.__dict__.pop("clientPort"))
+                self.model.updatePlayerId(getattr(game, "clientPort"))
+                delattr(game, "clientPort")
 
                 self.model.updateGame(game)
                 self.view.prepareView()
@@ -614,36 +652,16 @@ class Controller:
                             # Accusationi (Any point during turn, but only once)
                             elif component.id == "AccusationButton":
                                 if component.isActive():
-                                    accusation = self.view.openAccusationMenu()
-                                    if accusation is not None:
-                                        setattr(
-                                            self.pending_turn, "accusation", accusation
-                                        )
-
-                                        # After accusation, allow submit, but disable everything else
-                                        self.view.deactivateComponent(
-                                            "AccusationButton"
-                                        )
-                                        self.view.deactivateComponent(
-                                            "SuggestionButton"
-                                        )
-                                        self.view.deactivateMovementButtons()
-                                        self.view.activateComponent("SubmitButton")
+                                    self.view.openAccusationMenu(
+                                        self._finish_accusation
+                                    )
 
                             # Suggestion (only after movement and only once)
                             elif component.id == "SuggestionButton":
                                 if component.isActive():
-                                    suggestion = self.view.openSuggestionMenu(self.room)
-                                    if suggestion is not None:
-                                        setattr(
-                                            self.pending_turn, "suggestion", suggestion
-                                        )
-
-                                        # After suggestion, allow submit
-                                        self.view.deactivateComponent(
-                                            "SuggestionButton"
-                                        )
-                                        self.view.activateComponent("SubmitButton")
+                                    self.view.openSuggestionMenu(
+                                        self.room, self._finish_suggestion
+                                    )
 
                             # Submit (requires movement, and suggestion if we ended in a room)
                             elif component.id == "SubmitButton":
@@ -767,19 +785,64 @@ class Controller:
 
         return True
 
-    def handleInput(self):
-        """Handles the application input"""
+    def handleInput(self, events=None):
+        """
+        Handles the application input
+
+        Parameters:
+            events (list):
+                The Pygame events to handle, or None to get them from the queue
+        """
+        if events is None:
+            events = pygame.event.get()
+
         running = True
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                # Quit Pygame
-                running = False
-            elif self.model.appState == AppState.MENU:
-                # Menu
-                if not self.handleMenuInput(event):
-                    running = False
-            elif self.model.appState == AppState.GAME:
-                # Game
-                if not self.handleGameInput(event):
+        for event in events:
+            phase = "network" if event.type in NETWORK_EVENTS else "input"
+            with PROFILER.measure(phase):
+                if not self.handleEvent(event):
                     running = False
         return running
+
+    def handleEvent(self, event):
+        """
+        Handles an event
+
+        Parameters:
+            event (pygame.event.Event):
+                The Pygame event to handle
+
+        Returns whether the application should keep running
+        """
+        running = True
+        if event.type == pygame.QUIT:
+            # Quit Pygame
+            running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            # F3 key pressed
+            self.view.toggleProfiler()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            # F4 key pressed
+            os.makedirs(TRACE_DIRECTORY, exist_ok=True)
+            PROFILER.exportTrace(
+                os.path.join(TRACE_DIRECTORY, f"trace-{int(time.time())}.json")
+            )
+        elif self.view.handleModalEvent(event):
+            # Input taken by the open menu, while network events still
+            # reach the handlers below
+            pass
+        elif event.type == pygame.WINDOWEXPOSED:
+            # The window was uncovered, so the screen has to be redrawn
+            self.view.invalidate()
+        elif event.type == pygame.VIDEORESIZE:
+            # The window was resized, so the layers have to be drawn again
+            self.view.invalidateLayers()
+        elif self.model.appState == AppState.MENU:
+            # Menu
+            if not self.handleMenuInput(event):
+                running = False
+        elif self.model.appState == AppState.GAME:
+            # Game
+            if not self.handleGameInput(event):
+                running = False
+        return running
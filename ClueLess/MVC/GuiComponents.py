@@ -1,7 +1,11 @@
 """GUI Components for the Clue-Less Application"""
 
+from collections import OrderedDict
+
 import pygame
 
+from ClueLess.MVC.Assets import LazyFont
+
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 
@@ -27,12 +31,86 @@ class Color:
 
 
 class Font:
-    """Fonts"""
+    """Fonts, loaded the first time text is drawn with them"""
+
+    DEFAULT = LazyFont(None, 32)
+    TITLE = LazyFont(None, 48)
+    BUTTON = LazyFont(None, 28)
+
+
+class TextCache:
+    """
+    A Rendered Text Cache
+
+    The TextCache class holds rendered text surfaces keyed by font, text,
+    color and highlight, so each piece of text is only rendered the first time
+    it is drawn. Once full, the least recently used surface is dropped.
+
+    Attributes:
+        maxSize (integer):
+            The most surfaces held at once
+        entries (collections.OrderedDict):
+            The rendered surfaces, least recently used first
+        hits (integer):
+            The number of renders that found a surface
+        misses (integer):
+            The number of renders that didn't
+    """
+
+    def __init__(self, maxSize=512):
+        """
+        Initializes a new cache
+
+        Parameters:
+            maxSize (integer):
+                The most surfaces held at once
+        """
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def render(self, font, text, color, highlight=None):
+        """
+        Gets rendered text, rendering it only if it isn't cached
+
+        Parameters:
+            font (ClueLess.MVC.Font):
+                The font of the text
+            text (string):
+                The string of text
+            color (ClueLess.MVC.Color):
+                The color of the text
+            highlight (ClueLess.MVC.Color):
+                The highlight of the text, or None
+
+        Returns the rendered text surface, which must not be drawn on
+        """
+        key = (font, text, color, highlight)
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = font.render(text, True, color, highlight)
+            self.entries[key] = surface
+            if len(self.entries) > self.maxSize:
+                self.entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return surface
+
+    def clear(self):
+        """Removes every rendered surface"""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
 
-    pygame.font.init()
-    DEFAULT = pygame.font.Font(None, 32)
-    TITLE = pygame.font.Font(None, 48)
-    BUTTON = pygame.font.Font(None, 28)
+# Rendered text shared by every component
+TEXT_CACHE = TextCache()
 
 
 class Component:
@@ -73,8 +151,26 @@ class Component:
             The font of the text
         active (boolean):
             The flag to determine whether it is active
+        dirty (boolean):
+            The flag to determine whether it needs to be redrawn
+        drawnArea (pygame.Rect):
+            The area of the screen it was last drawn over, or None
+        renderedText (pygame.Surface):
+            The text as last rendered, or None
+        renderedKey (tuple):
+            The font, text, color and highlight the text was rendered with
     """
 
+    # Attributes that don't change how the component looks
+    UNDRAWN_ATTRIBUTES = ("dirty", "drawnArea", "renderedText", "renderedKey")
+
+    # Attributes the user changes, which are kept when the view is prepared again
+    KEPT_ATTRIBUTES = ()
+    dirty = True
+    drawnArea = None
+    renderedText = None
+    renderedKey = None
+
     def __init__(
         self,
         id,
@@ -155,6 +251,14 @@ class Component:
         # Active
         self.active = active
 
+    def __setattr__(self, name, value):
+        # Any change to how the component looks marks it to be redrawn
+        if name not in self.UNDRAWN_ATTRIBUTES and (
+            getattr(self, name, self) != value
+        ):
+            object.__setattr__(self, "dirty", True)
+        object.__setattr__(self, name, value)
+
     def getID(self):
         """Returns the component's ID"""
         return self.id
@@ -199,6 +303,64 @@ class Component:
             self.height,
         )
 
+    def getRenderedText(self):
+        """Gets the rendered text, rendering it again only if it changed"""
+        key = (self.font, self.text, self.textColor, self.textHighlight)
+        if key != self.renderedKey:
+            self.renderedText = TEXT_CACHE.render(*key)
+            self.renderedKey = key
+        return self.renderedText
+
+    def getDrawArea(self):
+        """Gets the area of the screen the component draws over"""
+        area = pygame.Rect(
+            self.x - (self.width // 2),
+            self.y - (self.height // 2),
+            self.width,
+            self.height,
+        )
+        if self.text:
+            # The text can be wider than the component
+            (width, height) = self.getRenderedText().get_size()
+            area.union_ip(
+                pygame.Rect(
+                    self.x - (width // 2), self.y - (height // 2), width, height
+                )
+            )
+
+        # Leave room for the text box cursor and antialiasing
+        return area.inflate(4, 4)
+
+    def patch(self, other):
+        """
+        Makes the component look like another one, so it can be kept instead
+
+        Only the attributes that differ are changed, so the component is only
+        redrawn if it looks different.
+
+        Parameters:
+            other (ClueLess.MVC.Component):
+                The new component with the same ID
+        """
+        for name, value in vars(other).items():
+            if name not in self.UNDRAWN_ATTRIBUTES + self.KEPT_ATTRIBUTES:
+                setattr(self, name, value)
+
+    def markDrawn(self):
+        """
+        Marks the component as drawn
+
+        Returns the areas of the screen that need to be redrawn, where it was
+        drawn before and where it is drawn now
+        """
+        area = self.getDrawArea()
+        areas = [area]
+        if self.drawnArea is not None and self.drawnArea != area:
+            areas.append(self.drawnArea)
+        self.drawnArea = area
+        self.dirty = False
+        return areas
+
     def draw(self, surface):
         """Draws the component"""
         # Main rectangle
@@ -230,9 +392,7 @@ class Component:
         )
 
         # Text
-        renderedText = self.font.render(
-            self.text, True, self.textColor, self.textHighlight
-        )
+        renderedText = self.getRenderedText()
         surface.blit(
             renderedText,
             (
@@ -359,9 +519,7 @@ class Text(Component):
 
     def getArea(self):
         """Gets the area of the component"""
-        return self.font.render(
-            self.text, True, self.textColor, self.textHighlight
-        ).get_rect()
+        return self.getRenderedText().get_rect()
 
     def draw(self, surface):
         """Draws the component"""
@@ -380,9 +538,7 @@ class Text(Component):
         )
 
         # Text
-        renderedText = self.font.render(
-            self.text, True, self.textColor, self.textHighlight
-        )
+        renderedText = self.getRenderedText()
         surface.blit(
             renderedText,
             (
@@ -585,6 +741,9 @@ class TextBox(Component):
             The flag to determine whether it is active
     """
 
+    # The typed text and focus survive the view being prepared again
+    KEPT_ATTRIBUTES = ("text", "active")
+
     def __init__(
         self,
         id,
@@ -662,9 +821,7 @@ class TextBox(Component):
 
         # Cursor
         if self.active:
-            renderedText = self.font.render(
-                self.text, True, self.textColor, self.textHighlight
-            )
+            renderedText = self.getRenderedText()
             pygame.draw.rect(
                 surface,
                 self.borderColor,
@@ -968,9 +1125,7 @@ class MovementButton(Button):
             pygame.draw.polygon(surface, self.borderColor, pts, 1)
         else:
             # label mode (e.g., "Stay")
-            rendered = self.font.render(
-                self.text, True, self.textColor, self.textHighlight
-            )
+            rendered = self.getRenderedText()
             surface.blit(
                 rendered,
                 (
@@ -980,7 +1135,353 @@ class MovementButton(Button):
             )
 
 
-class SuggestionMenu:
+class Layer(Component):
+    """
+    A Layer Component for Clue-Less View
+
+    The Layer class draws a group of components that don't change onto a
+    surface once, then draws the whole group with a single blit. The surface
+    is only drawn again after the layer is invalidated, when the screen is
+    resized or the colors change.
+
+    Implements:
+        ClueLess.MVC.Component
+    Attributes:
+        id (string):
+            The id of the component
+        components (list):
+            The components drawn on the layer
+        background (ClueLess.MVC.Color):
+            The color behind the components
+        surface (pygame.Surface):
+            The components as last drawn, or None
+        * The rest are the same as ClueLess.MVC.Component
+    """
+
+    UNDRAWN_ATTRIBUTES = Component.UNDRAWN_ATTRIBUTES + ("surface",)
+
+    def __init__(self, id, components, background=Color.WHITE):
+        """
+        Initializes a new layer component
+
+        Parameters:
+            id (string):
+                The id of the component
+            components (list):
+                The components to draw on the layer, in drawing order
+            background (ClueLess.MVC.Color):
+                The color behind the components, which should match the
+                screen behind the layer
+        """
+        area = components[0].getDrawArea().unionall(
+            [component.getDrawArea() for component in components[1:]]
+        )
+        super().__init__(
+            id,
+            area.centerx,
+            area.centery,
+            area.width,
+            area.height,
+            borderThickness=0,
+            borderRadius=0,
+            borderColor=background,
+            inactiveFillColor=background,
+            activeFillColor=background,
+            text="",
+            textColor=background,
+            textHighlight=None,
+            font=None,
+            active=True,
+        )
+        self.components = components
+        self.background = background
+        self.surface = None
+
+    def invalidate(self):
+        """Marks the layer to be drawn again the next time it is drawn"""
+        self.surface = None
+        self.dirty = True
+
+    def draw(self, surface):
+        """Draws the component"""
+        area = self.getArea()
+        if self.surface is None:
+            # The components draw at screen positions, so draw them on a canvas
+            # that reaches the layer and keep the layer's part of it
+            canvas = pygame.Surface(area.bottomright)
+            canvas.fill(self.background)
+            for component in self.components:
+                component.draw(canvas)
+            self.surface = canvas.subsurface(area).copy()
+
+        surface.blit(self.surface, area.topleft)
+
+
+class ComponentIndex:
+    """
+    An Index of the Components of a Clue-Less View
+
+    The ComponentIndex class finds components by id, by type and by position
+    without scanning every component. Positions are kept in a uniform grid of
+    cells, each listing the components whose area overlaps it.
+
+    Attributes:
+        cellSize (integer):
+            The width and height of a grid cell in pixels
+        byId (dict):
+            The components with each id, in drawing order
+        byType (dict):
+            The components of each type, in drawing order, filled when asked
+        cells (dict):
+            The components overlapping each (column, row) cell
+        areas (dict):
+            The area each component was indexed with
+        order (dict):
+            The drawing order of each component, so later ones are on top
+        components (list):
+            The indexed components, in drawing order
+    """
+
+    def __init__(self, cellSize=64):
+        """
+        Initializes a new index
+
+        Parameters:
+            cellSize (integer):
+                The width and height of a grid cell in pixels
+        """
+        self.cellSize = cellSize
+        self.rebuild([])
+
+    def rebuild(self, components):
+        """
+        Indexes a new list of components
+
+        Parameters:
+            components (list):
+                The components, in drawing order
+        """
+        self.components = components
+        self.byId = {}
+        self.byType = {}
+        self.cells = {}
+        self.areas = {}
+        self.order = {}
+        for order, component in enumerate(components):
+            self.byId.setdefault(component.id, []).append(component)
+            self.order[component] = order
+            self.place(component)
+
+    def getCells(self, area):
+        """
+        Gets the cells overlapping an area
+
+        Parameters:
+            area (pygame.Rect):
+                The area on the screen
+        """
+        return [
+            (column, row)
+            for column in range(
+                area.left // self.cellSize, (area.right - 1) // self.cellSize + 1
+            )
+            for row in range(
+                area.top // self.cellSize, (area.bottom - 1) // self.cellSize + 1
+            )
+        ]
+
+    def place(self, component):
+        """
+        Adds a component to the cells its area overlaps
+
+        Parameters:
+            component (ClueLess.MVC.Component):
+                The component to place
+        """
+        area = component.getArea()
+        self.areas[component] = area
+        for cell in self.getCells(area):
+            self.cells.setdefault(cell, []).append(component)
+
+    def move(self, component):
+        """
+        Moves a component to new cells if its area changed
+
+        Parameters:
+            component (ClueLess.MVC.Component):
+                The indexed component that may have moved or been resized
+        """
+        area = self.areas.get(component)
+        if area is None or area == component.getArea():
+            return
+        for cell in self.getCells(area):
+            self.cells[cell].remove(component)
+        self.place(component)
+
+    def getById(self, id):
+        """
+        Gets the components with an id
+
+        Parameters:
+            id (string):
+                The id of the components
+        """
+        return self.byId.get(id, [])
+
+    def getByType(self, componentType):
+        """
+        Gets the components of a type, including subtypes
+
+        Parameters:
+            componentType (type):
+                The type of the components
+        """
+        components = self.byType.get(componentType)
+        if components is None:
+            components = [
+                component
+                for component in self.components
+                if isinstance(component, componentType)
+            ]
+            self.byType[componentType] = components
+        return components
+
+    def getAt(self, point):
+        """
+        Gets the component on top at a point
+
+        Parameters:
+            point (tuple):
+                The x and y coordinates of the point
+
+        Returns the component, or None if there isn't one there
+        """
+        cell = (int(point[0]) // self.cellSize, int(point[1]) // self.cellSize)
+        found = None
+        for component in self.cells.get(cell, []):
+            if self.areas[component].collidepoint(point) and (
+                found is None or self.order[component] > self.order[found]
+            ):
+                found = component
+        return found
+
+
+class Modal:
+    """
+    A Modal Overlay for Clue-Less View
+
+    The Modal class is drawn over the view and takes the user's input while it
+    is open, without stopping the main loop, so network events are still
+    handled. When it is closed, its callback is called with the result.
+    Subclasses draw themselves, list their components and handle clicks.
+
+    Attributes:
+        callback (function):
+            The function to call with the result when closed, or None
+        closed (boolean):
+            The flag to determine whether it has been closed
+        result (object):
+            The result it was closed with
+    """
+
+    # Events from the user, which an open modal takes from the view
+    INPUT_EVENTS = (
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.TEXTINPUT,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+    )
+
+    callback = None
+    closed = False
+    result = None
+
+    def getArea(self):
+        """Gets the area of the modal"""
+        return pygame.Rect(
+            self.x - (self.width // 2),
+            self.y - (self.height // 2),
+            self.width,
+            self.height,
+        )
+
+    def getComponents(self):
+        """Gets the components drawn on the modal"""
+        return []
+
+    def getDirtyAreas(self):
+        """
+        Marks the changed components as drawn
+
+        Returns the areas of the screen they need to be redrawn over
+        """
+        areas = []
+        for component in self.getComponents():
+            if component.dirty:
+                areas += component.markDrawn()
+        return areas
+
+    def markDrawn(self):
+        """Marks every component as drawn"""
+        for component in self.getComponents():
+            component.markDrawn()
+
+    def close(self, result=None):
+        """
+        Closes the modal and calls its callback
+
+        Parameters:
+            result (object):
+                The result to close with, or None if it was cancelled
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.result = result
+        if self.callback is not None:
+            self.callback(result)
+
+    def handleEvent(self, event):
+        """
+        Handles an event while the modal is open
+
+        Parameters:
+            event (pygame.event.Event):
+                The Pygame event to handle
+
+        Returns whether the modal took the event, which it does for all user
+        input so the view underneath doesn't get it
+        """
+        if event.type not in self.INPUT_EVENTS:
+            return False
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                # Esc key pressed
+                self.close(None)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:
+                # Left mouse button clicked
+                component = self.getClickedComponent(event.pos)
+                if component is not None:
+                    self.handleClick(component)
+        return True
+
+    def handleClick(self, component):
+        """
+        Handles a click on one of the modal's components
+
+        Parameters:
+            component (ClueLess.MVC.Component):
+                The clicked component
+        """
+        pass
+
+
+class SuggestionMenu(Modal):
     """
     Suggestion (suspect, weapon).
     Room is passed in (auto-populated).
@@ -997,7 +1498,11 @@ class SuggestionMenu:
         borderRadius=12,
         borderColor=Color.BLACK,
         fillColor=Color.GRAY,
+        callback=None,
     ):
+        # Result
+        self.callback = callback
+
         # Shape
         self.width = width
         self.height = height
@@ -1254,8 +1759,6 @@ class SuggestionMenu:
         for button in self.weapon_buttons:
             button.draw(surface)
 
-        pygame.display.flip()
-
     def getClickedComponent(self, point):
         """
         Gets the clicked component of the given point
@@ -1273,77 +1776,36 @@ class SuggestionMenu:
             if component.id == component_name:
                 component.active = True
 
-    def open(self, surface):
-        """Run a blocking loop until submit/cancel. Returns dict or None."""
-        clock = pygame.time.Clock()
-        running = True
-        result = None
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    # bubble up quit; treat as cancel so caller can handle app shutdown separately
-                    running = False
-                    result = None
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                        result = None
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Mouse button clicked
-                    if event.button == 1:
-                        # Left mouse button clicked
-                        component = self.getClickedComponent(event.pos)
-                        if component is not None:
-                            # A component was clicked
-                            if component.id == "BackButton":
-                                running = False
-                                result = None
-                            elif (
-                                component.id == "SuggestionSubmitButton"
-                                and component.active
-                            ):
-                                running = False
-                                result = (
-                                    self.selected_suspect,
-                                    self.selected_weapon,
-                                    self.selected_room,
-                                )
-                            elif component in self.suspect_buttons:
-                                if not component.active:
-                                    # Enable this component and update self.selected_suspect, disable all other suspects
-                                    self.selected_suspect = component.id
-                                    for other_component in self.suspect_buttons:
-                                        other_component.active = False
-                                    component.active = True
-                            elif component in self.weapon_buttons:
-                                if not component.active:
-                                    # Enable this component and update self.selected_weapon, disable all other weapons
-                                    self.selected_weapon = component.id
-                                    for other_component in self.weapon_buttons:
-                                        other_component.active = False
-                                    component.active = True
-                            else:
-                                # Any other component was clicked
-                                pass
-                    elif event.button == 2:
-                        # Right mouse button clicked
-                        pass
-
-                    else:
-                        # Any other mouse button clicked
-                        pass
-
-            if self.selected_suspect is not None and self.selected_weapon is not None:
-                self.enableComponent("SuggestionSubmitButton")
-
-            self.draw(surface)
-            clock.tick(60)
-
-        return result
-
-
-class AccusationMenu:
+    def getComponents(self):
+        return self.text + self.all_buttons
+
+    def handleClick(self, component):
+        if component.id == "BackButton":
+            self.close(None)
+        elif component.id == "SuggestionSubmitButton" and component.active:
+            self.close(
+                (self.selected_suspect, self.selected_weapon, self.selected_room)
+            )
+        elif component in self.suspect_buttons:
+            if not component.active:
+                # Enable this component and update self.selected_suspect, disable all other suspects
+                self.selected_suspect = component.id
+                for other_component in self.suspect_buttons:
+                    other_component.active = False
+                component.active = True
+        elif component in self.weapon_buttons:
+            if not component.active:
+                # Enable this component and update self.selected_weapon, disable all other weapons
+                self.selected_weapon = component.id
+                for other_component in self.weapon_buttons:
+                    other_component.active = False
+                component.active = True
+
+        if self.selected_suspect is not None and self.selected_weapon is not None:
+            self.enableComponent("SuggestionSubmitButton")
+
+
+class AccusationMenu(Modal):
     """
     Suggestion (suspect, weapon, room).
     """
@@ -1358,7 +1820,11 @@ class AccusationMenu:
         borderRadius=12,
         borderColor=Color.BLACK,
         fillColor=Color.GRAY,
+        callback=None,
     ):
+        # Result
+        self.callback = callback
+
         # Shape
         self.width = width
         self.height = height
@@ -1717,8 +2183,6 @@ class AccusationMenu:
         for button in self.room_buttons:
             button.draw(surface)
 
-        pygame.display.flip()
-
     def getClickedComponent(self, point):
         """
         Gets the clicked component of the given point
@@ -1736,88 +2200,47 @@ class AccusationMenu:
             if component.id == component_name:
                 component.active = True
 
-    def open(self, surface):
-        """Run a blocking loop until submit/cancel. Returns dict or None."""
-        clock = pygame.time.Clock()
-        running = True
-        result = None
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    # bubble up quit; treat as cancel so caller can handle app shutdown separately
-                    running = False
-                    result = None
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                        result = None
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Mouse button clicked
-                    if event.button == 1:
-                        # Left mouse button clicked
-                        component = self.getClickedComponent(event.pos)
-                        if component is not None:
-                            # A component was clicked
-                            if component.id == "BackButton":
-                                running = False
-                                result = None
-                            elif (
-                                component.id == "SuggestionSubmitButton"
-                                and component.active
-                            ):
-                                running = False
-                                result = (
-                                    self.selected_suspect,
-                                    self.selected_weapon,
-                                    self.selected_room,
-                                )
-                            elif component in self.suspect_buttons:
-                                if not component.active:
-                                    # Enable this component and update self.selected_suspect, disable all other suspects
-                                    self.selected_suspect = component.id
-                                    for other_component in self.suspect_buttons:
-                                        other_component.active = False
-                                    component.active = True
-                            elif component in self.weapon_buttons:
-                                if not component.active:
-                                    # Enable this component and update self.selected_weapon, disable all other weapons
-                                    self.selected_weapon = component.id
-                                    for other_component in self.weapon_buttons:
-                                        other_component.active = False
-                                    component.active = True
-                            elif component in self.room_buttons:
-                                if not component.active:
-                                    # Enable this component and update self.selected_weapon, disable all other weapons
-                                    self.selected_room = component.id
-                                    for other_component in self.room_buttons:
-                                        other_component.active = False
-                                    component.active = True
-                            else:
-                                # Any other component was clicked
-                                pass
-                    elif event.button == 2:
-                        # Right mouse button clicked
-                        pass
-
-                    else:
-                        # Any other mouse button clicked
-                        pass
-
-            if (
-                self.selected_suspect is not None
-                and self.selected_weapon is not None
-                and self.selected_room is not None
-            ):
-                self.enableComponent("SuggestionSubmitButton")
+    def getComponents(self):
+        return self.text + self.all_buttons
 
-            self.draw(surface)
-            clock.tick(60)
+    def handleClick(self, component):
+        if component.id == "BackButton":
+            self.close(None)
+        elif component.id == "SuggestionSubmitButton" and component.active:
+            self.close(
+                (self.selected_suspect, self.selected_weapon, self.selected_room)
+            )
+        elif component in self.suspect_buttons:
+            if not component.active:
+                # Enable this component and update self.selected_suspect, disable all other suspects
+                self.selected_suspect = component.id
+                for other_component in self.suspect_buttons:
+                    other_component.active = False
+                component.active = True
+        elif component in self.weapon_buttons:
+            if not component.active:
+                # Enable this component and update self.selected_weapon, disable all other weapons
+                self.selected_weapon = component.id
+                for other_component in self.weapon_buttons:
+                    other_component.active = False
+                component.active = True
+        elif component in self.room_buttons:
+            if not component.active:
+                # Enable this component and update self.selected_weapon, disable all other weapons
+                self.selected_room = component.id
+                for other_component in self.room_buttons:
+                    other_component.active = False
+                component.active = True
 
-        return result
+        if (
+            self.selected_suspect is not None
+            and self.selected_weapon is not None
+            and self.selected_room is not None
+        ):
+            self.enableComponent("SuggestionSubmitButton")
 
 
-class GameOverMenu:
+class GameOverMenu(Modal):
     """ """
 
     def __init__(
@@ -1831,7 +2254,11 @@ class GameOverMenu:
         borderRadius=12,
         borderColor=Color.BLACK,
         fillColor=Color.GRAY,
+        callback=None,
     ):
+        # Result
+        self.callback = callback
+
         # Shape
         self.width = width
         self.height = height
@@ -1937,8 +2364,6 @@ class GameOverMenu:
         for button in self.buttons:
             button.draw(surface)
 
-        pygame.display.flip()
-
     def getClickedComponent(self, point):
         """
         Gets the clicked component of the given point
@@ -1951,42 +2376,9 @@ class GameOverMenu:
             if component.getArea().collidepoint(point):
                 return component
 
-    def open(self, surface):
-        """Run a blocking loop until submit/cancel. Returns dict or None."""
-        clock = pygame.time.Clock()
-        running = True
-        result = None
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    # bubble up quit; treat as cancel so caller can handle app shutdown separately
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Mouse button clicked
-                    if event.button == 1:
-                        # Left mouse button clicked
-                        component = self.getClickedComponent(event.pos)
-                        if component is not None:
-                            # A component was clicked
-                            if component.id == "BackButton":
-                                running = False
-                            elif component.id == "OkButton":
-                                running = False
-                            else:
-                                # Any other component was clicked
-                                pass
-                    elif event.button == 2:
-                        # Right mouse button clicked
-                        pass
-
-                    else:
-                        # Any other mouse button clicked
-                        pass
-            self.draw(surface)
-            clock.tick(60)
-
-        return result
+    def getComponents(self):
+        return self.text + self.buttons
+
+    def handleClick(self, component):
+        if component.id in ("BackButton", "OkButton"):
+            self.close(None)
@@ -1,4 +1,8 @@
+import uuid
+
+from ClueLess.Deduction import Contradiction, KnowledgeBase
 from ClueLess.Game import Game, Turn
+from ClueLess.Journal import Journal
 from ClueLess.States import AppState, GameState, MenuState
 
 
@@ -24,10 +28,22 @@ class Model:
             The current game
         turn (ClueLess.Turn):
             The current turn
+        journal (ClueLess.Journal):
+            The history of the current game, kept by the server
+        knowledge (ClueLess.KnowledgeBase):
+            What this model's player has deduced about the cards
+        store (ClueLess.GameStore):
+            The store that hosted games are saved to, if any
     """
 
-    def __init__(self):
-        """Initializes a new model"""
+    def __init__(self, store=None):
+        """
+        Initializes a new model
+
+        Parameters:
+            store (ClueLess.GameStore):
+                The store to save hosted games to
+        """
         # States
         self.appState = AppState.MENU
         self.menuState = MenuState.MAIN_MENU
@@ -40,6 +56,11 @@ class Model:
         self.playerId = None
         self.game = None
         self.turn = None
+        self.journal = None
+        self.knowledge = None
+
+        # Storage
+        self.store = store
 
     def updateState(self, appState=None, menuState=None, gameState=None):
         """
@@ -60,22 +81,117 @@ class Model:
         if gameState is not None:
             self.gameState = gameState
 
-    def newGame(self):
-        """Creates a new game"""
-        self.game = Game()
+    def newGame(self, seed=None):
+        """
+        Creates a new game
+
+        Parameters:
+            seed (integer):
+                The seed for the game's random number generator
+        """
+        self.game = Game(seed)
+        self.knowledge = None
+
+    def resumeGame(self):
+        """
+        Resumes the most recently saved game that has not finished
+
+        Returns whether a game was resumed
+        """
+        if self.store is None:
+            return False
+
+        for gameId in reversed(self.store.getGameIds()):
+            try:
+                journal = self.store.load(gameId)
+                if journal is None:
+                    # Nothing usable was saved
+                    continue
+                game = journal.rebuild()
+            except Exception as exception:
+                # A corrupt save shouldn't stop a new game from being hosted
+                print(f"Unable to resume game {gameId}: {exception!r}")
+                self.store.quarantine(gameId)
+                continue
+
+            if game.finished:
+                self.store.remove(gameId)
+                continue
+
+            # Wait in the game menu for the players to reconnect
+            game.stop()
+            self.game = game
+            self.journal = journal
+            self.knowledge = None
+            return True
+
+        return False
+
+    def saveGame(self):
+        """Writes the current game's pending turns to its store"""
+        if self.journal is None or self.journal.store is None:
+            # The game is not stored
+            return
+
+        if self.game.finished:
+            # Finished games don't need to be restored
+            self.journal.store.remove(self.journal.gameId)
+            self.journal.store = None
+        else:
+            self.journal.store.flush(self.journal.gameId)
 
     def endGame(self):
         """Ends the game"""
+        if self.journal is not None and self.journal.store is not None:
+            self.journal.store.remove(self.journal.gameId)
+
         self.game = None
+        self.journal = None
+        self.knowledge = None
 
     def startGame(self):
         """Start the game"""
         self.game.start()
 
+        if self.isServer and self.journal is None:
+            # Keep the history of the game from the first turn
+            self.journal = Journal(self.game.getHeader())
+            if self.store is not None:
+                self.store.create(uuid.uuid4().hex, self.journal)
+            self.journal.snapshot(self.game)
+
+        self.updateKnowledge()
+
     def stopGame(self):
         """Stop the game"""
         self.game.stop()
 
+    def getJournal(self):
+        """Gets the journal"""
+        return self.journal
+
+    def getKnowledge(self):
+        """Gets what this model's player has deduced about the cards"""
+        return self.knowledge
+
+    def updateKnowledge(self):
+        """Adds the result of the game's last turn to the player's knowledge"""
+        if self.knowledge is not None:
+            try:
+                self.knowledge.update(self.game)
+                return
+            except Contradiction:
+                # The seats changed or an update was missed, so start again
+                print("Knowledge contradicts the game, deducing it again")
+                self.knowledge = None
+
+        if (
+            self.game.getSolution() is not None
+            and self.game.findPlayerFromId(self.playerId) is not None
+        ):
+            # The cards have been dealt
+            self.knowledge = KnowledgeBase.fromGame(self.game, self.playerId)
+
     def getGame(self):
         """Gets the game"""
         return self.game
@@ -108,7 +224,9 @@ class Model:
             playerIds (list):
                 The updated list of player IDs
         """
-        self.game.updatePlayers(playerIds)
+        if self.game.updatePlayers(playerIds) and self.journal is not None:
+            # Replaying turns depends on the seating, so take a snapshot
+            self.journal.snapshot(self.game)
 
     def getPlayerId(self):
         """Gets the model's player ID"""
@@ -156,7 +274,11 @@ class Model:
             # No move to make
             return
 
-        self.game.makeMove(turn)
+        if self.game.makeMove(turn):
+            if self.journal is not None:
+                self.journal.record(turn, self.game)
+                self.saveGame()
+            self.updateKnowledge()
 
     def updateGame(self, game):
         """
@@ -171,3 +293,4 @@ class Model:
             return
 
         self.game = game
+        self.updateKnowledge()
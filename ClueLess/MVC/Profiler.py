@@ -0,0 +1,225 @@
+"""Frame Profiler for the Clue-Less Application"""
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pygame
+
+from ClueLess.MVC.Assets import ASSETS
+from ClueLess.MVC.GuiComponents import SCREEN_WIDTH, Color
+
+
+class FrameProfiler:
+    """
+    The Frame Profiler for the Clue-Less application
+
+    The FrameProfiler class times the phases of each frame of the main loop.
+    Each phase is timed without the phases nested inside it, so a network
+    message that prepares the view counts the preparing as "prepare" and the
+    rest as "network". It keeps the last frames for rolling percentiles,
+    logs slow frames, exports a trace that chrome://tracing and Perfetto can
+    open, and draws a heads-up display over the view.
+
+    Attributes:
+        window (integer):
+            The number of frames the percentiles are taken over
+        slowFrame (float):
+            The milliseconds of work that make a frame slow
+        visible (boolean):
+            The flag to determine whether the heads-up display is shown
+        frames (collections.deque):
+            The total and phase milliseconds of the last frames
+        slowFrames (collections.deque):
+            The frame number, total and phase milliseconds of the last slow
+            frames
+        traceEvents (collections.deque):
+            The (phase, start, seconds) of the last timed phases
+        frameNumber (integer):
+            The number of the current frame
+        current (dict):
+            The milliseconds of each phase so far this frame
+        stack (list):
+            The seconds of nested phases in each phase being timed
+        hudSurface (pygame.Surface):
+            The heads-up display as last drawn, or None
+        hudTime (float):
+            The time the heads-up display was last drawn
+    """
+
+    # Phases of a frame, in the order they are shown
+    PHASES = ("input", "network", "prepare", "draw", "present")
+
+    # Seconds between heads-up display refreshes
+    HUD_INTERVAL = 0.25
+
+    def __init__(self, window=240, slowFrame=1000 / 30, traceSize=20000):
+        """
+        Initializes a new frame profiler
+
+        Parameters:
+            window (integer):
+                The number of frames the percentiles are taken over
+            slowFrame (float):
+                The milliseconds of work that make a frame slow
+            traceSize (integer):
+                The most timed phases kept for the trace
+        """
+        self.window = window
+        self.slowFrame = slowFrame
+        self.visible = False
+        self.frames = deque(maxlen=window)
+        self.slowFrames = deque(maxlen=100)
+        self.traceEvents = deque(maxlen=traceSize)
+        self.frameNumber = 0
+        self.current = {}
+        self.stack = []
+        self.hudSurface = None
+        self.hudTime = 0.0
+
+    def beginFrame(self):
+        """Starts timing a frame"""
+        self.frameNumber += 1
+        self.current = {}
+
+    @contextmanager
+    def measure(self, phase):
+        """
+        Times a phase of the frame
+
+        Parameters:
+            phase (string):
+                The name of the phase
+        """
+        start = time.perf_counter()
+        self.stack.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self.stack.pop()
+            self.current[phase] = (
+                self.current.get(phase, 0.0) + (elapsed - nested) * 1000
+            )
+            if self.stack:
+                self.stack[-1] += elapsed
+            self.traceEvents.append((phase, start, elapsed))
+
+    def endFrame(self):
+        """Finishes timing a frame, skipping frames that did nothing"""
+        if not self.current:
+            return
+
+        total = sum(self.current.values())
+        self.frames.append((total, self.current))
+        if total >= self.slowFrame:
+            self.slowFrames.append((self.frameNumber, total, self.current))
+            breakdown = ", ".join(
+                f"{phase} {milliseconds:.1f}"
+                for phase, milliseconds in self.current.items()
+            )
+            print(f"Slow frame {self.frameNumber}: {total:.1f} ms ({breakdown})")
+
+    def getPercentiles(self, phase=None, percentiles=(50, 95, 99)):
+        """
+        Gets percentiles of the milliseconds taken over the last frames
+
+        Parameters:
+            phase (string):
+                The phase to get, or None for the whole frame
+            percentiles (tuple):
+                The percentiles to get
+
+        Returns a tuple of milliseconds, one per percentile
+        """
+        if phase is None:
+            times = sorted(total for total, _ in self.frames)
+        else:
+            times = sorted(phases.get(phase, 0.0) for _, phases in self.frames)
+        if not times:
+            return tuple(0.0 for _ in percentiles)
+        return tuple(
+            times[min(len(times) - 1, len(times) * percentile // 100)]
+            for percentile in percentiles
+        )
+
+    def getRows(self):
+        """Gets the rows of cells shown on the heads-up display"""
+        rows = [("ms", "p50", "p95", "p99")]
+        for phase in (None,) + self.PHASES:
+            rows.append(
+                (phase or "frame",)
+                + tuple(
+                    f"{milliseconds:.2f}"
+                    for milliseconds in self.getPercentiles(phase)
+                )
+            )
+        rows.append((f"slow: {len(self.slowFrames)}",))
+        return rows
+
+    def toggle(self):
+        """Shows or hides the heads-up display"""
+        self.visible = not self.visible
+        self.hudSurface = None
+
+    def getArea(self):
+        """Gets the area of the heads-up display"""
+        rowCount = len(self.PHASES) + 3
+        return pygame.Rect(SCREEN_WIDTH - 290, 80, 280, 20 * rowCount + 8)
+
+    def refreshHud(self):
+        """
+        Draws the heads-up display again if it is due
+
+        Returns whether it changed
+        """
+        now = time.perf_counter()
+        if self.hudSurface is not None and now - self.hudTime < self.HUD_INTERVAL:
+            return False
+
+        font = ASSETS.getFont(None, 22)
+        self.hudSurface = pygame.Surface(self.getArea().size)
+        self.hudSurface.fill(Color.BLACK)
+        for row, cells in enumerate(self.getRows()):
+            for column, cell in enumerate(cells):
+                self.hudSurface.blit(
+                    font.render(cell, True, Color.GREEN),
+                    (8 + column * 66, 4 + row * 20),
+                )
+        self.hudTime = now
+        return True
+
+    def draw(self, surface):
+        """Draws the heads-up display"""
+        if self.hudSurface is None:
+            self.refreshHud()
+        surface.blit(self.hudSurface, self.getArea().topleft)
+
+    def exportTrace(self, path):
+        """
+        Saves the timed phases in the Chrome trace event format
+
+        Parameters:
+            path (string):
+                The path of the JSON file to write
+        """
+        events = [
+            {
+                "name": phase,
+                "cat": "frame",
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": elapsed * 1e6,
+                "pid": 0,
+                "tid": 0,
+            }
+            for phase, start, elapsed in self.traceEvents
+        ]
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        print(f"Saved trace of {len(events)} phases to {path}")
+
+
+# Profiler shared by the main loop, controller and view
+PROFILER = FrameProfiler()
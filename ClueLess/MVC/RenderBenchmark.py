@@ -0,0 +1,245 @@
+"""Render Benchmark for the Clue-Less Application"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+import pygame
+
+from ClueLess.MVC.GuiComponents import SCREEN_HEIGHT, SCREEN_WIDTH, GameOverMenu
+from ClueLess.MVC.Model import Model
+from ClueLess.MVC.View import View
+from ClueLess.States import AppState, GameState, MenuState
+
+# Seed and players of the game shown in the game states
+GAME_SEED = 1
+PLAYER_IDS = (50001, 50002, 50003)
+
+
+def initHeadless():
+    """Starts Pygame without a display, unless a video driver was chosen"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+
+
+def newGameModel():
+    """Gets a model of a started game, seen by the first player on their turn"""
+    model = Model()
+    with contextlib.redirect_stdout(None):
+        model.newGame(GAME_SEED)
+        model.getGame().updatePlayers(list(PLAYER_IDS))
+        model.getGame().start()
+    model.playerId = PLAYER_IDS[0]
+    return model
+
+
+def getStates():
+    """
+    Gets the states of the view to render
+
+    Returns a dictionary of functions keyed by state name, each of which
+    shows the state on a view
+    """
+
+    def showMenu(menuState):
+        def show(view):
+            view.model.updateState(appState=AppState.MENU, menuState=menuState)
+            view.prepareView()
+
+        return show
+
+    def showGame(gameState):
+        def show(view):
+            view.model.updateState(appState=AppState.GAME, gameState=gameState)
+            view.prepareView()
+
+        return show
+
+    def showSuggestionMenu(view):
+        showGame(GameState.GAMEPLAY)(view)
+        view.openSuggestionMenu("Hall", None)
+
+    def showAccusationMenu(view):
+        showGame(GameState.GAMEPLAY)(view)
+        view.openAccusationMenu(None)
+
+    def showGameOverMenu(view):
+        showGame(GameState.GAMEPLAY)(view)
+        view.openModal(
+            GameOverMenu(
+                view.model.getGame().getCurrentPlayer().getName(),
+                x=SCREEN_WIDTH // 2,
+                y=SCREEN_HEIGHT // 2,
+            )
+        )
+
+    return {
+        "MainMenu": showMenu(MenuState.MAIN_MENU),
+        "ServerMenu": showMenu(MenuState.SERVER_MENU),
+        "ClientMenu": showMenu(MenuState.CLIENT_MENU),
+        "GameMenu": showGame(GameState.GAME_MENU),
+        "Gameplay": showGame(GameState.GAMEPLAY),
+        "SuggestionMenu": showSuggestionMenu,
+        "AccusationMenu": showAccusationMenu,
+        "GameOverMenu": showGameOverMenu,
+    }
+
+
+def getMilliseconds(times):
+    """
+    Gets the mean, median and 95th percentile of times
+
+    Parameters:
+        times (list):
+            The times in seconds
+
+    Returns (mean, 50th percentile, 95th percentile) in milliseconds
+    """
+    times = sorted(times)
+    return (sum(times) / len(times) * 1000,) + tuple(
+        times[min(len(times) - 1, len(times) * percentile // 100)] * 1000
+        for percentile in (50, 95)
+    )
+
+
+def countDifferentPixels(surface, other):
+    """
+    Counts the pixels that differ between two images
+
+    Parameters:
+        surface (pygame.Surface):
+            The first image
+        other (pygame.Surface):
+            The second image
+
+    Returns the number of different pixels, or every pixel if the sizes differ
+    """
+    if surface.get_size() != other.get_size():
+        return surface.get_width() * surface.get_height()
+    pixels = pygame.image.tostring(surface, "RGB")
+    otherPixels = pygame.image.tostring(other, "RGB")
+    if pixels == otherPixels:
+        return 0
+    return sum(
+        1
+        for start in range(0, len(pixels), 3)
+        if pixels[start : start + 3] != otherPixels[start : start + 3]
+    )
+
+
+def benchmarkState(show, repeat):
+    """
+    Renders a state of the view again and again
+
+    Parameters:
+        show (function):
+            The function that shows the state on a view
+        repeat (integer):
+            The number of times to render it
+
+    Returns the image of the state and the times of full redraws and of
+    preparing and updating the view again
+    """
+    view = View(newGameModel(), pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    with contextlib.redirect_stdout(None):
+        show(view)
+        view.updateView()
+
+    redrawTimes = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        view.invalidate()
+        view.updateView()
+        redrawTimes.append(time.perf_counter() - start)
+
+    # Preparing a modal's state again would cancel the modal
+    prepareTimes = []
+    if view.modal is None:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            view.prepareView()
+            view.updateView()
+            prepareTimes.append(time.perf_counter() - start)
+
+    return (view.screen.copy(), redrawTimes, prepareTimes)
+
+
+def runBenchmark(states, repeat, golden=None, update=False, tolerance=0):
+    """
+    Renders each state of the view, reports their costs and checks their
+    images against golden images
+
+    Parameters:
+        states (list):
+            The names of the states to render
+        repeat (integer):
+            The number of times to render each state
+        golden (string):
+            The directory of the golden images, or None to skip checking
+        update (boolean):
+            The flag to determine whether to save the images as the golden
+            images instead of checking them
+        tolerance (integer):
+            The most pixels that can differ from a golden image
+
+    Returns whether every image matched its golden image
+    """
+    allStates = getStates()
+    if golden is not None:
+        os.makedirs(golden, exist_ok=True)
+
+    matched = True
+    headings = ("redraw ms", "p50", "p95", "prepare ms", "p50", "p95")
+    print(f"{'state':<16}" + "".join(f"{heading:>11}" for heading in headings))
+    for name in states:
+        (image, redrawTimes, prepareTimes) = benchmarkState(allStates[name], repeat)
+        cells = getMilliseconds(redrawTimes)
+        cells += getMilliseconds(prepareTimes) if prepareTimes else ("-",) * 3
+        row = "".join(
+            f"{cell:>11}" if cell == "-" else f"{cell:>11.3f}" for cell in cells
+        )
+
+        result = ""
+        if golden is not None:
+            path = os.path.join(golden, name + ".png")
+            if update:
+                pygame.image.save(image, path)
+                result = "saved"
+            elif not os.path.isfile(path):
+                result = "no golden image"
+                matched = False
+            else:
+                different = countDifferentPixels(image, pygame.image.load(path))
+                if different > tolerance:
+                    result = f"FAILED ({different} pixels differ)"
+                    matched = False
+                else:
+                    result = "ok"
+
+        print(f"{name:<16}{row}  {result}")
+    return matched
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Renders each Clue-Less view state without a display"
+    )
+    parser.add_argument("states", nargs="*", default=list(getStates()))
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--golden", default=None, help="golden image directory")
+    parser.add_argument("--update", action="store_true", help="save golden images")
+    parser.add_argument("--tolerance", type=int, default=0, help="pixels")
+    arguments = parser.parse_args()
+
+    initHeadless()
+    matched = runBenchmark(
+        arguments.states,
+        arguments.repeat,
+        arguments.golden,
+        arguments.update,
+        arguments.tolerance,
+    )
+    sys.exit(0 if matched else 1)
@@ -0,0 +1,93 @@
+"""Frame Scheduler for the Clue-Less Application"""
+
+import pygame
+
+
+class FrameScheduler:
+    """
+    The Frame Scheduler for the Clue-Less application
+
+    The FrameScheduler class decides how long the main loop waits between
+    frames. While the view is animating, or for a moment after any event, it
+    runs at the full frame rate. Otherwise it sleeps in pygame.event.wait
+    until an event arrives or the idle timeout passes. Input and network
+    messages are both Pygame events, so either wakes it at once.
+
+    Attributes:
+        activeRate (integer):
+            The most frames per second
+        idleTimeout (integer):
+            The most milliseconds to wait for an event while idle
+        linger (integer):
+            The milliseconds to keep running at the full rate after an event
+        clock (pygame.time.Clock):
+            The clock to cap the frame rate
+        lastActivity (integer):
+            The time in milliseconds of the last event
+        frames (integer):
+            The number of frames scheduled
+        idleFrames (integer):
+            The number of frames that waited for an event
+    """
+
+    def __init__(self, activeRate=60, idleTimeout=1000, linger=250):
+        """
+        Initializes a new frame scheduler
+
+        Parameters:
+            activeRate (integer):
+                The most frames per second
+            idleTimeout (integer):
+                The most milliseconds to wait for an event while idle
+            linger (integer):
+                The milliseconds to keep running at the full rate after an
+                event
+        """
+        self.activeRate = activeRate
+        self.idleTimeout = idleTimeout
+        self.linger = linger
+        self.clock = pygame.time.Clock()
+        self.lastActivity = 0
+        self.frames = 0
+        self.idleFrames = 0
+
+    def isIdle(self, animating):
+        """
+        Returns whether the next frame can wait for an event
+
+        Parameters:
+            animating (boolean):
+                The flag to determine whether the view is animating
+        """
+        return (
+            not animating
+            and pygame.time.get_ticks() - self.lastActivity >= self.linger
+        )
+
+    def getEvents(self, animating):
+        """
+        Waits for the next frame and gets the events that arrived
+
+        Parameters:
+            animating (boolean):
+                The flag to determine whether the view is animating
+
+        Returns the list of events to handle, which is empty if the idle
+        timeout passed without any
+        """
+        # Never run faster than the full frame rate
+        self.clock.tick(self.activeRate)
+        self.frames += 1
+
+        if self.isIdle(animating):
+            # Sleep until something happens
+            self.idleFrames += 1
+            event = pygame.event.wait(self.idleTimeout)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events += pygame.event.get()
+        else:
+            events = pygame.event.get()
+
+        if events:
+            self.lastActivity = pygame.time.get_ticks()
+        return events
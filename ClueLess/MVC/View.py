@@ -9,12 +9,15 @@ from ClueLess.MVC.GuiComponents import (
     Box,
     Button,
     Color,
+    ComponentIndex,
     Font,
+    Layer,
     SuggestionMenu,
     Text,
     TextBox,
     TitleBox,
 )
+from ClueLess.MVC.Profiler import PROFILER
 from ClueLess.States import AppState, GameState, MenuState
 
 
@@ -29,28 +32,66 @@ class View:
         model (ClueLess.MVC.Model):
             The model to display in this view
         screen (pygame.display.Surface):
-            The main display
+            The main display, or an off-screen surface when headless
+        headless (boolean):
+            The flag to determine whether the view draws without a display
         components (list):
             The list of GUI components to draw
+        fullRedraw (boolean):
+            The flag to determine whether the whole screen needs to be redrawn
+        boardLayer (ClueLess.MVC.Layer):
+            The game board drawn once, or None if it hasn't been made
+        index (ClueLess.MVC.ComponentIndex):
+            The index of the components by id, type and position
+        preparedScreen (tuple):
+            The app, menu and game states the components were prepared for
+        removedAreas (list):
+            The areas of components removed since the last update
+        modal (ClueLess.MVC.Modal):
+            The menu open over the view, or None
     """
 
-    def __init__(self, model):
+    def __init__(self, model, surface=None):
         """
         Initializes a new view
 
         Parameters:
             model (ClueLess.MVC.Model):
                 The model to update this view with
+            surface (pygame.Surface):
+                The off-screen surface to draw on instead of opening a window,
+                or None
         """
         self.model = model
+        self.headless = surface is not None
 
-        # Main screen
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Clue-Less")
+        if self.headless:
+            # Off-screen surface, such as for benchmarks without a display
+            self.screen = surface
+        else:
+            # Main screen
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Clue-Less")
 
         # Components to draw on screen
         self.components = []
 
+        # Whether the whole screen needs to be redrawn
+        self.fullRedraw = True
+
+        # The game board, kept between turns
+        self.boardLayer = None
+
+        # Index of the components, rebuilt whenever the view is prepared
+        self.index = ComponentIndex()
+
+        # Screen the components belong to, and where removed ones were drawn
+        self.preparedScreen = None
+        self.removedAreas = []
+
+        # Menu open over the view
+        self.modal = None
+
     def getComponentById(self, id):
         """
         Gets the component with the given ID
@@ -59,9 +100,9 @@ class View:
             id (string):
                 The component's ID
         """
-        for component in self.components:
-            if component.getID() == id:
-                return component
+        components = self.index.getById(id)
+        if components:
+            return components[0]
 
     def getClickedComponent(self, point):
         """
@@ -70,10 +111,10 @@ class View:
         Parameters:
             point (tuple):
                 The x and y coordinates of a point to find a component at
+
+        Returns the component drawn on top at the point
         """
-        for component in self.components:
-            if component.getArea().collidepoint(point):
-                return component
+        return self.index.getAt(point)
 
     def deactivateAllButTargetTextBox(self, target):
         """
@@ -83,12 +124,11 @@ class View:
             target (ClueLess.MVC.TextBox):
                 The text box to activate
         """
-        for component in self.components:
-            if isinstance(component, TextBox):
-                if component == target:
-                    component.activate()
-                else:
-                    component.deactivate()
+        for component in self.index.getByType(TextBox):
+            if component == target:
+                component.activate()
+            else:
+                component.deactivate()
 
     def updateActiveTextBox(self, event):
         """
@@ -98,138 +138,69 @@ class View:
             event (string):
                 The event to use to update the text box
         """
-        for component in self.components:
-            if isinstance(component, TextBox):
-                if component.isActive():
-                    component.updateText(event)
+        for component in self.index.getByType(TextBox):
+            if component.isActive():
+                component.updateText(event)
 
     def activateAllButtons(self):
         """Activates all button components, but only available movement buttons."""
-        for component in self.components:
-            if isinstance(component, Button):
-                current_player = self.model.getGame().getCurrentPlayer()
-
-                # If the game is over, no more buttons can be pressed
-                if self.model.getGame().finished:
-                    if component.id == "BackButton":
-                        component.activate()
-                    else:
-                        component.deactivate()
-                        continue
-
-                # If this player has lost, the only available button should be submit (and back)
-                if current_player.lost:
-                    if component.id == "SubmitButton" or component.id == "BackButton":
-                        component.activate()
-                    else:
-                        component.deactivate()
-                        continue
-
-                if isinstance(component, MovementButton):
-                    # Determine which movement options are available to this player
+        game = self.model.getGame()
+        current_player = game.getCurrentPlayer()
+        availableDirections = None
+
+        for component in self.index.getByType(Button):
+            # If the game is over, no more buttons can be pressed
+            if game.finished:
+                if component.id == "BackButton":
+                    component.activate()
+                else:
+                    component.deactivate()
+                    continue
+
+            # If this player has lost, the only available button should be submit (and back)
+            if current_player.lost:
+                if component.id == "SubmitButton" or component.id == "BackButton":
+                    component.activate()
+                else:
+                    component.deactivate()
+                    continue
+
+            if isinstance(component, MovementButton):
+                # Determine which movement options are available to this player
+                if availableDirections is None:
                     availableDirections = self.determineAvailableDirections()
-                    if component.direction not in availableDirections:
-                        component.deactivate()
-                        continue
-                if component.id in ["SuggestionButton", "SubmitButton"]:
+                if component.direction not in availableDirections:
+                    component.deactivate()
                     continue
-                component.activate()
+            if component.id in ["SuggestionButton", "SubmitButton"]:
+                continue
+            component.activate()
 
     def activateComponent(self, component_id):
         """Activates a component with a specific component_id.
         If no matching component is found, does nothing"""
-        for component in self.components:
-            if component.id == component_id:
-                component.activate()
+        for component in self.index.getById(component_id):
+            component.activate()
 
     def deactivateComponent(self, component_id):
         """Deactivates a component with a specific component_id.
         If no matching component is found, does nothing"""
-        for component in self.components:
-            if component.id == component_id:
-                component.deactivate()
+        for component in self.index.getById(component_id):
+            component.deactivate()
 
     def deactivateAllButtons(self):
         """Deactivates all button components"""
-        for component in self.components:
-            if isinstance(component, Button):
-                component.deactivate()
+        for component in self.index.getByType(Button):
+            component.deactivate()
 
     def deactivateMovementButtons(self):
         """Deactivates the buttons responsible for movement"""
-        for component in self.components:
-            if isinstance(component, MovementButton):
-                component.deactivate()
+        for component in self.index.getByType(MovementButton):
+            component.deactivate()
 
     def determineAvailableDirections(self):
         """Determines which movements are available to a player on their turn"""
-        # Get current tilemap
-        tilemap = self.model.getGame().getTilemap()
-        # Get current player's location
-        current_player = self.model.getGame().getCurrentPlayer()
-        playerRow, playerCol = current_player.getLocation()
-        available = {"UP", "DOWN", "RIGHT", "LEFT", "STAY", "NW", "SW", "SE", "NE"}
-
-        # Determine if Stay is avaiable
-        if not current_player.isInRoom():
-            available.remove("STAY")
-
-        # Determine if Up is available
-        if playerRow == 0:
-            # Top Row
-            available.remove("UP")
-        elif tilemap[playerRow - 1][playerCol] is None:
-            # Hallway below an empty space
-            available.remove("UP")
-        elif current_player.isInRoom() and len(tilemap[playerRow - 1][playerCol]) != 0:
-            # Hallway above is blocked
-            available.remove("UP")
-
-        # Determine if Down is available
-        if playerRow == 4:
-            # Bottom Row
-            available.remove("DOWN")
-        elif tilemap[playerRow + 1][playerCol] is None:
-            # Hallway above an empty space
-            available.remove("DOWN")
-        elif current_player.isInRoom() and len(tilemap[playerRow + 1][playerCol]) != 0:
-            # Hallway below is blocked
-            available.remove("DOWN")
-
-        # Determine if Right is available
-        if playerCol == 4:
-            # Rightmost Column
-            available.remove("RIGHT")
-        elif tilemap[playerRow][playerCol + 1] is None:
-            # Hallway to the left of an empty space
-            available.remove("RIGHT")
-        elif current_player.isInRoom() and len(tilemap[playerRow][playerCol + 1]) != 0:
-            # Hallway to the right is blocked
-            available.remove("RIGHT")
-
-        # Determine if Left is available
-        if playerCol == 0:
-            # Leftmost Column
-            available.remove("LEFT")
-        elif tilemap[playerRow][playerCol - 1] is None:
-            # Hallway to the right of an empty space
-            available.remove("LEFT")
-        elif current_player.isInRoom() and len(tilemap[playerRow][playerCol - 1]) != 0:
-            # Hallway to the left is blocked
-            available.remove("LEFT")
-
-        # Determine if any shortcuts are available
-        room = current_player.getRoom()
-        if room != "Lounge":
-            available.remove("SW")
-        if room != "Kitchen":
-            available.remove("NW")
-        if room != "Study":
-            available.remove("SE")
-        if room != "Conservatory":
-            available.remove("NE")
-
-        return available
+        return self.model.getGame().getAvailableMoves()
 
     def prepareMenu(self):
         """
@@ -782,6 +753,27 @@ class View:
                     )
                 )
 
+                # Add Bot Button
+                self.components.append(
+                    Button(
+                        id="AddBotButton",
+                        x=SCREEN_WIDTH // 2,
+                        y=580,
+                        width=180,
+                        height=60,
+                        borderThickness=2,
+                        borderRadius=12,
+                        borderColor=Color.BLACK,
+                        inactiveFillColor=Color.GRAY,
+                        activeFillColor=Color.GRAY,
+                        text="Add Bot",
+                        textColor=Color.BLACK,
+                        textHighlight=None,
+                        font=Font.DEFAULT,
+                        active=True,
+                    )
+                )
+
         def prepareGameplay():
             """Prepares the gameplay"""
 
@@ -799,6 +791,11 @@ class View:
                 # Player characteristics
                 playerSize = 20
 
+                # Rooms and hallways, which are only made if the board isn't
+                # already drawn, and player tokens
+                tiles = []
+                tokens = []
+
                 # 5x5 game board (3x3 rooms + hallways connecting rooms)
                 for row in range(5):
                     for column in range(5):
@@ -811,71 +808,72 @@ class View:
                         currentX = startX + (((roomSize + roomSpacing) // 2) * column)
                         currentY = startY + (((roomSize + roomSpacing) // 2) * row)
 
-                        if row % 2 == 0 and column % 2 == 0:
-                            # Room
-                            self.components.append(
-                                Box(
-                                    id=location + "Room",
-                                    x=currentX,
-                                    y=currentY,
-                                    width=roomSize,
-                                    height=roomSize,
-                                    borderThickness=2,
-                                    borderRadius=2,
-                                    borderColor=Color.BLACK,
-                                    inactiveFillColor=Color.BROWN,
-                                    activeFillColor=Color.BROWN,
-                                    text=location,
-                                    textColor=Color.BLACK,
-                                    textHighlight=None,
-                                    font=Font.DEFAULT,
-                                    active=True,
+                        if self.boardLayer is None:
+                            if row % 2 == 0 and column % 2 == 0:
+                                # Room
+                                tiles.append(
+                                    Box(
+                                        id=location + "Room",
+                                        x=currentX,
+                                        y=currentY,
+                                        width=roomSize,
+                                        height=roomSize,
+                                        borderThickness=2,
+                                        borderRadius=2,
+                                        borderColor=Color.BLACK,
+                                        inactiveFillColor=Color.BROWN,
+                                        activeFillColor=Color.BROWN,
+                                        text=location,
+                                        textColor=Color.BLACK,
+                                        textHighlight=None,
+                                        font=Font.DEFAULT,
+                                        active=True,
+                                    )
                                 )
-                            )
 
-                        elif row % 2 == 0 and column % 2 == 1:
-                            # Horizontal Hallway
-                            self.components.append(
-                                Box(
-                                    id=location + "Hallway",
-                                    x=currentX,
-                                    y=currentY,
-                                    width=roomSpacing + 4,
-                                    height=roomSpacing,
-                                    borderThickness=2,
-                                    borderRadius=2,
-                                    borderColor=Color.BLACK,
-                                    inactiveFillColor=Color.LIGHT_BROWN,
-                                    activeFillColor=Color.LIGHT_BROWN,
-                                    text="",
-                                    textColor=Color.BLACK,
-                                    textHighlight=None,
-                                    font=Font.DEFAULT,
-                                    active=True,
+                            elif row % 2 == 0 and column % 2 == 1:
+                                # Horizontal Hallway
+                                tiles.append(
+                                    Box(
+                                        id=location + "Hallway",
+                                        x=currentX,
+                                        y=currentY,
+                                        width=roomSpacing + 4,
+                                        height=roomSpacing,
+                                        borderThickness=2,
+                                        borderRadius=2,
+                                        borderColor=Color.BLACK,
+                                        inactiveFillColor=Color.LIGHT_BROWN,
+                                        activeFillColor=Color.LIGHT_BROWN,
+                                        text="",
+                                        textColor=Color.BLACK,
+                                        textHighlight=None,
+                                        font=Font.DEFAULT,
+                                        active=True,
+                                    )
                                 )
-                            )
 
-                        elif row % 2 == 1 and column % 2 == 0:
-                            # Vertical Hallway
-                            self.components.append(
-                                Box(
-                                    id=location + "Hallway",
-                                    x=currentX,
-                                    y=currentY,
-                                    width=roomSpacing,
-                                    height=roomSpacing + 4,
-                                    borderThickness=2,
-                                    borderRadius=2,
-                                    borderColor=Color.BLACK,
-                                    inactiveFillColor=Color.LIGHT_BROWN,
-                                    activeFillColor=Color.LIGHT_BROWN,
-                                    text="",
-                                    textColor=Color.BLACK,
-                                    textHighlight=None,
-                                    font=Font.DEFAULT,
-                                    active=True,
+                            elif row % 2 == 1 and column % 2 == 0:
+                                # Vertical Hallway
+                                tiles.append(
+                                    Box(
+                                        id=location + "Hallway",
+                                        x=currentX,
+                                        y=currentY,
+                                        width=roomSpacing,
+                                        height=roomSpacing + 4,
+                                        borderThickness=2,
+                                        borderRadius=2,
+                                        borderColor=Color.BLACK,
+                                        inactiveFillColor=Color.LIGHT_BROWN,
+                                        activeFillColor=Color.LIGHT_BROWN,
+                                        text="",
+                                        textColor=Color.BLACK,
+                                        textHighlight=None,
+                                        font=Font.DEFAULT,
+                                        active=True,
+                                    )
                                 )
-                            )
 
                         # Players for the current location
                         for playerIndex in range(len(tilemap[row][column])):
@@ -891,7 +889,7 @@ class View:
                                 x = x - (roomSize // 4) * 1
                                 y = y - (roomSize // 4) * 1
 
-                            self.components.append(
+                            tokens.append(
                                 Box(
                                     id=player.getName() + "Player",
                                     x=x + (roomSize // 4) * (playerIndex % 3),
@@ -911,94 +909,102 @@ class View:
                                 )
                             )
 
-                # Shortcuts
-                self.components.append(
-                    Box(
-                        id="NWShortcutBox",
-                        x=startX
-                        + (((roomSize + roomSpacing) // 2) * 4)
-                        - roomSize // 2,
-                        y=startY
-                        + (((roomSize + roomSpacing) // 2) * 4)
-                        - roomSize // 2,
-                        width=roomSize // 4,
-                        height=roomSize // 4,
-                        borderThickness=2,
-                        borderRadius=2,
-                        borderColor=Color.BLACK,
-                        inactiveFillColor=Color.BROWN,
-                        activeFillColor=Color.ORANGE,
-                        text="",
-                        textColor=Color.BLACK,
-                        textHighlight=None,
-                        font=Font.DEFAULT,
-                        active=True,
+                if self.boardLayer is None:
+                    # Shortcuts
+                    tiles.append(
+                        Box(
+                            id="NWShortcutBox",
+                            x=startX
+                            + (((roomSize + roomSpacing) // 2) * 4)
+                            - roomSize // 2,
+                            y=startY
+                            + (((roomSize + roomSpacing) // 2) * 4)
+                            - roomSize // 2,
+                            width=roomSize // 4,
+                            height=roomSize // 4,
+                            borderThickness=2,
+                            borderRadius=2,
+                            borderColor=Color.BLACK,
+                            inactiveFillColor=Color.BROWN,
+                            activeFillColor=Color.ORANGE,
+                            text="",
+                            textColor=Color.BLACK,
+                            textHighlight=None,
+                            font=Font.DEFAULT,
+                            active=True,
+                        )
                     )
-                )
 
-                self.components.append(
-                    Box(
-                        id="NEShortcutBox",
-                        x=startX + roomSize // 2,
-                        y=startY
-                        + (((roomSize + roomSpacing) // 2) * 4)
-                        - roomSize // 2,
-                        width=roomSize // 4,
-                        height=roomSize // 4,
-                        borderThickness=2,
-                        borderRadius=2,
-                        borderColor=Color.BLACK,
-                        inactiveFillColor=Color.BROWN,
-                        activeFillColor=Color.CYAN,
-                        text="",
-                        textColor=Color.BLACK,
-                        textHighlight=None,
-                        font=Font.DEFAULT,
-                        active=True,
+                    tiles.append(
+                        Box(
+                            id="NEShortcutBox",
+                            x=startX + roomSize // 2,
+                            y=startY
+                            + (((roomSize + roomSpacing) // 2) * 4)
+                            - roomSize // 2,
+                            width=roomSize // 4,
+                            height=roomSize // 4,
+                            borderThickness=2,
+                            borderRadius=2,
+                            borderColor=Color.BLACK,
+                            inactiveFillColor=Color.BROWN,
+                            activeFillColor=Color.CYAN,
+                            text="",
+                            textColor=Color.BLACK,
+                            textHighlight=None,
+                            font=Font.DEFAULT,
+                            active=True,
+                        )
                     )
-                )
 
-                self.components.append(
-                    Box(
-                        id="SWShortcutBox",
-                        x=startX
-                        + (((roomSize + roomSpacing) // 2) * 4)
-                        - roomSize // 2,
-                        y=startY + (roomSize // 2),
-                        width=roomSize // 4,
-                        height=roomSize // 4,
-                        borderThickness=2,
-                        borderRadius=2,
-                        borderColor=Color.BLACK,
-                        inactiveFillColor=Color.BROWN,
-                        activeFillColor=Color.CYAN,
-                        text="",
-                        textColor=Color.BLACK,
-                        textHighlight=None,
-                        font=Font.DEFAULT,
-                        active=True,
+                    tiles.append(
+                        Box(
+                            id="SWShortcutBox",
+                            x=startX
+                            + (((roomSize + roomSpacing) // 2) * 4)
+                            - roomSize // 2,
+                            y=startY + (roomSize // 2),
+                            width=roomSize // 4,
+                            height=roomSize // 4,
+                            borderThickness=2,
+                            borderRadius=2,
+                            borderColor=Color.BLACK,
+                            inactiveFillColor=Color.BROWN,
+                            activeFillColor=Color.CYAN,
+                            text="",
+                            textColor=Color.BLACK,
+                            textHighlight=None,
+                            font=Font.DEFAULT,
+                            active=True,
+                        )
                     )
-                )
 
-                self.components.append(
-                    Box(
-                        id="SEShortcutBox",
-                        x=startX + roomSize // 2,
-                        y=startY + (roomSize // 2),
-                        width=roomSize // 4,
-                        height=roomSize // 4,
-                        borderThickness=2,
-                        borderRadius=2,
-                        borderColor=Color.BLACK,
-                        inactiveFillColor=Color.BROWN,
-                        activeFillColor=Color.ORANGE,
-                        text="",
-                        textColor=Color.BLACK,
-                        textHighlight=None,
-                        font=Font.DEFAULT,
-                        active=True,
+                    tiles.append(
+                        Box(
+                            id="SEShortcutBox",
+                            x=startX + roomSize // 2,
+                            y=startY + (roomSize // 2),
+                            width=roomSize // 4,
+                            height=roomSize // 4,
+                            borderThickness=2,
+                            borderRadius=2,
+                            borderColor=Color.BLACK,
+                            inactiveFillColor=Color.BROWN,
+                            activeFillColor=Color.ORANGE,
+                            text="",
+                            textColor=Color.BLACK,
+                            textHighlight=None,
+                            font=Font.DEFAULT,
+                            active=True,
+                        )
                     )
-                )
+
+                    # The board never changes, so it is drawn once as a layer
+                    self.boardLayer = Layer(id="GameBoard", components=tiles)
+
+                # Players are drawn over the board
+                self.components.append(self.boardLayer)
+                self.components += tokens
 
             def prepareTurnDisplay():
                 """Prepares the turn display"""
@@ -1384,9 +1390,7 @@ class View:
 
             # Player Cards Title Bar
             player_name = "Player"
-            current_id = self.model.getPlayerId()
-            players = self.model.getPlayers()
-            player = next((p for p in players if p.getPlayerId() == current_id), None)
+            player = self.model.getGame().findPlayerFromId(self.model.getPlayerId())
             if player:
                 player_name = player.getName()
 
@@ -1401,10 +1405,6 @@ class View:
             )
 
             # Player Cards List
-            current_id = self.model.getPlayerId()
-            players = self.model.getPlayers()
-
-            player = next((p for p in players if p.getPlayerId() == current_id), None)
             cards = player.grouped_cards
 
             # Layout configuration
@@ -1481,23 +1481,102 @@ class View:
             prepareGameplay()
 
     def prepareView(self):
-        """Prepares the view"""
-        if self.model.appState == AppState.MENU:
-            # Menu
-            self.prepareMenu()
-        elif self.model.appState == AppState.GAME:
-            # Game
-            self.prepareGame()
+        """
+        Prepares the view
 
-    def updateView(self):
-        """Updates the view"""
-        # Clear display
-        self.screen.fill(Color.WHITE)
+        When the view is prepared again for the same screen, the components
+        already shown are kept and changed to match the new ones, so only
+        what changed is redrawn and text boxes keep their text and focus.
+        """
+        with PROFILER.measure("prepare"):
+            previous = self.components
+            screen = (self.model.appState, self.model.menuState, self.model.gameState)
+
+            if self.model.appState == AppState.MENU:
+                # Menu
+                self.prepareMenu()
+            elif self.model.appState == AppState.GAME:
+                # Game
+                self.prepareGame()
+
+            if screen == self.preparedScreen:
+                self.components = self.keepComponents(previous, self.components)
+            else:
+                # Every component was replaced, and an open menu no longer applies
+                self.closeModal()
+                self.invalidate()
+            self.preparedScreen = screen
+            self.index.rebuild(self.components)
+
+    def keepComponents(self, previous, components):
+        """
+        Keeps the previous components that are still shown
 
-        for component in self.components:
-            # Draw each component
-            component.draw(self.screen)
+        Parameters:
+            previous (list):
+                The components shown before
+            components (list):
+                The new components
+
+        Returns the new components, with each one replaced by the previous
+        component of the same type and ID if there is one
+        """
+        kept = {}
+        for component in previous:
+            kept.setdefault((type(component), component.id), []).append(component)
+
+        merged = []
+        for component in components:
+            matches = kept.get((type(component), component.id))
+            if matches:
+                keptComponent = matches.pop(0)
+                if keptComponent is not component:
+                    keptComponent.patch(component)
+                merged.append(keptComponent)
+            else:
+                merged.append(component)
+
+        # Components no longer shown leave an area to clear
+        for matches in kept.values():
+            for component in matches:
+                if component.drawnArea is not None:
+                    self.removedAreas.append(component.drawnArea)
+
+        return merged
+
+    def isAnimating(self):
+        """
+        Returns whether the view has anything left to draw
+
+        Nothing in the view moves on its own yet, so it only needs more frames
+        while there are changes it hasn't drawn, or while the profiler display
+        is shown so it keeps refreshing.
+        """
+        return (
+            self.fullRedraw
+            or PROFILER.visible
+            or bool(self.removedAreas)
+            or any(component.dirty for component in self.components)
+        )
+
+    def invalidate(self):
+        """Marks the whole screen to be redrawn on the next update"""
+        self.fullRedraw = True
+
+    def invalidateLayers(self):
+        """Marks the layers to be drawn again, after a resize or color change"""
+        if self.boardLayer is not None:
+            self.boardLayer.invalidate()
+        self.invalidate()
+
+    def updateView(self):
+        """
+        Updates the view
 
+        Only the areas of the screen covered by components that changed since
+        the last update are redrawn, so nothing is drawn while the view is
+        idle.
+        """
         if self.model.getGame() is not None:
             if self.model.getGame().finished:
                 pid = self.getComponentById("PlayerID")
@@ -1506,14 +1585,159 @@ class View:
                 else:
                     pid.text = f"{self.model.getGame().winner} wins!"
 
-        pygame.display.flip()
+        if self.fullRedraw:
+            with PROFILER.measure("draw"):
+                self.drawAll()
+            if not self.headless:
+                with PROFILER.measure("present"):
+                    pygame.display.flip()
+            return
+
+        dirtyAreas = self.getDirtyAreas()
+        if not dirtyAreas:
+            return
+
+        with PROFILER.measure("draw"):
+            self.drawAreas(dirtyAreas)
+        if not self.headless:
+            with PROFILER.measure("present"):
+                pygame.display.update(dirtyAreas)
+
+    def drawAll(self):
+        """Draws the whole screen"""
+        # Clear display
+        self.screen.fill(Color.WHITE)
+
+        for component in self.components:
+            # Draw each component
+            component.draw(self.screen)
+            component.markDrawn()
+            self.index.move(component)
+
+        if self.modal is not None:
+            # Draw the open menu over everything
+            self.modal.draw(self.screen)
+            self.modal.markDrawn()
+
+        if PROFILER.visible:
+            PROFILER.draw(self.screen)
+
+        self.fullRedraw = False
+        self.removedAreas = []
 
-    def openSuggestionMenu(self, room):
-        menu = SuggestionMenu(room, x=SCREEN_WIDTH // 2, y=SCREEN_HEIGHT // 2)
+    def getDirtyAreas(self):
+        """
+        Marks the changed components as drawn
+
+        Returns the areas covered by removed and changed components, before
+        and after the change, and by the profiler display if it changed
+        """
+        dirtyAreas = self.removedAreas
+        self.removedAreas = []
+        for component in self.components:
+            if component.dirty:
+                dirtyAreas += component.markDrawn()
+                self.index.move(component)
+        if self.modal is not None:
+            dirtyAreas += self.modal.getDirtyAreas()
+        if PROFILER.visible and PROFILER.refreshHud():
+            dirtyAreas.append(PROFILER.getArea())
+        return dirtyAreas
+
+    def drawAreas(self, areas):
+        """
+        Draws areas of the screen
+
+        Parameters:
+            areas (list):
+                The areas to draw
+        """
+        for area in areas:
+            # Redraw everything over each area, in order, so overlaps still work
+            self.screen.set_clip(area)
+            self.screen.fill(Color.WHITE)
+            for component in self.components:
+                if component.drawnArea.colliderect(area):
+                    component.draw(self.screen)
+            if self.modal is not None and self.modal.getArea().colliderect(area):
+                self.modal.draw(self.screen)
+            if PROFILER.visible and PROFILER.getArea().colliderect(area):
+                PROFILER.draw(self.screen)
+        self.screen.set_clip(None)
+
+    def toggleProfiler(self):
+        """Shows or hides the profiler display"""
+        PROFILER.toggle()
+        self.invalidate()
+
+    def openModal(self, modal):
+        """
+        Opens a menu over the view, closing any menu already open
+
+        Parameters:
+            modal (ClueLess.MVC.Modal):
+                The menu to open
+        """
+        self.closeModal()
+        self.modal = modal
+        self.invalidate()
+
+    def closeModal(self):
+        """Cancels the open menu, if there is one"""
+        if self.modal is not None:
+            modal = self.modal
+            self.modal = None
+            modal.close(None)
+            self.invalidate()
+
+    def handleModalEvent(self, event):
+        """
+        Passes an event to the open menu
+
+        Parameters:
+            event (pygame.event.Event):
+                The Pygame event to handle
+
+        Returns whether the menu took the event, in which case the view
+        shouldn't handle it
+        """
+        if self.modal is None:
+            return False
+
+        modal = self.modal
+        handled = modal.handleEvent(event)
+        if modal.closed and self.modal is modal:
+            # The menu was drawn over the view
+            self.modal = None
+            self.invalidate()
+        return handled
+
+    def openSuggestionMenu(self, room, callback):
+        """
+        Opens the suggestion menu
 
-        return menu.open(self.screen)
+        Parameters:
+            room (string):
+                The room the suggestion is made in
+            callback (function):
+                The function to call with the suggestion, or None if it was
+                cancelled
+        """
+        self.openModal(
+            SuggestionMenu(
+                room, x=SCREEN_WIDTH // 2, y=SCREEN_HEIGHT // 2, callback=callback
+            )
+        )
 
-    def openAccusationMenu(self):
-        menu = AccusationMenu(x=SCREEN_WIDTH // 2, y=SCREEN_HEIGHT // 2)
+    def openAccusationMenu(self, callback):
+        """
+        Opens the accusation menu
 
-        return menu.open(self.screen)
+        Parameters:
+            callback (function):
+                The function to call with the accusation, or None if it was
+                cancelled
+        """
+        self.openModal(
+            AccusationMenu(x=SCREEN_WIDTH // 2, y=SCREEN_HEIGHT // 2, callback=callback)
+        )
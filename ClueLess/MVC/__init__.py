@@ -4,16 +4,25 @@ Clue-Less Model-View-Controller package
 This package contains the MVC architecture for our Clue-Less game.
 
 Modules:
+    Assets:
+        The asset manager that loads fonts and images on first use
     Controller:
         The controller for the MVC
     Model:
         The model for the MVC
+    Profiler:
+        The frame profiler and its heads-up display
+    RenderBenchmark:
+        The headless benchmark and golden image check of each view state
+    Scheduler:
+        The frame scheduler for the main loop
     View:
         The view for the MVC
 """
 
 from .Controller import Controller
 from .Model import Model
+from .Scheduler import FrameScheduler
 from .View import View
 
-__all__ = ["Controller", "Model", "View"]
+__all__ = ["Controller", "FrameScheduler", "Model", "View"]
@@ -1,33 +1,42 @@
-from ClueLess.Constants import CHARACTER_COLORS, STARTING_LOCATIONS
+from ClueLess.Constants import (
+    BOARD_SIZE,
+    CHARACTER_COLORS,
+    LOCATION_COORDINATES,
+    STARTING_LOCATIONS,
+)
 from ClueLess.Cards import Cards
+from ClueLess.Variant import VARIANT
 
 
 class Player:
     """
     A Player in the Clue-Less Game
 
-    The Player class acts as a single player in the Clue-Less game.
+    The Player class acts as a single player in the Clue-Less game. Its state
+    is kept in '__slots__' with the location and cards stored as small indices
+    so that many games can be held in memory at once.
 
     Attributes:
         name (string):
             The name of the player
         playerId (integer):
             The player's ID
-        color (tuple):
-            The player's color
-        location (tuple):
-            The location of the player in the tilemap represented in (row, column)
-        cards (list):
-            The list of cards that this player has
+        locationIndex (integer):
+            The index of the player's location in the tilemap
+            (row * BOARD_SIZE + column)
+        cardIndices (tuple):
+            The indices of this player's cards in ClueLess.Cards.ALL
+        lost (boolean):
+            Whether the player has lost (or was never seated)
     """
 
-    ROOM_NAMES = [
-        ["Study", None, "Hall", None, "Lounge"],
-        [None, None, None, None, None],
-        ["Library", None, "Billiard", None, "Dining"],
-        [None, None, None, None, None],
-        ["Conservatory", None, "Ballroom", None, "Kitchen"],
-    ]
+    __slots__ = ["name", "playerId", "locationIndex", "cardIndices", "lost"]
+
+    # Room at each location, or None for hallways and empty spaces
+    ROOM_NAMES = VARIANT.roomNames
+
+    # Location indices of the rooms
+    ROOM_LOCATIONS = VARIANT.roomLocations
 
     def __init__(self, name):
         """
@@ -40,14 +49,10 @@ class Player:
         self.name = name
         self.playerId = None
 
-        self.color = CHARACTER_COLORS[self.name]
-
-        self.location = STARTING_LOCATIONS[self.name]
+        row, column = STARTING_LOCATIONS[self.name]
+        self.locationIndex = row * BOARD_SIZE + column
 
-        self.cards = []
-
-        ## Added for use with Player's Cards Display
-        self.grouped_cards = {"characters": [], "weapons": [], "rooms": []}
+        self.cardIndices = ()
         self.lost = True
 
     def getName(self):
@@ -73,46 +78,29 @@ class Player:
 
     def getColor(self):
         """Gets the player's color"""
-        return self.color
+        return CHARACTER_COLORS[self.name]
 
-    def setColor(self, color):
-        """
-        Sets the player's color'
-
-        Parameters:
-            color (tuple):
-                The new color for this player
-        """
-        self.color = color
+    @property
+    def location(self):
+        """The location of the player in the tilemap as (row, column)"""
+        return LOCATION_COORDINATES[self.locationIndex]
 
     def getLocation(self):
         """Gets the player's location"""
-        return self.location
+        return LOCATION_COORDINATES[self.locationIndex]
 
     def getRoom(self):
-        row, col = self.location
+        row, col = self.getLocation()
         return self.ROOM_NAMES[row][col]
 
     def isInRoom(self):
         """Returns whether the player is in a room (vs. a hallway)"""
-        room_locations = [
-            (0, 0),
-            (2, 0),
-            (4, 0),
-            (0, 2),
-            (2, 2),
-            (4, 2),
-            (0, 4),
-            (2, 4),
-            (4, 4),
-        ]
-        return self.location in room_locations
+        row, col = self.getLocation()
+        return self.ROOM_NAMES[row][col] is not None
 
     def setRoom(self, room):
-        for r in range(len(self.ROOM_NAMES)):
-            for c in range(len(self.ROOM_NAMES[r])):
-                if self.ROOM_NAMES[r][c] == room:
-                    self.setLocation((r, c))
+        if room in self.ROOM_LOCATIONS:
+            self.locationIndex = self.ROOM_LOCATIONS[room]
 
     def setLocation(self, location):
         """
@@ -122,11 +110,12 @@ class Player:
             location (tuple):
                 The new location for this player
         """
-        self.location = location
+        row, column = location
+        self.locationIndex = row * BOARD_SIZE + column
 
     def getCards(self):
-        """Gets the player's cards"""
-        return self.cards
+        """Gets a list of the player's cards"""
+        return [Cards.ALL[index] for index in self.cardIndices]
 
     def setCards(self, cards):
         """
@@ -134,29 +123,26 @@ class Player:
 
         Parameters:
             cards (list):
-                The new location for this player
+                The new cards for this player
         """
-        self.cards = cards
-        self._categorizeCards()
+        self.cardIndices = tuple(Cards.INDEX[card] for card in cards)
 
-    def _categorizeCards(self):
+    def hasCard(self, card):
         """
-        Generates dictionary of categorized cards for GUI
+        Returns whether the player has a card
+
+        Parameters:
+            card (string):
+                The card to look for
         """
-        characters = []
-        weapons = []
-        rooms = []
-
-        for card in self.cards:
-            if card in Cards.CHARACTERS:
-                characters.append(card)
-            elif card in Cards.WEAPONS:
-                weapons.append(card)
-            elif card in Cards.ROOMS:
-                rooms.append(card)
-
-        self.grouped_cards = {
-            "characters": characters,
-            "weapons": weapons,
-            "rooms": rooms,
+        return Cards.INDEX[card] in self.cardIndices
+
+    @property
+    def grouped_cards(self):
+        """The player's cards grouped by category for the GUI"""
+        cards = self.getCards()
+        return {
+            "characters": [card for card in cards if card in Cards.CHARACTERS],
+            "weapons": [card for card in cards if card in Cards.WEAPONS],
+            "rooms": [card for card in cards if card in Cards.ROOMS],
         }
@@ -0,0 +1,308 @@
+"""Storage for the Clue-Less Application"""
+
+import os
+import pickle
+import struct
+import zlib
+
+from ClueLess.Journal import RECORD, Journal
+
+# Entry types in a game's log file
+HEADER_ENTRY = 1
+RECORD_ENTRY = 2
+
+# Entry type, payload length and payload checksum
+ENTRY = struct.Struct("<BII")
+
+# Turn number of a snapshot
+SNAPSHOT = struct.Struct("<I")
+
+LOG_EXTENSION = ".log"
+SNAPSHOT_EXTENSION = ".snapshot"
+
+# Added to the files of games that could not be restored
+CORRUPT_EXTENSION = ".corrupt"
+
+
+def encodeEntry(entryType, payload):
+    """
+    Encodes an entry for a game's log file
+
+    Parameters:
+        entryType (integer):
+            The type of the entry
+        payload (bytes):
+            The data of the entry
+    """
+    return ENTRY.pack(entryType, len(payload), zlib.crc32(payload)) + payload
+
+
+def decodeEntries(data):
+    """
+    Decodes the entries of a game's log file
+
+    Decoding stops at the first entry that was only partly written or is
+    corrupted, which is where a crash would have left the file.
+
+    Parameters:
+        data (bytes):
+            The contents of the log file
+
+    Returns a list of (entry type, payload) tuples and the number of valid bytes
+    """
+    entries = []
+    offset = 0
+    while offset + ENTRY.size <= len(data):
+        (entryType, length, checksum) = ENTRY.unpack_from(data, offset)
+        start = offset + ENTRY.size
+        payload = data[start : start + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            # Torn or corrupted write
+            break
+
+        entries.append((entryType, payload))
+        offset = start + length
+
+    return (entries, offset)
+
+
+class GameStore:
+    """
+    The Game Store for the Clue-Less application
+
+    The GameStore class saves the journals of hosted games to a directory so
+    they can be restored after the server restarts. The directory is only
+    created once a game is written. Each game has a log file that turn
+    records are appended to and a snapshot file that is replaced
+    atomically. Appended records are buffered and written together, with a
+    single fsync per file, when the store is flushed at the end of a turn.
+
+    Attributes:
+        directory (string):
+            The directory the games are stored in
+        pending (dict):
+            The log data waiting to be flushed, keyed by game ID
+    """
+
+    def __init__(self, directory):
+        """
+        Initializes a new game store
+
+        Parameters:
+            directory (string):
+                The directory to store games in
+        """
+        self.directory = directory
+        self.pending = {}
+
+    def createDirectory(self):
+        """Creates the store's directory if it doesn't exist yet"""
+        os.makedirs(self.directory, exist_ok=True)
+
+    def getLogPath(self, gameId):
+        """
+        Gets the path to a game's log file
+
+        Parameters:
+            gameId (string):
+                The ID of the game
+        """
+        return os.path.join(self.directory, gameId + LOG_EXTENSION)
+
+    def getSnapshotPath(self, gameId):
+        """
+        Gets the path to a game's snapshot file
+
+        Parameters:
+            gameId (string):
+                The ID of the game
+        """
+        return os.path.join(self.directory, gameId + SNAPSHOT_EXTENSION)
+
+    def getGameIds(self):
+        """Gets the IDs of the stored games, most recently updated last"""
+        if not os.path.isdir(self.directory):
+            # Nothing has been stored yet
+            return []
+
+        logs = [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.is_file() and entry.name.endswith(LOG_EXTENSION)
+        ]
+        logs.sort(key=lambda entry: entry.stat().st_mtime)
+        return [entry.name[: -len(LOG_EXTENSION)] for entry in logs]
+
+    def create(self, gameId, journal):
+        """
+        Creates a stored game and attaches the store to its journal
+
+        Parameters:
+            gameId (string):
+                The ID of the game
+            journal (ClueLess.Journal):
+                The journal of the game
+        """
+        header = pickle.dumps((journal.header, journal.snapshotInterval))
+        self.pending[gameId] = bytearray(encodeEntry(HEADER_ENTRY, header))
+
+        journal.gameId = gameId
+        journal.store = self
+
+    def append(self, gameId, record):
+        """
+        Appends a turn record to a game's log once the store is flushed
+
+        Parameters:
+            gameId (string):
+                The ID of the game
+            record (bytes):
+                The binary turn record
+        """
+        self.pending.setdefault(gameId, bytearray()).extend(
+            encodeEntry(RECORD_ENTRY, record)
+        )
+
+    def saveSnapshot(self, gameId, turnNumber, data):
+        """
+        Atomically replaces a game's snapshot
+
+        Parameters:
+            gameId (string):
+                The ID of the game
+            turnNumber (integer):
+                The turn number of the snapshot
+            data (bytes):
+                The pickled game
+        """
+        # Records before the snapshot must be on disk before it replaces the
+        # old one, otherwise a crash could leave a gap in the log
+        self.flush(gameId)
+        self.createDirectory()
+
+        path = self.getSnapshotPath(gameId)
+        temporaryPath = path + ".tmp"
+        with open(temporaryPath, "wb") as file:
+            file.write(SNAPSHOT.pack(turnNumber))
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporaryPath, path)
+        self.fsyncDirectory()
+
+    def flush(self, gameId=None):
+        """
+        Writes the pending log data to disk
+
+        Parameters:
+            gameId (string):
+                The ID of the game to flush, or None for every game
+        """
+        gameIds = list(self.pending) if gameId is None else [gameId]
+        for pendingGameId in gameIds:
+            data = self.pending.pop(pendingGameId, None)
+            if not data:
+                continue
+
+            self.createDirectory()
+            with open(self.getLogPath(pendingGameId), "ab") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+
+    def remove(self, gameId):
+        """
+        Removes a stored game
+
+        Parameters:
+            gameId (string):
+                The ID of the game
+        """
+        self.pending.pop(gameId, None)
+        for path in (self.getLogPath(gameId), self.getSnapshotPath(gameId)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def quarantine(self, gameId):
+        """
+        Sets aside a stored game that could not be restored
+
+        Its files are renamed rather than removed so they can be looked at.
+
+        Parameters:
+            gameId (string):
+                The ID of the game
+        """
+        self.pending.pop(gameId, None)
+        for path in (self.getLogPath(gameId), self.getSnapshotPath(gameId)):
+            try:
+                os.replace(path, path + CORRUPT_EXTENSION)
+            except FileNotFoundError:
+                pass
+
+    def load(self, gameId):
+        """
+        Loads the journal of a stored game
+
+        Parameters:
+            gameId (string):
+                The ID of the game
+
+        Returns the journal, or None if the game could not be loaded
+        """
+        path = self.getLogPath(gameId)
+        with open(path, "rb") as file:
+            data = file.read()
+
+        (entries, validLength) = decodeEntries(data)
+        if not entries or entries[0][0] != HEADER_ENTRY:
+            return None
+
+        if validLength < len(data):
+            # Drop the torn tail so new records follow the last good one
+            with open(path, "r+b") as file:
+                file.truncate(validLength)
+                os.fsync(file.fileno())
+
+        (header, snapshotInterval) = pickle.loads(entries[0][1])
+        journal = Journal(header, snapshotInterval)
+        for entryType, payload in entries[1:]:
+            if entryType == RECORD_ENTRY and len(payload) == RECORD.size:
+                journal.records += payload
+
+        try:
+            with open(self.getSnapshotPath(gameId), "rb") as file:
+                snapshot = file.read()
+        except FileNotFoundError:
+            pass
+        else:
+            (turnNumber,) = SNAPSHOT.unpack_from(snapshot)
+            journal.snapshots[turnNumber] = snapshot[SNAPSHOT.size :]
+
+        journal.gameId = gameId
+        journal.store = self
+        return journal
+
+    def loadAll(self):
+        """Loads the journals of every stored game, keyed by game ID"""
+        journals = {}
+        for gameId in self.getGameIds():
+            journal = self.load(gameId)
+            if journal is not None:
+                journals[gameId] = journal
+        return journals
+
+    def fsyncDirectory(self):
+        """Makes renames in the store's directory durable"""
+        if os.name == "nt":
+            # Windows does not support opening directories
+            return
+
+        descriptor = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
@@ -0,0 +1,462 @@
+"""Tournament for the Clue-Less Application"""
+
+import argparse
+import contextlib
+import functools
+import itertools
+import json
+import math
+import os
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from ClueLess.Bots import DeductionStrategy, GreedyStrategy, RandomStrategy
+from ClueLess.Deduction import KnowledgeBase
+from ClueLess.Game import Game
+from ClueLess.MCTS import MCTSStrategy
+
+# Strategies that can play in a tournament, keyed by name
+STRATEGIES = {
+    "random": RandomStrategy,
+    "greedy": GreedyStrategy,
+    "deduction": DeductionStrategy,
+    # A fixed number of playouts keeps tournament games reproducible
+    "mcts": functools.partial(MCTSStrategy, iterations=200),
+}
+
+# Columns of the results file in the form {name: array typecode}
+COLUMNS = {
+    "match": "I",
+    "game": "I",
+    "seed": "I",
+    "winner": "b",
+    "turns": "I",
+}
+
+# Winner column value when nobody won
+NO_WINNER = -1
+
+
+def getGameSeed(seed, gameNumber):
+    """
+    Gets the seed of a game in a tournament
+
+    Parameters:
+        seed (integer):
+            The seed of the tournament
+        gameNumber (integer):
+            The number of the game within its match
+    """
+    return (seed * 0x9E3779B1 + gameNumber * 0x85EBCA6B) % (1 << 32)
+
+
+def playGame(strategies, seed, maxTurns=1000):
+    """
+    Plays a game between strategies without a GUI or network
+
+    Parameters:
+        strategies (list):
+            The strategy classes, one for each seat
+        seed (integer):
+            The seed of the game and its strategies
+        maxTurns (integer):
+            The number of turns after which the game is a draw
+
+    Returns the winning seat (or NO_WINNER) and the number of turns made
+    """
+    # Game.pickSolution prints the solution
+    with contextlib.redirect_stdout(None):
+        game = Game(seed)
+        playerIds = list(range(1, len(strategies) + 1))
+        game.updatePlayers(playerIds)
+        game.start()
+
+    players = [
+        strategy(seed * len(strategies) + seat)
+        for seat, strategy in enumerate(strategies)
+    ]
+    knowledge = [KnowledgeBase.fromGame(game, playerId) for playerId in playerIds]
+
+    try:
+        while not game.finished and game.turnNumber < maxTurns:
+            # Seats are filled in order, so the seat is the player index
+            seat = game.currentTurnIndex
+            turn = players[seat].chooseTurn(game, knowledge[seat])
+            turn.playerId = playerIds[seat]
+            game.makeMove(turn)
+
+            for playerKnowledge in knowledge:
+                playerKnowledge.update(game)
+    finally:
+        for player in players:
+            player.close()
+
+    if game.winner is None:
+        return (NO_WINNER, game.turnNumber)
+    return (game.PLAYER_INDEX[game.winner], game.turnNumber)
+
+
+def playChunk(names, matchIndex, firstGame, count, seed, maxTurns):
+    """
+    Plays a chunk of games of a match
+
+    Parameters:
+        names (tuple):
+            The names of the strategies, one for each seat
+        matchIndex (integer):
+            The index of the match
+        firstGame (integer):
+            The number of the first game of the chunk
+        count (integer):
+            The number of games to play
+        seed (integer):
+            The seed of the tournament
+        maxTurns (integer):
+            The number of turns after which a game is a draw
+
+    Returns the result columns as {name: array}
+    """
+    strategies = [STRATEGIES[name] for name in names]
+    columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+    for gameNumber in range(firstGame, firstGame + count):
+        gameSeed = getGameSeed(seed, gameNumber)
+        (winner, turns) = playGame(strategies, gameSeed, maxTurns)
+
+        columns["match"].append(matchIndex)
+        columns["game"].append(gameNumber)
+        columns["seed"].append(gameSeed)
+        columns["winner"].append(winner)
+        columns["turns"].append(turns)
+    return columns
+
+
+def getWilsonInterval(wins, games, z=1.96):
+    """
+    Gets the Wilson score interval of a win rate
+
+    Parameters:
+        wins (integer):
+            The number of games won
+        games (integer):
+            The number of games played
+        z (float):
+            The normal quantile of the confidence level (1.96 for 95%)
+
+    Returns the (low, high) bounds of the interval
+    """
+    if games == 0:
+        return (0.0, 1.0)
+
+    rate = wins / games
+    denominator = 1 + z * z / games
+    center = (rate + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games))
+    return (center - margin / denominator, center + margin / denominator)
+
+
+class ResultsFile:
+    """
+    The Results File of a Clue-Less Tournament
+
+    The ResultsFile class stores tournament results column by column in a
+    directory: one file of packed values per column (see COLUMNS) that chunks
+    are appended to as they finish, and a JSON file describing the matches.
+
+    Attributes:
+        directory (string):
+            The directory the columns are stored in
+    """
+
+    def __init__(self, directory):
+        """
+        Initializes a results file
+
+        Parameters:
+            directory (string):
+                The directory to store the columns in
+        """
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def getColumnPath(self, name):
+        """
+        Gets the path to a column's file
+
+        Parameters:
+            name (string):
+                The name of the column
+        """
+        return os.path.join(self.directory, name + "." + COLUMNS[name])
+
+    def create(self, header):
+        """
+        Writes the description of the tournament and empties every column
+
+        Parameters:
+            header (dict):
+                The description of the tournament
+        """
+        with open(os.path.join(self.directory, "header.json"), "w") as file:
+            json.dump(header, file, indent=4)
+
+        for name in COLUMNS:
+            open(self.getColumnPath(name), "wb").close()
+
+    def readHeader(self):
+        """Reads the description of the tournament"""
+        with open(os.path.join(self.directory, "header.json")) as file:
+            return json.load(file)
+
+    def append(self, columns):
+        """
+        Appends rows to every column
+
+        Parameters:
+            columns (dict):
+                The rows to append as {name: array}
+        """
+        for name, values in columns.items():
+            with open(self.getColumnPath(name), "ab") as file:
+                values.tofile(file)
+
+    def read(self):
+        """Reads every column as {name: array}"""
+        columns = {}
+        for name, typecode in COLUMNS.items():
+            values = array(typecode)
+            path = self.getColumnPath(name)
+            if os.path.exists(path):
+                with open(path, "rb") as file:
+                    data = file.read()
+                # Ignore a value that was only partly written
+                values.frombytes(data[: len(data) - len(data) % values.itemsize])
+            columns[name] = values
+
+        # Drop a row that was only partly written to some columns
+        rows = min(len(values) for values in columns.values())
+        return {name: values[:rows] for name, values in columns.items()}
+
+
+class Tournament:
+    """
+    A Clue-Less Tournament
+
+    The Tournament class plays round-robin matches between strategies: every
+    ordered seating of playersPerGame different strategies is a match, so each
+    strategy plays every seat against every opponent. Games are split into
+    chunks that are played across a process pool. Each game is seeded from the
+    tournament seed and its number, so any game can be replayed and game N
+    deals the same cards in every match. Win rates are updated and the
+    results file is appended to as chunks finish.
+
+    Attributes:
+        names (list):
+            The names of the strategies in the tournament
+        playersPerGame (integer):
+            The number of players in each game
+        gamesPerMatch (integer):
+            The number of games played for each seating
+        seed (integer):
+            The seed of the tournament
+        chunkSize (integer):
+            The number of games in each unit of work
+        maxTurns (integer):
+            The number of turns after which a game is a draw
+        matches (list):
+            The seatings of strategy names, one for each match
+        games (dict):
+            The number of games played by each strategy
+        wins (dict):
+            The number of games won by each strategy
+        draws (integer):
+            The number of games nobody won
+        played (integer):
+            The number of games played
+    """
+
+    def __init__(
+        self,
+        names,
+        playersPerGame=3,
+        gamesPerMatch=100,
+        seed=0,
+        chunkSize=50,
+        maxTurns=1000,
+    ):
+        """
+        Initializes a new tournament
+
+        Parameters:
+            names (list):
+                The names of the strategies in STRATEGIES to play
+            playersPerGame (integer):
+                The number of players in each game
+            gamesPerMatch (integer):
+                The number of games played for each seating
+            seed (integer):
+                The seed of the tournament
+            chunkSize (integer):
+                The number of games in each unit of work
+            maxTurns (integer):
+                The number of turns after which a game is a draw
+        """
+        self.names = list(names)
+        self.playersPerGame = playersPerGame
+        self.gamesPerMatch = gamesPerMatch
+        self.seed = seed
+        self.chunkSize = chunkSize
+        self.maxTurns = maxTurns
+
+        if len(self.names) >= playersPerGame:
+            self.matches = list(itertools.permutations(self.names, playersPerGame))
+        else:
+            # Not enough strategies for one each, so they play more than one seat
+            self.matches = list(itertools.product(self.names, repeat=playersPerGame))
+
+        self.games = {name: 0 for name in self.names}
+        self.wins = {name: 0 for name in self.names}
+        self.draws = 0
+        self.played = 0
+
+    def getChunks(self):
+        """Yields the (match index, first game, count) units of work"""
+        for matchIndex in range(len(self.matches)):
+            for firstGame in range(0, self.gamesPerMatch, self.chunkSize):
+                count = min(self.chunkSize, self.gamesPerMatch - firstGame)
+                yield (matchIndex, firstGame, count)
+
+    def addResults(self, columns):
+        """
+        Adds the results of a chunk to the win rates
+
+        Parameters:
+            columns (dict):
+                The result columns of the chunk
+        """
+        self.played += len(columns["match"])
+        for matchIndex, winner in zip(columns["match"], columns["winner"]):
+            seating = self.matches[matchIndex]
+            for name in set(seating):
+                self.games[name] += 1
+            if winner == NO_WINNER:
+                self.draws += 1
+            else:
+                self.wins[seating[winner]] += 1
+
+    def getStandings(self):
+        """
+        Gets the win rate of each strategy, best first
+
+        Returns a list of (name, games, wins, rate, low, high) tuples where
+        low and high bound the 95% confidence interval
+        """
+        standings = []
+        for name in self.names:
+            games = self.games[name]
+            wins = self.wins[name]
+            (low, high) = getWilsonInterval(wins, games)
+            rate = wins / games if games else 0.0
+            standings.append((name, games, wins, rate, low, high))
+        standings.sort(key=lambda standing: standing[3], reverse=True)
+        return standings
+
+    def printStandings(self):
+        """Prints the win rate of each strategy"""
+        for name, games, wins, rate, low, high in self.getStandings():
+            print(
+                f"{name:>12}: {wins}/{games} won "
+                f"({rate:.3f}, 95% CI {low:.3f}-{high:.3f})"
+            )
+        print(f"{'draws':>12}: {self.draws}")
+
+    def run(self, results=None, workers=None, reportInterval=10.0):
+        """
+        Plays the tournament
+
+        Parameters:
+            results (ClueLess.ResultsFile):
+                The file to append results to, if any
+            workers (integer):
+                The number of processes, or None for one per core
+            reportInterval (float):
+                The number of seconds between printed standings
+        """
+        if results is not None:
+            results.create(
+                {
+                    "names": self.names,
+                    "playersPerGame": self.playersPerGame,
+                    "gamesPerMatch": self.gamesPerMatch,
+                    "seed": self.seed,
+                    "maxTurns": self.maxTurns,
+                    "matches": self.matches,
+                }
+            )
+
+        chunks = self.getChunks()
+        started = time.monotonic()
+        lastReport = started
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(workers) as executor:
+            # Only keep a few chunks per process queued so millions of games
+            # don't all become futures up front
+            limit = 2 * workers
+            pending = set()
+            while True:
+                for matchIndex, firstGame, count in itertools.islice(
+                    chunks, limit - len(pending)
+                ):
+                    pending.add(
+                        executor.submit(
+                            playChunk,
+                            self.matches[matchIndex],
+                            matchIndex,
+                            firstGame,
+                            count,
+                            self.seed,
+                            self.maxTurns,
+                        )
+                    )
+                if not pending:
+                    break
+
+                (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    columns = future.result()
+                    self.addResults(columns)
+                    if results is not None:
+                        results.append(columns)
+
+                if time.monotonic() - lastReport >= reportInterval:
+                    lastReport = time.monotonic()
+                    print(f"{self.played} games in {lastReport - started:.0f}s")
+                    self.printStandings()
+
+        self.printStandings()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plays a Clue-Less bot tournament")
+    parser.add_argument("strategies", nargs="*", default=list(STRATEGIES))
+    parser.add_argument("--players", type=int, default=3)
+    parser.add_argument("--games", type=int, default=100, help="games per match")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk", type=int, default=50)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default=None, help="results directory")
+    arguments = parser.parse_args()
+
+    tournament = Tournament(
+        arguments.strategies,
+        arguments.players,
+        arguments.games,
+        arguments.seed,
+        arguments.chunk,
+        arguments.max_turns,
+    )
+    tournament.run(
+        ResultsFile(arguments.output) if arguments.output else None,
+        arguments.workers,
+    )
@@ -0,0 +1,167 @@
+"""Variants for the Clue-Less Application"""
+
+import json
+import os
+
+# Directory of the bundled variant definitions
+VARIANT_DIRECTORY = os.path.join(os.path.dirname(__file__), "Variants")
+
+# Environment variable naming the variant to play (a bundled name or a path)
+VARIANT_VARIABLE = "CLUELESS_VARIANT"
+DEFAULT_VARIANT = "Classic"
+
+# The most characters (and so players) a variant can have
+MAX_CHARACTERS = 12
+
+# Secret passages reuse the diagonal move names the journal can record
+SHORTCUT_MOVES = ("NW", "NE", "SE", "SW")
+
+
+class Variant:
+    """
+    A Clue-Less Board and Deck Variant
+
+    The Variant class compiles a board and deck definition into the lookup
+    tables the rest of the game reads through ClueLess.Constants and
+    ClueLess.Cards. A definition is a dictionary (usually loaded from a JSON
+    file in the Variants directory) with these keys:
+
+        name: the name of the variant
+        board: a square grid of location names, with null for empty spaces
+        rooms: the room locations in card order (the rest are hallways)
+        characters: a list of {"name", "start": [row, column], "color":
+            [red, green, blue]} in card and seating order
+        weapons: the weapon cards in card order
+        shortcuts: secret passages in the form {move: [from room, to room]}
+
+    Attributes:
+        name (string):
+            The name of the variant
+        locationNames (list):
+            The grid of location names, with None for empty spaces
+        boardSize (integer):
+            The number of rows (and columns) of the board
+        roomNames (list):
+            The grid of room names, with None for hallways and empty spaces
+        roomLocations (dict):
+            The location index of each room
+        startingLocations (dict):
+            The (row, column) each character starts at
+        characterColors (dict):
+            The color of each character
+        characters (tuple):
+            The character cards
+        weapons (tuple):
+            The weapon cards
+        rooms (tuple):
+            The room cards
+        shortcuts (dict):
+            Secret passages in the form {move: (from room, to room)}
+    """
+
+    __slots__ = [
+        "name",
+        "locationNames",
+        "boardSize",
+        "roomNames",
+        "roomLocations",
+        "startingLocations",
+        "characterColors",
+        "characters",
+        "weapons",
+        "rooms",
+        "shortcuts",
+    ]
+
+    def __init__(self, definition):
+        """
+        Compiles a variant definition
+
+        Parameters:
+            definition (dict):
+                The definition of the variant
+
+        Raises ValueError if the definition isn't a playable variant
+        """
+        self.name = definition["name"]
+
+        board = definition["board"]
+        self.boardSize = len(board)
+        if self.boardSize == 0 or any(len(row) != self.boardSize for row in board):
+            raise ValueError(f"{self.name}: the board must be a non-empty square")
+        self.locationNames = [list(row) for row in board]
+
+        locations = {}
+        for row, names in enumerate(board):
+            for column, name in enumerate(names):
+                if name is None:
+                    continue
+                if name in locations:
+                    raise ValueError(f"{self.name}: {name} is on the board twice")
+                locations[name] = (row, column)
+
+        self.rooms = tuple(definition["rooms"])
+        self.roomNames = [[None] * self.boardSize for _ in range(self.boardSize)]
+        self.roomLocations = {}
+        for room in self.rooms:
+            if room not in locations:
+                raise ValueError(f"{self.name}: room {room} is not on the board")
+            (row, column) = locations[room]
+            self.roomNames[row][column] = room
+            self.roomLocations[room] = row * self.boardSize + column
+
+        characters = definition["characters"]
+        if not 0 < len(characters) <= MAX_CHARACTERS:
+            raise ValueError(
+                f"{self.name}: there must be 1 to {MAX_CHARACTERS} characters"
+            )
+        self.characters = tuple(character["name"] for character in characters)
+        self.startingLocations = {}
+        self.characterColors = {}
+        for character in characters:
+            (row, column) = character["start"]
+            if not (
+                0 <= row < self.boardSize
+                and 0 <= column < self.boardSize
+                and board[row][column] is not None
+            ):
+                raise ValueError(
+                    f"{self.name}: {character['name']} starts off the board"
+                )
+            self.startingLocations[character["name"]] = (row, column)
+            self.characterColors[character["name"]] = tuple(character["color"])
+
+        self.weapons = tuple(definition["weapons"])
+        if not (self.rooms and self.weapons):
+            raise ValueError(f"{self.name}: there must be rooms and weapons")
+
+        cards = self.characters + self.weapons + self.rooms
+        if len(set(cards)) != len(cards):
+            raise ValueError(f"{self.name}: card names must be unique")
+
+        self.shortcuts = {}
+        for move, (fromRoom, toRoom) in definition.get("shortcuts", {}).items():
+            if move not in SHORTCUT_MOVES:
+                raise ValueError(f"{self.name}: {move} is not a shortcut move")
+            if fromRoom not in self.roomLocations or toRoom not in self.roomLocations:
+                raise ValueError(f"{self.name}: {move} must join two rooms")
+            self.shortcuts[move] = (fromRoom, toRoom)
+
+
+def loadVariant(name):
+    """
+    Loads a variant
+
+    Parameters:
+        name (string):
+            The name of a bundled variant, or the path of a variant JSON file
+    """
+    path = name
+    if not os.path.isfile(path):
+        path = os.path.join(VARIANT_DIRECTORY, name + ".json")
+    with open(path) as file:
+        return Variant(json.load(file))
+
+
+# The variant being played, chosen once when the game is started
+VARIANT = loadVariant(os.environ.get(VARIANT_VARIABLE, DEFAULT_VARIANT))
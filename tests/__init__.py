@@ -0,0 +1 @@
+"""Tests for the Clue-Less Application"""
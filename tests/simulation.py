@@ -0,0 +1,75 @@
+"""Simulated games for the Clue-Less tests"""
+
+import contextlib
+
+from ClueLess.Bots import DeductionStrategy, RandomStrategy
+from ClueLess.Deduction import KnowledgeBase
+from ClueLess.Game import Game
+
+PLAYER_IDS = (50001, 50002, 50003)
+
+
+def startGame(seed=1, playerIds=PLAYER_IDS, dealer="shuffle"):
+    """Gets a started game"""
+    with contextlib.redirect_stdout(None):
+        game = Game(seed, dealer)
+        game.updatePlayers(list(playerIds))
+        game.start()
+    return game
+
+
+def playTurns(game, seed=1, maxTurns=300):
+    """
+    Plays a started game with bots, yielding each turn once it is made
+
+    Seats alternate between random and deduction strategies, so games have
+    both aimless and informed suggestions and end with accusations.
+
+    Parameters:
+        game (ClueLess.Game):
+            The game to play
+        seed (integer):
+            The seed of the strategies
+        maxTurns (integer):
+            The number of turns to stop after if nobody has won
+    """
+    seated = [
+        player for player in game.getPlayers() if player.getPlayerId() is not None
+    ]
+    strategies = {
+        player.getPlayerId(): (DeductionStrategy if index % 2 else RandomStrategy)(
+            seed * len(seated) + index
+        )
+        for index, player in enumerate(seated)
+    }
+    knowledge = {
+        playerId: KnowledgeBase.fromGame(game, playerId) for playerId in strategies
+    }
+
+    while not game.finished and game.turnNumber < maxTurns:
+        playerId = game.getCurrentPlayer().getPlayerId()
+        turn = strategies[playerId].chooseTurn(game, knowledge[playerId])
+        turn.playerId = playerId
+        with contextlib.redirect_stdout(None):
+            game.makeMove(turn)
+        for playerKnowledge in knowledge.values():
+            playerKnowledge.update(game)
+        yield turn
+
+
+def getState(game):
+    """Gets the state of a game to compare, for ClueLess.Game or FrozenGame"""
+    return (
+        game.turnNumber,
+        game.getHash(),
+        game.currentTurnIndex,
+        [
+            (player.name, player.locationIndex, player.cardIndices, player.lost)
+            for player in game.players
+        ],
+        game.lastSuggestion,
+        game.feedback,
+        game.log,
+        game.winner,
+        game.finished,
+    )
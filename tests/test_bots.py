@@ -0,0 +1,109 @@
+"""Tests for the Clue-Less Bots"""
+
+import contextlib
+import pickle
+import threading
+import unittest
+from unittest import mock
+
+from ClueLess.Bots import (
+    Bot,
+    BotClient,
+    DeductionStrategy,
+    GreedyStrategy,
+    RandomStrategy,
+)
+from ClueLess.Deduction import Contradiction, KnowledgeBase
+from ClueLess.Game import Game, Turn
+from ClueLess.MCTS import MCTSStrategy
+
+
+def startGame(seed=1, playerIds=(50001, 50002, 50003)):
+    """Gets a started game"""
+    with contextlib.redirect_stdout(None):
+        game = Game(seed)
+        game.updatePlayers(list(playerIds))
+        game.start()
+    return game
+
+
+class RecordingBotClient(BotClient):
+    """A Bot Client that records the turns it sends instead of sending them"""
+
+    def __init__(self):
+        super().__init__(timeBudget=0.5)
+        self.running = True
+        self.sent = []
+        self.sentEvent = threading.Event()
+
+    def sendToServer(self, obj):
+        self.sent.append(obj)
+        self.sentEvent.set()
+
+
+class BotClientTest(unittest.TestCase):
+    def test_submits_turn_for_pickled_game(self):
+        game = startGame()
+        # The server tells each client its port, which is its player ID
+        game.clientPort = game.getCurrentPlayer().getPlayerId()
+
+        client = RecordingBotClient()
+        try:
+            with contextlib.redirect_stdout(None):
+                client.handleMessage(pickle.loads(pickle.dumps(game)))
+                self.assertTrue(client.sentEvent.wait(5))
+        finally:
+            client.bot.stop()
+
+        self.assertIsInstance(client.sent[0], Turn)
+
+
+class BotTest(unittest.TestCase):
+    def setUp(self):
+        self.game = startGame()
+        self.bot = Bot(timeBudget=0.5, playerId=self.game.getCurrentPlayer().playerId)
+
+    def tearDown(self):
+        self.bot.stop()
+
+    def test_rebuilds_knowledge_after_contradiction(self):
+        self.bot.observe(self.game)
+        knowledge = self.bot.knowledge
+        self.assertIsNotNone(knowledge)
+
+        with contextlib.redirect_stdout(None):
+            with mock.patch.object(
+                KnowledgeBase, "update", side_effect=Contradiction
+            ):
+                self.bot.observe(self.game)
+
+        self.assertIsNotNone(self.bot.knowledge)
+        self.assertIsNot(self.bot.knowledge, knowledge)
+        self.assertIsInstance(self.bot.chooseTurn(self.game), Turn)
+
+
+class StrategyTest(unittest.TestCase):
+    def test_lost_player_passes(self):
+        game = startGame()
+        player = game.getCurrentPlayer()
+        knowledge = KnowledgeBase.fromGame(game, player.getPlayerId())
+        game.losePlayer(player)
+
+        for strategy in (
+            RandomStrategy(1),
+            GreedyStrategy(1),
+            DeductionStrategy(1),
+            MCTSStrategy(1, iterations=20),
+        ):
+            turn = strategy.chooseTurn(game, knowledge)
+            for action in ("move", "suggestion", "accusation"):
+                self.assertFalse(hasattr(turn, action), (strategy, action))
+
+        turn.playerId = player.getPlayerId()
+        with contextlib.redirect_stdout(None):
+            self.assertTrue(game.makeMove(turn))
+        self.assertIsNot(game.getCurrentPlayer(), player)
+
+
+if __name__ == "__main__":
+    unittest.main()
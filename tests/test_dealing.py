@@ -0,0 +1,170 @@
+"""Tests for the Clue-Less Dealing Policies"""
+
+import contextlib
+import random
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from ClueLess.Cards import Cards
+from ClueLess.Dealing import BalancedDealer, Dealer, FixedDealer
+from ClueLess.Deduction import SOLUTION, getHandSizes
+from ClueLess.Game import Game
+from tests.simulation import startGame
+
+PLAYER_IDS = [50001, 50002, 50003]
+CATEGORIES = (Cards.CHARACTERS, Cards.WEAPONS, Cards.ROOMS)
+
+
+def getFixedDeal(game):
+    """Gets a fixed dealer that deals the same cards as a started game"""
+    return FixedDealer(
+        game.getSolution(),
+        {
+            index: player.getCards()
+            for index, player in enumerate(game.getPlayers())
+            if player.getPlayerId() is not None
+        },
+    )
+
+
+class DealerTest(unittest.TestCase):
+    SEATINGS = ([0, 1, 2], [0, 2, 5], [1, 3, 4, 5], list(range(6)), [3])
+
+    def checkDeal(self, solution, hands, seats):
+        self.assertEqual(
+            [card in category for card, category in zip(solution, CATEGORIES)],
+            [True, True, True],
+        )
+        self.assertEqual(
+            {seat: len(hand) for seat, hand in hands.items()}, getHandSizes(seats)
+        )
+        dealt = [card for hand in hands.values() for card in hand]
+        self.assertEqual(
+            sorted(dealt), sorted(card for card in Cards.ALL if card not in solution)
+        )
+
+    def test_hands_are_the_sizes_they_would_be_dealt(self):
+        rng = random.Random(1)
+        for dealer in (Dealer(), BalancedDealer()):
+            for seats in self.SEATINGS:
+                for _ in range(20):
+                    solution = dealer.pickSolution(rng)
+                    self.checkDeal(solution, dealer.deal(rng, solution, seats), seats)
+
+    def test_balanced_hands_spread_each_category(self):
+        rng = random.Random(1)
+        dealer = BalancedDealer()
+        for seats in self.SEATINGS:
+            for _ in range(20):
+                solution = dealer.pickSolution(rng)
+                hands = dealer.deal(rng, solution, seats)
+                for category in CATEGORIES:
+                    held = [
+                        sum(card in category for card in hand)
+                        for hand in hands.values()
+                    ]
+                    self.assertLessEqual(max(held) - min(held), 1)
+
+    def test_fixed_dealer_checks_the_deal(self):
+        game = startGame()
+        solution = game.getSolution()
+        hands = getFixedDeal(game).hands
+
+        missing = {seat: list(hand) for seat, hand in hands.items()}
+        missing[0].pop()
+        with self.assertRaises(ValueError):
+            FixedDealer(solution, missing)
+
+        uneven = {seat: list(hand) for seat, hand in hands.items()}
+        uneven[1].append(uneven[0].pop())
+        with self.assertRaises(ValueError):
+            FixedDealer(solution, uneven)
+
+        dealer = FixedDealer(solution, hands)
+        with self.assertRaises(ValueError):
+            dealer.deal(None, solution, [0, 1, 3])
+        self.assertEqual(dealer.deal(None, solution, [2, 1, 0]), hands)
+
+
+class GameDealerTest(unittest.TestCase):
+    def startGame(self, dealer=None):
+        with contextlib.redirect_stdout(None):
+            game = Game(1)
+            game.updatePlayers(PLAYER_IDS)
+            game.start(dealer)
+        return game
+
+    def test_unnamed_dealer_cannot_be_replayed(self):
+        game = self.startGame()
+        fixed = self.startGame(getFixedDeal(game))
+
+        self.assertEqual(fixed.getSolution(), game.getSolution())
+        self.assertIsNone(fixed.dealer)
+        with self.assertRaises(ValueError):
+            fixed.getHeader()
+
+    def test_dealer_object_of_named_policy_is_recorded(self):
+        game = Game(1, "balanced")
+        with contextlib.redirect_stdout(None):
+            game.updatePlayers(PLAYER_IDS)
+            game.start(Dealer())
+
+        self.assertEqual(game.dealer, "shuffle")
+        self.assertEqual(game.getHeader()["dealer"], "shuffle")
+
+
+class DealBatchTest(unittest.TestCase):
+    SEATS = [0, 2, 5]
+
+    def checkDeals(self, solutions, owners):
+        handSizes = getHandSizes(self.SEATS)
+        for solution, row in zip(solutions, owners):
+            self.assertEqual(list(np.flatnonzero(row == SOLUTION)), sorted(solution))
+            self.assertEqual(
+                Counter(row[row != SOLUTION].tolist()), Counter(handSizes)
+            )
+
+    def test_batch_deals_valid_hands(self):
+        for dealer in (Dealer(), BalancedDealer()):
+            (solutions, owners) = dealer.dealBatch(
+                np.random.default_rng(1), self.SEATS, 200
+            )
+            self.assertEqual(solutions.shape, (200, 3))
+            self.assertEqual(owners.shape, (200, len(Cards.ALL)))
+            self.checkDeals(solutions, owners)
+
+    def test_balanced_batch_spreads_each_category(self):
+        (_, owners) = BalancedDealer().dealBatch(
+            np.random.default_rng(1), self.SEATS, 200
+        )
+        for category in (Cards.CHARACTERS, Cards.WEAPONS, Cards.ROOMS):
+            indices = [Cards.INDEX[card] for card in category]
+            for row in owners[:, indices]:
+                counts = Counter(row.tolist())
+                held = [counts[seat] for seat in self.SEATS]
+                self.assertLessEqual(max(held) - min(held), 1)
+
+    def test_fixed_batch_repeats_the_deal(self):
+        with contextlib.redirect_stdout(None):
+            game = Game(1)
+            game.updatePlayers([50001, 50002, 50003])
+            game.start()
+        dealer = getFixedDeal(game)
+
+        (solutions, owners) = dealer.dealBatch(None, [0, 1, 2], 3)
+
+        for solution, row in zip(solutions, owners):
+            self.assertEqual(
+                [Cards.ALL[index] for index in solution], list(game.getSolution())
+            )
+            for seat, player in enumerate(game.getPlayers()[:3]):
+                self.assertEqual(
+                    sorted(Cards.ALL[index] for index in np.flatnonzero(row == seat)),
+                    sorted(player.getCards()),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for the Clue-Less Knowledge Base"""
+
+import unittest
+
+from ClueLess.Deduction import (
+    OWNER_COUNT,
+    SOLUTION,
+    Contradiction,
+    KnowledgeBase,
+    toBits,
+)
+from tests.simulation import playTurns, startGame
+
+
+def getHoldings(game):
+    """Gets the cards each owner really holds, as card sets"""
+    holdings = [0] * OWNER_COUNT
+    for index, player in enumerate(game.getPlayers()):
+        holdings[index] = toBits(player.getCards())
+    holdings[SOLUTION] = toBits(game.getSolution())
+    return holdings
+
+
+class KnowledgeBaseTest(unittest.TestCase):
+    def checkSound(self, knowledge, game, holdings):
+        for owner in range(OWNER_COUNT):
+            # Every card an owner holds is still possible for it, and
+            # nothing is known that isn't true
+            held = holdings[owner]
+            self.assertEqual(knowledge.possible[owner] & held, held)
+            self.assertEqual(knowledge.known[owner] & ~held, 0)
+        self.assertIn(game.getSolution(), knowledge.getCandidates())
+        self.assertIn(knowledge.getSolution(), (None, game.getSolution()))
+
+    def test_knowledge_stays_sound_over_simulated_games(self):
+        solved = 0
+        for playerCount in (3, 4, 6):
+            playerIds = [50001 + seat for seat in range(playerCount)]
+            for seed in range(1, 11):
+                game = startGame(seed, playerIds)
+                holdings = getHoldings(game)
+                knowledge = [
+                    KnowledgeBase.fromGame(game, playerId) for playerId in playerIds
+                ]
+                for playerKnowledge in knowledge:
+                    self.checkSound(playerKnowledge, game, holdings)
+
+                for _ in playTurns(game, seed):
+                    for playerKnowledge in knowledge:
+                        playerKnowledge.update(game)
+                        self.checkSound(playerKnowledge, game, holdings)
+
+                solved += sum(
+                    playerKnowledge.getSolution() is not None
+                    for playerKnowledge in knowledge
+                )
+
+        # The games are long enough for deduction to get somewhere
+        self.assertGreater(solved, 0)
+
+    def test_impossible_fact_raises_contradiction(self):
+        game = startGame()
+        knowledge = KnowledgeBase.fromGame(game, game.getPlayers()[0].getPlayerId())
+        card = game.getPlayers()[0].getCards()[0]
+
+        self.assertEqual(knowledge.getOwner(card), 0)
+        with self.assertRaises(Contradiction):
+            knowledge.addHolds(1, [card])
+
+
+if __name__ == "__main__":
+    unittest.main()
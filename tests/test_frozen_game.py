@@ -0,0 +1,91 @@
+"""Tests for the Clue-Less Frozen Game"""
+
+import contextlib
+import unittest
+
+from ClueLess.FrozenGame import FrozenGame, TurnHistory
+from ClueLess.Game import Game, Turn
+from tests.simulation import getState, playTurns, startGame
+
+
+class FrozenGameTest(unittest.TestCase):
+    def test_round_trip_keeps_dealer(self):
+        game = startGame(dealer="balanced")
+
+        thawed = FrozenGame.fromGame(game).toGame()
+        header = thawed.getHeader()
+        with contextlib.redirect_stdout(None):
+            replayed = Game.replay(header, [])
+
+        self.assertEqual(header["dealer"], "balanced")
+        self.assertEqual(replayed.getSolution(), game.getSolution())
+        self.assertEqual(
+            [player.getCards() for player in replayed.getPlayers()],
+            [player.getCards() for player in game.getPlayers()],
+        )
+
+    def test_apply_matches_make_move(self):
+        for playerCount in (3, 6):
+            playerIds = [50001 + seat for seat in range(playerCount)]
+            for seed in range(1, 11):
+                game = startGame(seed, playerIds)
+                state = FrozenGame.fromGame(game)
+                for turn in playTurns(game, seed):
+                    state = state.apply(turn)
+                    self.assertEqual(getState(state), getState(game))
+                    self.assertEqual(getState(state.toGame()), getState(game))
+                self.assertTrue(state.finished)
+
+    def test_apply_ignores_turn_from_wrong_player(self):
+        game = startGame()
+        state = FrozenGame.fromGame(game)
+        waiting = game.getPlayers()[game.nextSeats[game.currentTurnIndex]]
+
+        self.assertIs(state.apply(Turn(playerId=waiting.getPlayerId())), state)
+        self.assertIs(state.apply(Turn(move="UP")), state)
+
+
+class TurnHistoryTest(unittest.TestCase):
+    def test_undo_and_redo(self):
+        game = startGame()
+        history = TurnHistory(FrozenGame.fromGame(game))
+        states = [history.getState()]
+        turns = []
+        for turn in playTurns(game, maxTurns=8):
+            self.assertTrue(history.apply(turn))
+            states.append(history.getState())
+            turns.append(turn)
+        self.assertFalse(history.canRedo())
+
+        for state in reversed(states[:-1]):
+            self.assertTrue(history.undo())
+            self.assertIs(history.getState(), state)
+        self.assertFalse(history.canUndo())
+        self.assertFalse(history.undo())
+
+        for state in states[1:]:
+            self.assertTrue(history.redo())
+            self.assertIs(history.getState(), state)
+        self.assertFalse(history.redo())
+
+        # Making a turn after undoing drops the undone turns
+        history.undo()
+        history.undo()
+        self.assertTrue(history.apply(turns[-2]))
+        self.assertFalse(history.canRedo())
+        self.assertEqual(getState(history.getState()), getState(states[-2]))
+
+    def test_undo_is_limited(self):
+        game = startGame()
+        history = TurnHistory(FrozenGame.fromGame(game), maxUndo=3)
+        for turn in playTurns(game, maxTurns=6):
+            history.apply(turn)
+
+        undone = 0
+        while history.undo():
+            undone += 1
+        self.assertEqual(undone, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Tests for the Clue-Less Journal"""
+
+import contextlib
+import unittest
+
+from ClueLess.Journal import Journal
+from tests.simulation import getState, playTurns, startGame
+
+
+class JournalTest(unittest.TestCase):
+    def test_rebuild_matches_live_game(self):
+        for seed in range(1, 6):
+            game = startGame(seed)
+            snapshotted = Journal(game.getHeader(), snapshotInterval=7)
+            snapshotted.snapshot(game)
+            replayed = Journal(game.getHeader(), snapshotInterval=10**6)
+
+            states = {game.turnNumber: getState(game)}
+            for turn in playTurns(game, seed):
+                snapshotted.record(turn, game)
+                replayed.record(turn, game)
+                states[game.turnNumber] = getState(game)
+            self.assertTrue(game.finished)
+
+            with contextlib.redirect_stdout(None):
+                for turnNumber, state in states.items():
+                    self.assertEqual(
+                        getState(snapshotted.rebuild(turnNumber)), state
+                    )
+                    self.assertEqual(getState(replayed.rebuild(turnNumber)), state)
+
+    def test_records_decode_to_the_turns_made(self):
+        game = startGame()
+        journal = Journal(game.getHeader())
+        turns = []
+        for turn in playTurns(game):
+            journal.record(turn, game)
+            turns.append(turn)
+
+        self.assertEqual(len(journal), len(turns))
+        for record, turn in zip(journal.getRecords(), turns):
+            for action in ("move", "suggestion", "accusation"):
+                self.assertEqual(
+                    getattr(record.turn, action, None),
+                    getattr(turn, action, None),
+                )
+            self.assertEqual(int(record.turn.playerId), turn.playerId)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Tests for the Clue-Less MCTS Strategy"""
+
+import contextlib
+import time
+import unittest
+from unittest import mock
+
+from ClueLess.Deduction import KnowledgeBase
+from ClueLess.Game import Game, Turn
+from ClueLess.MCTS import MCTSStrategy, Search
+
+
+def startGame(seed=1, playerIds=(50001, 50002, 50003)):
+    """Gets a started game and the knowledge of its current player"""
+    with contextlib.redirect_stdout(None):
+        game = Game(seed)
+        game.updatePlayers(list(playerIds))
+        game.start()
+    knowledge = KnowledgeBase.fromGame(game, game.getCurrentPlayer().playerId)
+    return (game, knowledge)
+
+
+class MCTSStrategyTest(unittest.TestCase):
+    def test_passed_deadline_is_not_moved_later(self):
+        (game, knowledge) = startGame()
+        deadline = time.monotonic() - 1.0
+        deadlines = []
+        run = Search.run
+
+        def recordDeadline(search, searchDeadline=None, iterations=None):
+            deadlines.append(searchDeadline)
+            return run(search, searchDeadline, iterations)
+
+        with mock.patch.object(Search, "run", recordDeadline):
+            turn = MCTSStrategy(1).chooseTurn(game, knowledge, deadline)
+
+        self.assertIsInstance(turn, Turn)
+        self.assertLessEqual(deadlines[0], deadline)
+
+    def test_close_shuts_down_worker_processes(self):
+        (game, knowledge) = startGame()
+        strategy = MCTSStrategy(1, iterations=10, workers=2)
+        strategy.chooseTurn(game, knowledge)
+        executor = strategy.executor
+        self.assertIsNotNone(executor)
+
+        strategy.close()
+
+        self.assertIsNone(strategy.executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(int)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Tests for the Clue-Less Model"""
+
+import contextlib
+import unittest
+from unittest import mock
+
+from ClueLess.Deduction import Contradiction, KnowledgeBase
+from ClueLess.MVC.Model import Model
+
+
+class ModelTest(unittest.TestCase):
+    def setUp(self):
+        self.model = Model()
+        with contextlib.redirect_stdout(None):
+            self.model.newGame(1)
+            self.model.getGame().updatePlayers([50001, 50002, 50003])
+            self.model.getGame().start()
+        self.model.playerId = 50001
+        self.model.updateKnowledge()
+
+    def test_rebuilds_knowledge_after_contradiction(self):
+        knowledge = self.model.getKnowledge()
+        self.assertIsNotNone(knowledge)
+
+        with contextlib.redirect_stdout(None):
+            with mock.patch.object(
+                KnowledgeBase, "update", side_effect=Contradiction
+            ):
+                self.model.updateKnowledge()
+
+        self.assertIsNotNone(self.model.getKnowledge())
+        self.assertIsNot(self.model.getKnowledge(), knowledge)
+
+    def test_drops_knowledge_after_contradiction_when_unseated(self):
+        self.model.playerId = 60001
+        with contextlib.redirect_stdout(None):
+            with mock.patch.object(
+                KnowledgeBase, "update", side_effect=Contradiction
+            ):
+                self.model.updateKnowledge()
+
+        self.assertIsNone(self.model.getKnowledge())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+"""Tests for rendering the Clue-Less View"""
+
+import contextlib
+import io
+import os
+import unittest
+
+from ClueLess.MVC.RenderBenchmark import getStates, initHeadless, runBenchmark
+
+# Golden images, saved with:
+# python -m ClueLess.MVC.RenderBenchmark --repeat 1 --golden tests/golden --update
+GOLDEN_DIRECTORY = os.path.join(os.path.dirname(__file__), "golden")
+
+
+class RenderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Draws on the SDL dummy driver so no display is needed
+        initHeadless()
+
+    def test_states_match_golden_images(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            matched = runBenchmark(list(getStates()), 1, GOLDEN_DIRECTORY)
+
+        self.assertTrue(matched, output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
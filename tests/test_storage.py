@@ -0,0 +1,92 @@
+"""Tests for the Clue-Less Game Store"""
+
+import contextlib
+import os
+import tempfile
+import unittest
+
+from ClueLess.Journal import Journal
+from ClueLess.MVC.Model import Model
+from ClueLess.Storage import CORRUPT_EXTENSION, ENTRY, RECORD_ENTRY, GameStore
+from tests.simulation import getState, playTurns, startGame
+
+PLAYER_IDS = [50001, 50002, 50003]
+
+
+def hostGame(store, seed=1):
+    """Gets the model of a hosted game saved to a store"""
+    model = Model(store)
+    model.isServer = True
+    with contextlib.redirect_stdout(None):
+        model.newGame(seed)
+        model.getGame().updatePlayers(PLAYER_IDS)
+        model.startGame()
+    return model
+
+
+class GameStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temporaryDirectory.name, "saves")
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def test_directory_is_created_on_first_write(self):
+        store = GameStore(self.directory)
+        self.assertFalse(os.path.exists(self.directory))
+        self.assertEqual(store.getGameIds(), [])
+
+        hostGame(store)
+
+        self.assertEqual(len(store.getGameIds()), 1)
+
+    def test_corrupt_game_is_set_aside_when_resuming(self):
+        store = GameStore(self.directory)
+        gameId = hostGame(store).journal.gameId
+        with open(store.getSnapshotPath(gameId), "r+b") as file:
+            file.seek(8)
+            file.write(b"not a pickle")
+
+        model = Model(store)
+        with contextlib.redirect_stdout(None):
+            self.assertFalse(model.resumeGame())
+
+        self.assertEqual(store.getGameIds(), [])
+        self.assertTrue(
+            os.path.exists(store.getLogPath(gameId) + CORRUPT_EXTENSION)
+        )
+
+    def test_load_truncates_torn_tail(self):
+        store = GameStore(self.directory)
+        game = startGame()
+        journal = Journal(game.getHeader())
+        store.create("torn", journal)
+        turns = playTurns(game)
+        for _ in range(5):
+            journal.record(next(turns), game)
+            store.flush()
+        state = getState(game)
+
+        # A crash while appending leaves part of an entry at the end
+        path = store.getLogPath("torn")
+        validSize = os.path.getsize(path)
+        with open(path, "ab") as file:
+            file.write(ENTRY.pack(RECORD_ENTRY, 100, 0) + b"torn")
+
+        loaded = store.load("torn")
+
+        self.assertEqual(os.path.getsize(path), validSize)
+        self.assertEqual(len(loaded), 5)
+        with contextlib.redirect_stdout(None):
+            rebuilt = loaded.rebuild()
+        self.assertEqual(getState(rebuilt), state)
+
+        # New records follow the last good one
+        loaded.record(next(turns), game)
+        store.flush()
+        self.assertEqual(len(store.load("torn")), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Tests for the Clue-Less Tournament"""
+
+import unittest
+from array import array
+
+from ClueLess.Tournament import COLUMNS, NO_WINNER, Tournament
+
+
+def getColumns(rows):
+    """Gets result columns holding rows of (match, game, seed, winner, turns)"""
+    columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+    for row in rows:
+        for name, value in zip(COLUMNS, row):
+            columns[name].append(value)
+    return columns
+
+
+class TournamentTest(unittest.TestCase):
+    def test_counts_games_when_strategies_share_a_game(self):
+        tournament = Tournament(["random", "greedy"], playersPerGame=3)
+        # Seatings like (random, random, greedy) put a strategy in two seats
+        self.assertEqual(len(tournament.matches), 8)
+
+        tournament.addResults(
+            getColumns(
+                (matchIndex, 0, 0, NO_WINNER, 10)
+                for matchIndex in range(len(tournament.matches))
+            )
+        )
+
+        self.assertEqual(tournament.played, 8)
+        self.assertEqual(tournament.draws, 8)
+
+    def test_columns_hold_large_match_indices_and_turn_counts(self):
+        columns = getColumns([(70000, 0, 0, NO_WINNER, 100000)])
+
+        self.assertEqual(columns["match"][0], 70000)
+        self.assertEqual(columns["turns"][0], 100000)
+
+
+if __name__ == "__main__":
+    unittest.main()